@@ -806,7 +806,8 @@ def capture_disc_data(
     tmdb_id: int = None,
     confidence: int = None,
     resolution_source: str = None,
-    cinfo_raw: dict = None
+    cinfo_raw: dict = None,
+    cinfo_fingerprint: str = None
 ):
     """
     Capture disc data for analysis and future identification database.
@@ -834,7 +835,8 @@ def capture_disc_data(
         "confidence": confidence,
         "resolution_source": resolution_source,
         # Raw CINFO for future analysis
-        "cinfo_raw": cinfo_raw or {}
+        "cinfo_raw": cinfo_raw or {},
+        "cinfo_fingerprint": cinfo_fingerprint or ""
     }
 
     try:
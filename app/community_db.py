@@ -6,6 +6,7 @@ If you use it, you contribute. No freeloading.
 """
 
 import json
+import threading
 import requests
 from datetime import datetime
 from pathlib import Path
@@ -160,6 +161,16 @@ def contribute_disc(
     return False
 
 
+def contribute_disc_async(**kwargs) -> threading.Thread:
+    """
+    Run contribute_disc on a background thread.
+    The POST can take up to its 15s timeout, and nothing waits on the result.
+    """
+    thread = threading.Thread(target=contribute_disc, kwargs=kwargs, daemon=True)
+    thread.start()
+    return thread
+
+
 def refresh_cache(config: dict) -> bool:
     """
     Refresh the local cache of the community database.
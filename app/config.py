@@ -34,6 +34,28 @@ def save_config(config: dict):
         yaml.dump(config, f, default_flow_style=False, sort_keys=False)
 
 
+# (settings.yaml mtime_ns, ripping.debug_logging) from the last read
+_debug_logging_cache = None
+
+
+def debug_logging_enabled() -> bool:
+    """Return ripping.debug_logging, re-reading settings only when the file changes.
+
+    Rip loops and the status poller check this on every call, so a full YAML
+    parse each time adds up; a stat is enough to notice Settings page saves.
+    """
+    global _debug_logging_cache
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    if _debug_logging_cache is None or _debug_logging_cache[0] != mtime:
+        cfg = load_config() or {}
+        enabled = bool(cfg.get('ripping', {}).get('debug_logging', False))
+        _debug_logging_cache = (mtime, enabled)
+    return _debug_logging_cache[1]
+
+
 def test_connection(service: str, url: str, api_key: str = "", token: str = "") -> dict:
     """Test connection to a service and return status"""
     result = {"connected": False, "error": None, "version": None}
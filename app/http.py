@@ -0,0 +1,47 @@
+"""
+RipForge HTTP Session
+Shared keep-alive session for Radarr/Sonarr API calls and poster downloads
+"""
+
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: faster decoding of large *arr responses
+except ImportError:
+    orjson = None
+
+
+def build_session(pool_connections: int = 10, pool_maxsize: int = 20) -> requests.Session:
+    """Create a pooled HTTP session.
+
+    Keep-alive reuses TCP/TLS connections to the same host across calls, and
+    urllib3's Retry handles transient failures with backoff. Non-2xx responses
+    are returned (not raised) so callers keep their status_code checks.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                          allowed_methods=['GET'], respect_retry_after_header=True,
+                          raise_on_status=False)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def json_body(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it's installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Module-wide session - API keys are passed per request, since Radarr and
+# Sonarr use different keys on the same session
+SESSION = build_session()
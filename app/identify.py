@@ -4,16 +4,24 @@ Identifies ripped content using disc label parsing + runtime matching with Radar
 """
 
 import re
+import io
 import os
+import heapq
+import bisect
+import struct
 import subprocess
 import time
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 
 from . import activity
 from . import community_db
+from . import http
+from . import identify_cache
 
 # Max possible scores for percentage calculation
 # Movie: title(50) + runtime(100) + popularity(20) + recent(10) = 180
@@ -22,6 +30,150 @@ MAX_SCORE_MOVIE = 180
 # TV: runtime(50) + popular(20) + recent(15) + exact_title(20) = 105
 MAX_SCORE_TV = 105
 
+# How long the full Radarr library list is reused for runtime-only matching
+RADARR_LIBRARY_CACHE_TTL = 60  # seconds
+
+# Radarr/Sonarr lookup responses are shared across SmartIdentifier instances
+LOOKUP_CACHE_TTL = 600  # seconds - movie/series title lookups
+EPISODES_CACHE_TTL = 24 * 3600  # seconds - tvdb: lookups for season episode counts
+
+# Concurrent tvdb: lookups in get_sonarr_episodes_bulk
+SONARR_BULK_WORKERS = 8
+
+# (base_url, endpoint, term) -> (monotonic timestamp, parsed JSON, ttl).
+# Expired entries are swept on each write; past LOOKUP_CACHE_MAX the least
+# recently used entry is evicted.
+LOOKUP_CACHE_MAX = 256
+_lookup_cache: 'OrderedDict[Tuple[str, str, str], Tuple[float, Any, int]]' = OrderedDict()
+
+# radarr_url -> (monotonic timestamp, movies, runtime minutes -> library indices).
+# Shared across SmartIdentifier instances, which are created per identification.
+_library_cache: Dict[str, Tuple[float, List[dict], Dict[int, List[int]]]] = {}
+
+
+def clear_lookup_cache():
+    """Drop cached Radarr/Sonarr lookups (e.g. after settings change)"""
+    _lookup_cache.clear()
+    _library_cache.clear()
+
+
+# (video path, size, mtime_ns) -> runtime in seconds; a rewritten file gets a new key.
+# Least recently used entries are evicted past RUNTIME_CACHE_MAX.
+RUNTIME_CACHE_MAX = 256
+_runtime_cache: 'OrderedDict[Tuple[str, int, int], int]' = OrderedDict()
+
+
+def clear_runtime_cache():
+    """Drop cached video runtimes"""
+    _runtime_cache.clear()
+
+
+# Matroska (EBML) element IDs needed to read the container duration
+_EBML_HEADER_ID = 0x1A45DFA3
+_MKV_SEGMENT_ID = 0x18538067
+_MKV_INFO_ID = 0x1549A966
+_MKV_CLUSTER_ID = 0x1F43B675
+_MKV_TIMECODE_SCALE_ID = 0x2AD7B1
+_MKV_DURATION_ID = 0x4489
+
+
+def _read_ebml_vint(f, keep_marker: bool = False) -> Optional[int]:
+    """Read an EBML variable-length integer (element ID if keep_marker, else a size)"""
+    first = f.read(1)
+    if not first:
+        return None
+    length = 1
+    mask = 0x80
+    while length <= 8 and not (first[0] & mask):
+        mask >>= 1
+        length += 1
+    if length > 8:
+        return None
+    rest = f.read(length - 1)
+    if len(rest) != length - 1:
+        return None
+    value = first[0] if keep_marker else first[0] & (mask - 1)
+    for byte in rest:
+        value = (value << 8) | byte
+    return value
+
+
+def read_mkv_duration(path: str) -> Optional[float]:
+    """Read the duration in seconds from an MKV file's Segment Info header.
+
+    Only walks the few top-level elements before the first Cluster, so it costs
+    a handful of small reads instead of an ffprobe process. Returns None if the
+    file isn't Matroska or has no Duration element.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if _read_ebml_vint(f, keep_marker=True) != _EBML_HEADER_ID:
+                return None
+            header_size = _read_ebml_vint(f)
+            if header_size is None:
+                return None
+            f.seek(header_size, os.SEEK_CUR)
+
+            if _read_ebml_vint(f, keep_marker=True) != _MKV_SEGMENT_ID:
+                return None
+            _read_ebml_vint(f)  # Segment size (often "unknown" while muxing)
+
+            # Info sits before the first Cluster; bound the walk in case it's missing
+            for _ in range(32):
+                elem_id = _read_ebml_vint(f, keep_marker=True)
+                size = _read_ebml_vint(f)
+                if elem_id is None or size is None or elem_id == _MKV_CLUSTER_ID:
+                    return None
+                if elem_id != _MKV_INFO_ID:
+                    f.seek(size, os.SEEK_CUR)
+                    continue
+
+                info = io.BytesIO(f.read(size))
+                timecode_scale = 1000000  # Matroska default: 1ms ticks
+                duration = None
+                while True:
+                    child_id = _read_ebml_vint(info, keep_marker=True)
+                    child_size = _read_ebml_vint(info)
+                    if child_id is None or child_size is None:
+                        break
+                    data = info.read(child_size)
+                    if child_id == _MKV_TIMECODE_SCALE_ID:
+                        timecode_scale = int.from_bytes(data, 'big')
+                    elif child_id == _MKV_DURATION_ID and child_size in (4, 8):
+                        duration = struct.unpack('>f' if child_size == 4 else '>d', data)[0]
+                if duration is None:
+                    return None
+                return duration * timecode_scale / 1e9
+    except (OSError, struct.error):
+        return None
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class _Patterns:
+    """Compiled label/title patterns, built once at import (see _PATTERNS)"""
+    studio_prefixes: re.Pattern
+    disc_suffix: re.Pattern
+    region_suffix: re.Pattern
+    strip_suffixes: re.Pattern
+    separators: re.Pattern
+    franchise: re.Pattern
+    franchise_each: Tuple[re.Pattern, ...]
+    tv: Tuple[Tuple[re.Pattern, str], ...]
+    digits: re.Pattern
+    whitespace: re.Pattern
+    trailing_vol: re.Pattern
+    folder_year: re.Pattern
+    folder_trans: Dict[int, Optional[str]]
+
+
+def _split_trailing_num(title: str) -> Tuple[str, Optional[str]]:
+    """Split a trailing sequel number off a title: 'Under Siege 2' -> ('Under Siege', '2')"""
+    parts = title.rsplit(' ', 1)
+    if len(parts) == 2 and parts[1].isdecimal():
+        return parts[0].rstrip(), parts[1]
+    return title, None
+
 
 def score_to_confidence(score: float, max_score: float) -> int:
     """Convert raw score to confidence percentage (0-100)"""
@@ -53,6 +205,14 @@ class IdentificationResult:
         if self.episode_mapping is None:
             self.episode_mapping = {}
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'IdentificationResult':
+        """Rebuild a result from asdict() output that went through JSON"""
+        result = cls(**data)
+        # JSON object keys are strings; episode_mapping is keyed by track index
+        result.episode_mapping = {int(k): v for k, v in result.episode_mapping.items()}
+        return result
+
     @property
     def is_confident(self) -> bool:
         return self.confidence >= 75
@@ -60,12 +220,8 @@ class IdentificationResult:
     @property
     def folder_name(self) -> str:
         """Generate filesystem-safe folder name"""
-        name = f"{self.title} ({self.year})"
-        # Sanitize: colon -> space-dash, remove other invalid characters
-        name = name.replace(':', ' -')
-        name = re.sub(r'[<>"|?*]', '', name)
-        name = re.sub(r'\s+', ' ', name).strip()
-        return name
+        name = f"{self.title} ({self.year})".translate(_PATTERNS.folder_trans)
+        return _PATTERNS.whitespace.sub(' ', name).strip()
 
     @property
     def poster_thumbnail(self) -> str:
@@ -208,38 +364,51 @@ class SmartIdentifier:
         self.sonarr_url = sonarr_cfg.get('url', 'http://localhost:8989')
         self.sonarr_api = sonarr_cfg.get('api_key', '')
 
-    def parse_disc_label(self, label: str, verbose: bool = True) -> str:
-        """Parse disc label into searchable title"""
+        # Shared keep-alive session for all Radarr/Sonarr lookups
+        self._session = http.SESSION
+        self._radarr_headers = {'X-Api-Key': self.radarr_api}
+        self._sonarr_headers = {'X-Api-Key': self.sonarr_api}
+
+    def parse_disc_label(self, label: str, verbose: bool = True, upper_label: Optional[str] = None) -> str:
+        """Parse disc label into searchable title.
+
+        Callers that already hold label.upper() can pass it as upper_label.
+        """
         original = label
-        parsed = label.upper()
-        transformations = []
+        parsed = upper_label if upper_label is not None else label.upper()
+        transformations = []  # Only filled in when verbose - used for logging
 
-        # Remove studio prefixes
-        for prefix in self.STUDIO_PREFIXES:
-            new_parsed = re.sub(f'^{prefix}', '', parsed, flags=re.IGNORECASE)
-            if new_parsed != parsed:
-                transformations.append(f"Stripped prefix: {prefix.replace('_?', '')}")
-                parsed = new_parsed
+        # Remove studio prefixes (each optional, in list order)
+        match = _PATTERNS.studio_prefixes.match(parsed)
+        if match.end():
+            if verbose:
+                for i, prefix in enumerate(self.STUDIO_PREFIXES, start=1):
+                    if match.group(i) is not None:
+                        transformations.append(f"Stripped prefix: {prefix.replace('_?', '')}")
+            parsed = parsed[match.end():]
 
         # Remove disc number suffixes
-        new_parsed = re.sub(r'_?(DISC_?\d*|D\d+)$', '', parsed, flags=re.IGNORECASE)
+        new_parsed = _PATTERNS.disc_suffix.sub('', parsed)
         if new_parsed != parsed:
-            transformations.append("Stripped disc number suffix")
+            if verbose:
+                transformations.append("Stripped disc number suffix")
             parsed = new_parsed
 
         # Remove region codes and common suffixes
-        new_parsed = re.sub(r'_?(PS|US|UK|EU|AU|CA|JP|KR|FR|DE|ES|IT|NL|BR|MX|AC|R1|R2|R3|R4|REGION_?\d)$', '', parsed, flags=re.IGNORECASE)
+        new_parsed = _PATTERNS.region_suffix.sub('', parsed)
         if new_parsed != parsed:
-            transformations.append("Stripped region code")
+            if verbose:
+                transformations.append("Stripped region code")
             parsed = new_parsed
 
-        # Remove studio/format suffixes (can appear multiple times)
-        for _ in range(3):  # Multiple passes to catch stacked suffixes
-            for suffix in self.STRIP_SUFFIXES:
-                new_parsed = re.sub(rf'[_\s]+{suffix}$', '', parsed, flags=re.IGNORECASE)
-                if new_parsed != parsed:
-                    transformations.append(f"Stripped suffix: {suffix}")
-                    parsed = new_parsed
+        # Remove studio/format suffixes (stacked suffixes all go in one match)
+        match = _PATTERNS.strip_suffixes.search(parsed)
+        if match:
+            if verbose:
+                # group(0) starts with a separator, so the first split piece is empty
+                for suffix in reversed(_PATTERNS.separators.split(match.group(0))[1:]):
+                    transformations.append(f"Stripped suffix: {suffix.upper()}")
+            parsed = parsed[:match.start()]
 
         # Replace underscores with spaces
         parsed = parsed.replace('_', ' ')
@@ -251,34 +420,36 @@ class SmartIdentifier:
             upper_word = word.upper()
             if upper_word in self.ABBREVIATIONS:
                 expanded_words.append(self.ABBREVIATIONS[upper_word])
-                transformations.append(f"Expanded: {word} -> {self.ABBREVIATIONS[upper_word]}")
+                if verbose:
+                    transformations.append(f"Expanded: {word} -> {self.ABBREVIATIONS[upper_word]}")
             else:
                 expanded_words.append(word)
         parsed = ' '.join(expanded_words)
 
         # Apply franchise-specific patterns
         franchise_matched = None
-        for pattern, replacement in self.FRANCHISE_PATTERNS:
-            match = re.match(pattern, parsed, re.IGNORECASE)
-            if match:
-                old_parsed = parsed
-                # Handle backreferences in replacement
-                if '\\' in replacement:
-                    parsed = re.sub(pattern, replacement, parsed, flags=re.IGNORECASE)
-                else:
-                    parsed = replacement
+        match = _PATTERNS.franchise.match(parsed)
+        if match:
+            idx = int(match.lastgroup[1:])
+            replacement = self.FRANCHISE_PATTERNS[idx][1]
+            old_parsed = parsed
+            # Handle backreferences in replacement
+            if '\\' in replacement:
+                parsed = _PATTERNS.franchise_each[idx].sub(replacement, parsed)
+            else:
+                parsed = replacement
+            if verbose:
                 franchise_matched = f"{old_parsed} -> {parsed}"
-                break
 
         # Clean up spaces
-        parsed = re.sub(r'\s+', ' ', parsed).strip()
+        parsed = _PATTERNS.whitespace.sub(' ', parsed).strip()
 
         # Title case if all caps
         if parsed.isupper():
             parsed = parsed.title()
 
         # Clean up "Vol" without number
-        parsed = re.sub(r'\s+Vol\s*$', '', parsed)
+        parsed = _PATTERNS.trailing_vol.sub('', parsed)
 
         # Log the parsing details
         if verbose:
@@ -292,13 +463,15 @@ class SmartIdentifier:
 
         return parsed
 
-    def detect_media_type(self, label: str, tracks: List[dict] = None) -> Tuple[str, int, str]:
+    def detect_media_type(self, label: str, tracks: List[dict] = None,
+                          upper_label: Optional[str] = None) -> Tuple[str, int, str]:
         """
         Detect if disc is a TV show based on label patterns and track analysis.
 
         Args:
             label: Disc label string
             tracks: List of track dicts with 'duration' in seconds
+            upper_label: Optional precomputed label.upper()
 
         Returns:
             Tuple of (media_type, season_number, cleaned_title)
@@ -306,43 +479,49 @@ class SmartIdentifier:
             - season_number: Extracted season number (0 if unknown)
             - cleaned_title: Title with season info removed for searching
         """
-        upper_label = label.upper()
+        if upper_label is None:
+            upper_label = label.upper()
         season_number = 0
         is_tv = False
         cleaned_title = label
 
-        # Check disc label for TV patterns
-        for pattern, pattern_type in self.TV_PATTERNS:
-            match = re.search(pattern, upper_label)
+        # Check disc label for TV patterns (list order decides which one wins)
+        for pattern, pattern_type in _PATTERNS.tv:
+            match = pattern.search(upper_label)
             if match:
                 is_tv = True
                 if pattern_type == 'season' and match.groups():
                     season_number = int(match.group(1))
                     # Remove the season indicator from title for cleaner search
-                    cleaned_title = re.sub(pattern, '', upper_label, flags=re.IGNORECASE).strip('_').strip()
+                    cleaned_title = pattern.sub('', upper_label).strip('_').strip()
                 elif pattern_type == 'complete_series':
                     season_number = 0  # All seasons
-                    cleaned_title = re.sub(pattern, '', upper_label, flags=re.IGNORECASE).strip('_').strip()
+                    cleaned_title = pattern.sub('', upper_label).strip('_').strip()
                 elif pattern_type == 'complete_season':
                     # Try to extract season number if present
-                    season_match = re.search(r'(\d+)', match.group(0))
+                    season_match = _PATTERNS.digits.search(match.group(0))
                     if season_match:
                         season_number = int(season_match.group(1))
-                    cleaned_title = re.sub(pattern, '', upper_label, flags=re.IGNORECASE).strip('_').strip()
+                    cleaned_title = pattern.sub('', upper_label).strip('_').strip()
                 break
 
         # Additional heuristic: multiple episode-length tracks suggest TV
         if not is_tv and tracks:
-            episode_length_tracks = [
-                t for t in tracks
-                if self.tv_min_episode_length <= t.get('duration', 0) <= self.tv_max_episode_length
-            ]
+            # Single pass: count episode-length tracks, stop at the first movie-length one
+            episode_count = 0
+            has_movie_length = False
+            movie_cutoff = self.tv_max_episode_length * 1.5
+            for t in tracks:
+                duration = t.get('duration', 0)
+                if self.tv_min_episode_length <= duration <= self.tv_max_episode_length:
+                    episode_count += 1
+                elif duration > movie_cutoff:
+                    has_movie_length = True
+                    break
             # If 3+ tracks in episode range and no long (movie-length) track, likely TV
-            if len(episode_length_tracks) >= 3:
-                has_movie_length = any(t.get('duration', 0) > self.tv_max_episode_length * 1.5 for t in tracks)
-                if not has_movie_length:
-                    is_tv = True
-                    activity.log_info(f"DETECT: Found {len(episode_length_tracks)} episode-length tracks, classifying as TV")
+            if episode_count >= 3 and not has_movie_length:
+                is_tv = True
+                activity.log_info(f"DETECT: Found {episode_count} episode-length tracks, classifying as TV")
 
         media_type = 'tv' if is_tv else 'movie'
 
@@ -355,30 +534,59 @@ class SmartIdentifier:
         return media_type, season_number, cleaned_title
 
     def get_video_runtime(self, folder: str) -> Optional[int]:
-        """Get runtime of video file in seconds using ffprobe"""
-        # Find video file
-        video_file = None
-        for ext in ['mkv', 'mp4', 'avi', 'm4v']:
-            files = list(Path(folder).glob(f'*.{ext}'))
-            if files:
-                video_file = files[0]
-                break
+        """Get runtime of video file in seconds (MKV header, falling back to ffprobe)"""
+        # Find video file - one directory pass, first file per extension
+        extensions = ['mkv', 'mp4', 'avi', 'm4v']
+        found = {}
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or '.' not in entry.name:
+                        continue
+                    ext = entry.name.rsplit('.', 1)[1]
+                    if ext in extensions and ext not in found and entry.is_file():
+                        found[ext] = entry.path
+        except OSError:
+            return None
 
+        video_file = next((found[ext] for ext in extensions if ext in found), None)
         if not video_file:
             return None
 
+        # Post-rip identification and identify() both ask for the same file
         try:
-            result = subprocess.run(
-                ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-                 '-of', 'default=noprint_wrappers=1:nokey=1', str(video_file)],
-                capture_output=True, text=True, timeout=30
-            )
-            if result.returncode == 0:
-                return int(float(result.stdout.strip()))
-        except Exception as e:
-            print(f"Error getting runtime: {e}")
+            st = os.stat(video_file)
+        except OSError:
+            return None
+        key = (video_file, st.st_size, st.st_mtime_ns)
+        if key in _runtime_cache:
+            _runtime_cache.move_to_end(key)
+            return _runtime_cache[key]
+
+        runtime = None
+        # MKV stores the duration in its Segment Info header - no need to spawn ffprobe
+        if video_file.endswith('.mkv'):
+            duration = read_mkv_duration(video_file)
+            if duration:
+                runtime = int(duration)
+
+        if runtime is None:
+            try:
+                result = subprocess.run(
+                    ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+                     '-of', 'default=noprint_wrappers=1:nokey=1', str(video_file)],
+                    capture_output=True, text=True, timeout=30
+                )
+                if result.returncode == 0:
+                    runtime = int(float(result.stdout.strip()))
+            except Exception as e:
+                print(f"Error getting runtime: {e}")
 
-        return None
+        if runtime is not None:
+            _runtime_cache[key] = runtime
+            if len(_runtime_cache) > RUNTIME_CACHE_MAX:
+                _runtime_cache.popitem(last=False)
+        return runtime
 
     def search_radarr(self, title: str, runtime_seconds: Optional[int] = None, verbose: bool = True) -> Optional[IdentificationResult]:
         """Search Radarr for movie match"""
@@ -391,73 +599,110 @@ class SmartIdentifier:
         if verbose:
             activity.log_info(f"RADARR: Searching for '{title}' (runtime: {runtime_str})")
 
-        # Build list of search terms to try
+        search_terms = self._radarr_search_terms(title)
+        all_results = self._search_radarr_terms(search_terms, verbose_term=title if verbose else None)
+
+        if not all_results:
+            if verbose:
+                activity.log_info(f"RADARR: No results found for any search term")
+            return None
+
+        if verbose:
+            activity.log_info(f"RADARR: Found {len(all_results)} unique result(s) from {len(search_terms)} search(es)")
+
+        return self._score_radarr_results(title, all_results, runtime_seconds, verbose)
+
+    @staticmethod
+    def _radarr_search_terms(title: str) -> List[str]:
+        """Lookup terms to try for a title, most specific first"""
         search_terms = [title]
 
         # For titles ending with a number (sequels like "Under Siege 2"), try with "movie" appended
         # This helps filter out TV shows/wrestling with similar names
-        if re.search(r'\s+\d+$', title):
+        base_title, sequel_num = _split_trailing_num(title)
+        if sequel_num:
             search_terms.append(f"{title} movie")
             # Also try base title without the number to find franchise
-            base_title = re.sub(r'\s+\d+$', '', title)
             search_terms.append(base_title)
+        return search_terms
+
+    def _search_radarr_terms(self, search_terms: List[str], verbose_term: Optional[str] = None) -> List[dict]:
+        """Run Radarr lookups for several terms concurrently, merged and deduped by TMDB ID.
+
+        The lookups are independent HTTP calls, so they run in parallel threads;
+        results are merged in search_terms order so scoring stays deterministic.
+        """
+        if len(search_terms) == 1:
+            responses = [self._search_radarr_single(search_terms[0], verbose=(search_terms[0] == verbose_term))]
+        else:
+            with ThreadPoolExecutor(max_workers=len(search_terms)) as executor:
+                responses = list(executor.map(
+                    lambda term: self._search_radarr_single(term, verbose=(term == verbose_term)),
+                    search_terms
+                ))
 
         all_results = []
         seen_tmdb_ids = set()
-
-        for search_term in search_terms:
-            results = self._search_radarr_single(search_term, verbose=(verbose and search_term == title))
+        for results in responses:
             if results:
                 for movie in results:
                     tmdb_id = movie.get('tmdbId', 0)
                     if tmdb_id not in seen_tmdb_ids:
                         seen_tmdb_ids.add(tmdb_id)
+                        # Normalized title, computed once and reused by every scorer
+                        movie['_title_lc'] = movie.get('title', 'Unknown').lower().strip()
                         all_results.append(movie)
+        return all_results
 
-        if not all_results:
-            if verbose:
-                activity.log_info(f"RADARR: No results found for any search term")
-            return None
-
-        if verbose:
-            activity.log_info(f"RADARR: Found {len(all_results)} unique result(s) from {len(search_terms)} search(es)")
+    def _lookup(self, service: str, endpoint: str, term: str,
+                ttl: int = LOOKUP_CACHE_TTL) -> Tuple[int, Any]:
+        """GET a Radarr/Sonarr lookup endpoint, reusing a recent successful response.
 
-        return self._score_radarr_results(title, all_results, runtime_seconds, verbose)
+        Returns (status_code, parsed JSON). Only 200 responses are cached; callers
+        share the cached objects, so anything written to them (like _title_lc)
+        must be derived purely from the object itself.
+        """
+        if service == 'radarr':
+            base_url, headers = self.radarr_url, self._radarr_headers
+        else:
+            base_url, headers = self.sonarr_url, self._sonarr_headers
+
+        key = (base_url, endpoint, term)
+        now = time.monotonic()
+        cached = _lookup_cache.get(key)
+        if cached and now - cached[0] < ttl:
+            _lookup_cache.move_to_end(key)
+            return 200, cached[1]
+
+        response = self._session.get(
+            f"{base_url}/api/v3/{endpoint}",
+            params={'term': term},
+            headers=headers,
+            timeout=10
+        )
+        if response.status_code != 200:
+            return response.status_code, None
+
+        data = http.json_body(response)
+        for stale in [k for k, (fetched_at, _, entry_ttl) in _lookup_cache.items() if now - fetched_at >= entry_ttl]:
+            del _lookup_cache[stale]
+        _lookup_cache[key] = (now, data, ttl)
+        _lookup_cache.move_to_end(key)
+        if len(_lookup_cache) > LOOKUP_CACHE_MAX:
+            _lookup_cache.popitem(last=False)
+        return 200, data
 
     def _search_radarr_single(self, term: str, verbose: bool = False) -> Optional[List[dict]]:
-        """Execute a single Radarr search"""
-        max_retries = 3
-        response = None
-        last_error = None
-
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(
-                    f"{self.radarr_url}/api/v3/movie/lookup",
-                    params={'term': term},
-                    headers={'X-Api-Key': self.radarr_api},
-                    timeout=10
-                )
-                break
-            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    time.sleep(1)
-                continue
-            except Exception as e:
-                return None
-
-        if response is None:
-            return None
-
+        """Execute a single Radarr search (transient failures retried by the session)"""
         try:
-            if response.status_code != 200:
-                return None
-            results = response.json()
-            return results if results else None
+            status, results = self._lookup('radarr', 'movie/lookup', term)
         except Exception:
             return None
 
+        if status != 200:
+            return None
+        return results if results else None
+
     def _score_radarr_results(self, title: str, results: List[dict], runtime_seconds: Optional[int], verbose: bool = True) -> Optional[IdentificationResult]:
         """Score and select best match from Radarr results"""
         if not results:
@@ -470,89 +715,93 @@ class SmartIdentifier:
         # Normalize search title for comparison
         search_title_lower = title.lower().strip()
         # Also extract any number suffix for sequel matching (e.g., "2" from "Under Siege 2")
-        sequel_num_match = re.search(r'\s+(\d+)$', title)
-        sequel_num = sequel_num_match.group(1) if sequel_num_match else None
+        base_title, sequel_num = _split_trailing_num(search_title_lower)
+        # Loop invariants, hoisted out of the per-candidate scoring
+        title_prefixes = (search_title_lower + " ", search_title_lower + ":")
+        search_title_len = len(search_title_lower)
+        track_too_short = bool(runtime_seconds) and runtime_seconds < 600
 
         for movie in results[:15]:  # Check more results for sequels
             score = 0
-            score_breakdown = []
+            # Breakdown strings are only ever logged, so skip building them when silent
+            score_breakdown = [] if verbose else None
             movie_runtime = movie.get('runtime', 0) * 60
-            movie_title = movie.get('title', 'Unknown')
-            movie_year = movie.get('year', 0)
-            movie_title_lower = movie_title.lower().strip()
+            movie_title_lower = movie.get('_title_lc')
+            if movie_title_lower is None:
+                movie_title_lower = movie.get('title', 'Unknown').lower().strip()
 
             # Title match scoring
             if movie_title_lower == search_title_lower:
                 score += 50
-                score_breakdown.append("title exact +50")
-            elif (movie_title_lower.startswith(search_title_lower + " ") or
-                  movie_title_lower.startswith(search_title_lower + ":")):
-                len_ratio = len(search_title_lower) / len(movie_title_lower)
+                if verbose:
+                    score_breakdown.append("title exact +50")
+            elif movie_title_lower.startswith(title_prefixes):
+                len_ratio = search_title_len / len(movie_title_lower)
                 if len_ratio > 0.7:
                     score += 25
-                    score_breakdown.append("title prefix +25")
+                    if verbose:
+                        score_breakdown.append("title prefix +25")
                 else:
                     score += 10
-                    score_breakdown.append(f"title prefix +10 (ratio {len_ratio:.0%})")
+                    if verbose:
+                        score_breakdown.append(f"title prefix +10 (ratio {len_ratio:.0%})")
             elif search_title_lower in movie_title_lower:
                 score += 5
-                score_breakdown.append("title contains +5")
+                if verbose:
+                    score_breakdown.append("title contains +5")
 
             # Sequel number matching - boost if movie title contains the sequel number
             # e.g., "Under Siege 2" should match "Under Siege 2: Dark Territory"
             if sequel_num:
-                base_title = re.sub(r'\s+\d+$', '', search_title_lower)
                 if movie_title_lower.startswith(base_title) and sequel_num in movie_title_lower:
                     score += 40
-                    score_breakdown.append(f"sequel #{sequel_num} match +40")
+                    if verbose:
+                        score_breakdown.append(f"sequel #{sequel_num} match +40")
 
             # Runtime match scoring - use PERCENTAGE difference, not absolute
             # A 3min track claiming to be a 4min movie is 25% off - terrible match
             # A 115min track claiming to be a 120min movie is 4% off - good match
             if runtime_seconds and movie_runtime > 0:
                 # CRITICAL: Tracks under 10 minutes cannot be main features
-                if runtime_seconds < 600:  # < 10 minutes
+                if track_too_short:  # < 10 minutes
                     score -= 100  # Heavy penalty - this is NOT a movie
-                    score_breakdown.append(f"runtime -100 (track only {runtime_seconds // 60}m, too short for movie)")
+                    if verbose:
+                        score_breakdown.append(f"runtime -100 (track only {runtime_seconds // 60}m, too short for movie)")
                 else:
                     # Use percentage-based scoring
                     diff = abs(runtime_seconds - movie_runtime)
                     pct_diff = diff / max(runtime_seconds, movie_runtime) * 100
-                    
+
                     if pct_diff <= 5:  # Within 5% = excellent match
                         runtime_score = 100
-                        score += runtime_score
-                        score_breakdown.append(f"runtime +{runtime_score:.0f} (diff {pct_diff:.1f}%)")
                     elif pct_diff <= 10:  # Within 10% = good match
                         runtime_score = 75
-                        score += runtime_score
-                        score_breakdown.append(f"runtime +{runtime_score:.0f} (diff {pct_diff:.1f}%)")
                     elif pct_diff <= 20:  # Within 20% = okay match
                         runtime_score = 40
-                        score += runtime_score
-                        score_breakdown.append(f"runtime +{runtime_score:.0f} (diff {pct_diff:.1f}%, partial)")
                     else:  # Over 20% = bad match
-                        score_breakdown.append(f"runtime +0 (diff {pct_diff:.1f}%, too far)")
-            else:
+                        runtime_score = 0
+                    score += runtime_score
+                    if verbose:
+                        if runtime_score == 0:
+                            score_breakdown.append(f"runtime +0 (diff {pct_diff:.1f}%, too far)")
+                        elif runtime_score == 40:
+                            score_breakdown.append(f"runtime +{runtime_score:.0f} (diff {pct_diff:.1f}%, partial)")
+                        else:
+                            score_breakdown.append(f"runtime +{runtime_score:.0f} (diff {pct_diff:.1f}%)")
+            elif verbose:
                 score_breakdown.append("runtime N/A")
 
             # Popularity bonus
             popularity = movie.get('popularity', 0)
             pop_score = min(popularity / 10, 20)
             score += pop_score
-            if pop_score > 0:
+            if verbose and pop_score > 0:
                 score_breakdown.append(f"popularity +{pop_score:.0f}")
 
             # Year recency bonus removed - was causing mis-IDs like Walk the Line (2024 vs 2005)
 
-            candidates.append({
-                'title': movie_title,
-                'year': movie_year,
-                'runtime': movie_runtime // 60,
-                'score': score,
-                'breakdown': score_breakdown,
-                'movie': movie
-            })
+            if verbose:
+                candidates.append((score, movie, score_breakdown))
 
             if score > best_score:
                 best_score = score
@@ -560,11 +809,12 @@ class SmartIdentifier:
 
         # Log top 3 candidates
         if verbose and candidates:
-            candidates.sort(key=lambda x: x['score'], reverse=True)
             activity.log_info(f"RADARR: Top candidates:")
-            for i, c in enumerate(candidates[:3]):
-                breakdown = ', '.join(c['breakdown'])
-                activity.log_info(f"RADARR:   {i+1}. {c['title']} ({c['year']}) [{c['runtime']}m] = {c['score']:.0f} pts ({breakdown})")
+            top = heapq.nlargest(3, candidates, key=lambda c: c[0])
+            for i, (score, movie, score_breakdown) in enumerate(top):
+                breakdown = ', '.join(score_breakdown)
+                activity.log_info(f"RADARR:   {i+1}. {movie.get('title', 'Unknown')} ({movie.get('year', 0)}) "
+                                  f"[{movie.get('runtime', 0)}m] = {score:.0f} pts ({breakdown})")
 
         if best_match and best_score >= 50:
             # Get poster URL from images array or remotePoster
@@ -607,24 +857,7 @@ class SmartIdentifier:
         if not self.radarr_api:
             return []
 
-        # Build list of search terms to try
-        search_terms = [title]
-        if re.search(r'\s+\d+$', title):
-            search_terms.append(f"{title} movie")
-            base_title = re.sub(r'\s+\d+$', '', title)
-            search_terms.append(base_title)
-
-        all_results = []
-        seen_tmdb_ids = set()
-
-        for search_term in search_terms:
-            results = self._search_radarr_single(search_term, verbose=False)
-            if results:
-                for movie in results:
-                    tmdb_id = movie.get('tmdbId', 0)
-                    if tmdb_id not in seen_tmdb_ids:
-                        seen_tmdb_ids.add(tmdb_id)
-                        all_results.append(movie)
+        all_results = self._search_radarr_terms(self._radarr_search_terms(title))
 
         if not all_results:
             return []
@@ -638,7 +871,7 @@ class SmartIdentifier:
             movie_runtime = movie.get('runtime', 0) * 60
             movie_title = movie.get('title', 'Unknown')
             movie_year = movie.get('year', 0)
-            movie_title_lower = movie_title.lower().strip()
+            movie_title_lower = movie['_title_lc']
 
             # Title scoring
             if movie_title_lower == search_title_lower:
@@ -682,9 +915,8 @@ class SmartIdentifier:
                 'media_type': 'movie'
             })
 
-        # Sort by score and return top N
-        candidates.sort(key=lambda x: x['score'], reverse=True)
-        return candidates[:limit]
+        # Top N by score (ties keep search order, same as a stable sort)
+        return heapq.nlargest(limit, candidates, key=lambda x: x['score'])
 
     def search_sonarr_multi(self, title: str, limit: int = 5) -> List[dict]:
         """Search Sonarr and return multiple results for user selection"""
@@ -692,17 +924,10 @@ class SmartIdentifier:
             return []
 
         try:
-            response = requests.get(
-                f"{self.sonarr_url}/api/v3/series/lookup",
-                params={'term': title},
-                headers={'X-Api-Key': self.sonarr_api},
-                timeout=10
-            )
-
-            if response.status_code != 200:
+            status, results = self._lookup('sonarr', 'series/lookup', title)
+            if status != 200:
                 return []
 
-            results = response.json()
             if not results:
                 return []
 
@@ -747,14 +972,41 @@ class SmartIdentifier:
                     'media_type': 'tv'
                 })
 
-            # Sort by score and return top N
-            candidates.sort(key=lambda x: x['score'], reverse=True)
-            return candidates[:limit]
+            # Top N by score (ties keep search order, same as a stable sort)
+            return heapq.nlargest(limit, candidates, key=lambda x: x['score'])
 
         except Exception as e:
             activity.log_error(f"SONARR: Multi-search error: {e}")
             return []
 
+    def _get_radarr_library(self) -> Optional[Tuple[List[dict], Dict[int, List[int]]]]:
+        """Fetch the full Radarr movie list, cached for RADARR_LIBRARY_CACHE_TTL seconds.
+
+        Returns (movies, runtime minutes -> library indices), or None on failure.
+        """
+        now = time.monotonic()
+        cached = _library_cache.get(self.radarr_url)
+        if cached and now - cached[0] < RADARR_LIBRARY_CACHE_TTL:
+            return cached[1], cached[2]
+
+        response = self._session.get(
+            f"{self.radarr_url}/api/v3/movie",
+            headers=self._radarr_headers,
+            timeout=15
+        )
+        if response.status_code != 200:
+            return None
+
+        movies = http.json_body(response)
+        by_runtime = {}
+        for idx, movie in enumerate(movies or []):
+            minutes = movie.get('runtime', 0)
+            if minutes > 0:
+                by_runtime.setdefault(minutes, []).append(idx)
+
+        _library_cache[self.radarr_url] = (now, movies, by_runtime)
+        return movies, by_runtime
+
     def search_radarr_by_runtime(self, runtime_seconds: int, verbose: bool = True) -> Optional[IdentificationResult]:
         """Search Radarr library by runtime only - fallback for generic disc labels"""
         if not self.radarr_api or not runtime_seconds:
@@ -765,40 +1017,34 @@ class SmartIdentifier:
             if verbose:
                 activity.log_info(f"RADARR: Runtime-only search ({runtime_str})")
 
-            # Get all movies in library
-            response = requests.get(
-                f"{self.radarr_url}/api/v3/movie",
-                headers={'X-Api-Key': self.radarr_api},
-                timeout=15
-            )
-
-            if response.status_code != 200:
+            # Get all movies in library (cached)
+            library = self._get_radarr_library()
+            if not library or not library[0]:
                 return None
+            movies, by_runtime = library
 
-            movies = response.json()
-            if not movies:
-                return None
+            # Find movies with matching runtime - only the runtime buckets within
+            # tolerance need checking. Library order is kept for stable tie-breaks.
+            min_minutes = max(1, -(-(runtime_seconds - self.runtime_tolerance) // 60))
+            max_minutes = (runtime_seconds + self.runtime_tolerance) // 60
+            candidate_idxs = []
+            for minutes in range(min_minutes, max_minutes + 1):
+                candidate_idxs.extend(by_runtime.get(minutes, ()))
+            candidate_idxs.sort()
 
-            # Find movies with matching runtime
             matches = []
-            for movie in movies:
+            for idx in candidate_idxs:
+                movie = movies[idx]
                 movie_runtime = movie.get('runtime', 0) * 60  # Radarr returns minutes
-                if movie_runtime <= 0:
-                    continue
-
                 diff = abs(runtime_seconds - movie_runtime)
-                if diff <= self.runtime_tolerance:
-                    score = 100 - (diff / self.runtime_tolerance * 50)
-                    matches.append((movie, score, diff))
+                score = 100 - (diff / self.runtime_tolerance * 50)
+                matches.append((movie, score, diff))
 
             if not matches:
                 if verbose:
                     activity.log_info(f"RADARR: No runtime matches in library")
                 return None
 
-            # Sort by score (best match first)
-            matches.sort(key=lambda x: x[1], reverse=True)
-
             if len(matches) == 1:
                 # Single match - high confidence
                 movie, score, diff = matches[0]
@@ -811,7 +1057,6 @@ class SmartIdentifier:
                     tmdb_id=movie.get('tmdbId', 0),
                     runtime_minutes=movie.get('runtime', 0),
                     confidence=min(85, int(score)),  # Cap at 85% for runtime-only match
-                    folder_name=f"{movie['title']} ({movie.get('year', 0)})",
                     poster_url=next((img['remoteUrl'] for img in movie.get('images', []) if img.get('coverType') == 'poster'), ''),
                     media_type='movie'
                 )
@@ -819,7 +1064,8 @@ class SmartIdentifier:
                 # Multiple matches - lower confidence, log options
                 if verbose:
                     activity.log_warning(f"RADARR: {len(matches)} runtime matches - review needed")
-                    for movie, score, diff in matches[:3]:
+                    # Only the top 3 are shown, so skip sorting the full match list
+                    for movie, score, diff in heapq.nlargest(3, matches, key=lambda x: x[1]):
                         activity.log_info(f"  - '{movie['title']}' ({movie.get('year', 0)}) diff {diff // 60}m")
                 return None
 
@@ -853,44 +1099,24 @@ class SmartIdentifier:
                 avg_runtime = sum(episode_runtimes) / len(episode_runtimes) / 60
                 activity.log_info(f"SONARR: {len(episode_runtimes)} episode tracks (avg {avg_runtime:.0f}m)")
 
-        # Retry logic
-        max_retries = 3
-        response = None
-        last_error = None
-
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(
-                    f"{self.sonarr_url}/api/v3/series/lookup",
-                    params={'term': title},
-                    headers={'X-Api-Key': self.sonarr_api},
-                    timeout=10
-                )
-                break
-            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    if verbose:
-                        activity.log_warning(f"SONARR: Attempt {attempt + 1}/{max_retries} failed, retrying...")
-                    time.sleep(1)
-                continue
-            except Exception as e:
-                if verbose:
-                    activity.log_error(f"SONARR: Search error: {e}")
-                return None
-
-        if response is None:
+        # Transient failures are already retried with backoff by the shared session
+        try:
+            status, results = self._lookup('sonarr', 'series/lookup', title)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
             if verbose:
-                activity.log_error(f"SONARR: All {max_retries} attempts failed: {last_error}")
+                activity.log_error(f"SONARR: Request failed after retries: {e}")
+            return None
+        except Exception as e:
+            if verbose:
+                activity.log_error(f"SONARR: Search error: {e}")
             return None
 
         try:
-            if response.status_code != 200:
+            if status != 200:
                 if verbose:
-                    activity.log_warning(f"SONARR: API returned status {response.status_code}")
+                    activity.log_warning(f"SONARR: API returned status {status}")
                 return None
 
-            results = response.json()
             if not results:
                 if verbose:
                     activity.log_info(f"SONARR: No results found for '{title}'")
@@ -903,53 +1129,62 @@ class SmartIdentifier:
             best_score = 0
             candidates = []
 
+            # Per-search invariants, computed once rather than per candidate
+            avg_track_runtime = sum(episode_runtimes) / len(episode_runtimes) / 60 if episode_runtimes else 0  # minutes
+            title_upper = title.upper()
+
             for show in results[:10]:
                 score = 0
-                score_breakdown = []
+                # Breakdown strings are only ever logged, so skip building them when silent
+                score_breakdown = [] if verbose else None
                 show_title = show.get('title', 'Unknown')
-                show_year = show.get('year', 0)
                 show_runtime = show.get('runtime', 0)  # Average episode runtime in minutes
 
                 # Runtime match scoring (if we have episode runtimes)
                 if episode_runtimes and show_runtime > 0:
-                    avg_track_runtime = sum(episode_runtimes) / len(episode_runtimes) / 60  # minutes
                     diff = abs(avg_track_runtime - show_runtime)
                     if diff <= 5:  # Within 5 minutes
                         runtime_score = 50 - (diff * 5)
                         score += runtime_score
-                        score_breakdown.append(f"runtime +{runtime_score:.0f} (diff {diff:.0f}m)")
+                        if verbose:
+                            score_breakdown.append(f"runtime +{runtime_score:.0f} (diff {diff:.0f}m)")
                     elif diff <= 15:
                         score += 20
-                        score_breakdown.append(f"runtime +20 (diff {diff:.0f}m, partial)")
-                    else:
+                        if verbose:
+                            score_breakdown.append(f"runtime +20 (diff {diff:.0f}m, partial)")
+                    elif verbose:
                         score_breakdown.append(f"runtime +0 (diff {diff:.0f}m, too far)")
-                else:
+                elif verbose:
                     score_breakdown.append("runtime N/A")
 
                 # Popularity/ratings bonus
-                ratings = show.get('ratings', {})
-                if ratings.get('votes', 0) > 1000:
+                votes = show.get('ratings', {}).get('votes', 0)
+                if votes > 1000:
                     score += 20
-                    score_breakdown.append("popular +20")
-                elif ratings.get('votes', 0) > 100:
+                    if verbose:
+                        score_breakdown.append("popular +20")
+                elif votes > 100:
                     score += 10
-                    score_breakdown.append("popular +10")
+                    if verbose:
+                        score_breakdown.append("popular +10")
 
                 # Year recency bonus removed - was causing mis-IDs
 
                 # Title match bonus - exact match gets boost
-                if show_title.upper() == title.upper():
+                if show_title.upper() == title_upper:
                     score += 20
-                    score_breakdown.append("exact title +20")
+                    if verbose:
+                        score_breakdown.append("exact title +20")
 
-                candidates.append({
-                    'title': show_title,
-                    'year': show_year,
-                    'runtime': show_runtime,
-                    'score': score,
-                    'breakdown': score_breakdown,
-                    'tvdb_id': show.get('tvdbId', 0)
-                })
+                if verbose:
+                    candidates.append({
+                        'title': show_title,
+                        'year': show.get('year', 0),
+                        'runtime': show_runtime,
+                        'score': score,
+                        'breakdown': score_breakdown,
+                        'tvdb_id': show.get('tvdbId', 0)
+                    })
 
                 if score > best_score:
                     best_score = score
@@ -957,9 +1192,8 @@ class SmartIdentifier:
 
             # Log top candidates
             if verbose and candidates:
-                candidates.sort(key=lambda x: x['score'], reverse=True)
                 activity.log_info(f"SONARR: Top candidates:")
-                for i, c in enumerate(candidates[:3]):
+                for i, c in enumerate(heapq.nlargest(3, candidates, key=lambda x: x['score'])):
                     breakdown = ', '.join(c['breakdown'])
                     activity.log_info(f"SONARR:   {i+1}. {c['title']} ({c['year']}) [{c['runtime']}m/ep] = {c['score']:.0f} pts ({breakdown})")
 
@@ -1025,18 +1259,12 @@ class SmartIdentifier:
 
         try:
             # First need to check if series is in Sonarr library
-            response = requests.get(
-                f"{self.sonarr_url}/api/v3/series/lookup",
-                params={'term': f"tvdb:{series_id}"},
-                headers={'X-Api-Key': self.sonarr_api},
-                timeout=10
-            )
-
-            if response.status_code != 200:
+            status, series_data = self._lookup('sonarr', 'series/lookup', f"tvdb:{series_id}",
+                                               ttl=EPISODES_CACHE_TTL)
+            if status != 200:
                 activity.log_warning(f"SONARR: Could not fetch series {series_id}")
                 return []
 
-            series_data = response.json()
             if not series_data:
                 return []
 
@@ -1068,6 +1296,35 @@ class SmartIdentifier:
             activity.log_error(f"SONARR: Error fetching episodes: {e}")
             return []
 
+    def get_sonarr_episodes_bulk(self, ids: List[Tuple[int, int]]) -> Dict[Tuple[int, int], List[dict]]:
+        """Fetch episode lists for several (series_id, season) pairs at once.
+
+        Each series is looked up once, with the lookups fanned out over the shared
+        session; the per-season lists are then built from the lookup cache.
+
+        Args:
+            ids: (TVDB series ID, season number) pairs
+
+        Returns:
+            Dict mapping each pair to its episode list (see get_sonarr_episodes)
+        """
+        if not self.sonarr_api or not ids:
+            return {}
+
+        series_ids = list(dict.fromkeys(series_id for series_id, _ in ids))
+        if len(series_ids) > 1:
+            def prefetch(series_id):
+                try:
+                    self._lookup('sonarr', 'series/lookup', f"tvdb:{series_id}", ttl=EPISODES_CACHE_TTL)
+                except Exception:
+                    pass  # get_sonarr_episodes retries and logs the failure
+
+            with ThreadPoolExecutor(max_workers=min(SONARR_BULK_WORKERS, len(series_ids))) as executor:
+                list(executor.map(prefetch, series_ids))
+
+        return {(series_id, season): self.get_sonarr_episodes(series_id, season)
+                for series_id, season in ids}
+
     def match_episodes_to_tracks(self, series_id: int, season: int,
                                   track_runtimes: List[int]) -> Dict[int, dict]:
         """Match disc tracks to episodes based on runtime.
@@ -1094,37 +1351,53 @@ class SmartIdentifier:
                 }
             return mapping
 
-        # Try to match tracks to episodes by runtime
-        mapping = {}
-        used_episodes = set()
+        # Match tracks to episodes by runtime. Candidate pairs within tolerance
+        # are taken closest-first across all tracks, so an early track can't
+        # steal an episode that a later track matches better.
+        tolerance = self.tv_episode_tolerance
+        by_runtime = sorted((ep.get('runtime', 0), ep_idx) for ep_idx, ep in enumerate(episodes))
+        sorted_runtimes = [runtime for runtime, _ in by_runtime]
 
+        pairs = []
         for track_idx, track_runtime in enumerate(track_runtimes):
-            best_match = None
-            best_diff = float('inf')
-
-            for ep in episodes:
-                ep_num = ep['episode_number']
-                if ep_num in used_episodes:
-                    continue
-
-                ep_runtime = ep.get('runtime', 0)
-                diff = abs(track_runtime - ep_runtime)
+            # Only episodes inside the tolerance window are candidates
+            lo = bisect.bisect_left(sorted_runtimes, track_runtime - tolerance)
+            hi = bisect.bisect_right(sorted_runtimes, track_runtime + tolerance)
+            for ep_runtime, ep_idx in by_runtime[lo:hi]:
+                pairs.append((abs(track_runtime - ep_runtime), track_idx, ep_idx))
+        pairs.sort()
+
+        matched = {}  # track index -> episode index
+        used_episodes = set()
+        for diff, track_idx, ep_idx in pairs:
+            ep_num = episodes[ep_idx]['episode_number']
+            if track_idx in matched or ep_num in used_episodes:
+                continue
+            matched[track_idx] = ep_idx
+            used_episodes.add(ep_num)
 
-                if diff < best_diff and diff <= self.tv_episode_tolerance:
-                    best_diff = diff
-                    best_match = ep
+        # Episodes with the same runtime are interchangeable, so hand them out
+        # in track order - keeps disc order when Sonarr only knows the average
+        same_runtime = {}
+        for track_idx in sorted(matched):
+            same_runtime.setdefault(episodes[matched[track_idx]].get('runtime', 0), []).append(track_idx)
+        for track_idxs in same_runtime.values():
+            for track_idx, ep_idx in zip(track_idxs, sorted(matched[t] for t in track_idxs)):
+                matched[track_idx] = ep_idx
 
-            if best_match:
+        mapping = {}
+        for track_idx, track_runtime in enumerate(track_runtimes):
+            if track_idx in matched:
+                ep = episodes[matched[track_idx]]
                 mapping[track_idx] = {
-                    'episode_number': best_match['episode_number'],
+                    'episode_number': ep['episode_number'],
                     'season_number': season,
-                    'title': best_match.get('title', f"Episode {best_match['episode_number']}"),
+                    'title': ep.get('title', f"Episode {ep['episode_number']}"),
                     'runtime': track_runtime
                 }
-                used_episodes.add(best_match['episode_number'])
             else:
                 # No match - assign sequential episode number
-                next_ep = len(mapping) + 1
+                next_ep = track_idx + 1
                 mapping[track_idx] = {
                     'episode_number': next_ep,
                     'season_number': season,
@@ -1150,16 +1423,37 @@ class SmartIdentifier:
         folder_name = folder_path.name
 
         # Extract disc label from folder name
-        disc_label = re.sub(r'\s*\(\d{4}\)(_\d+)?$', '', folder_name)
+        disc_label = _PATTERNS.folder_year.sub('', folder_name)
         disc_label = disc_label.replace('-', '_').upper()
 
-        # Parse into search term
-        search_term = self.parse_disc_label(disc_label)
-
         # Get video runtime (in seconds)
         runtime = self.get_video_runtime(folder)
         runtime_secs = runtime if runtime else 0
 
+        # Same disc + runtime identified recently (rip retries, re-scans)
+        cached = identify_cache.get(disc_label, runtime_secs)
+        if cached:
+            try:
+                result = IdentificationResult.from_dict(cached)
+            except TypeError:
+                result = None  # Written by an older IdentificationResult - treat as a miss
+            if result:
+                if self.config.get('ripping', {}).get('debug_logging', False):
+                    activity.log_info(f"IDENTIFY: Cache hit for '{disc_label}' -> '{result.title}'")
+                return result
+
+        result = self._identify_uncached(disc_label, runtime)
+        if result and result.confidence >= 50:
+            identify_cache.put(disc_label, runtime_secs, asdict(result))
+        return result
+
+    def _identify_uncached(self, disc_label: str, runtime: Optional[int]) -> Optional[IdentificationResult]:
+        """Community DB -> Radarr -> Sonarr -> runtime-only cascade behind identify()"""
+        runtime_secs = runtime if runtime else 0
+
+        # Parse into search term
+        search_term = self.parse_disc_label(disc_label, upper_label=disc_label)
+
         # Try community database first (if enabled)
         community_match = community_db.lookup_disc(disc_label, runtime_secs, self.config)
         if community_match:
@@ -1245,8 +1539,12 @@ class SmartIdentifier:
             activity.log_info(f"=== EARLY IDENTIFY: {disc_label} ===")
 
         # Step 1: Check disc label patterns for TV indicators
-        label_media_type, season_number, cleaned_title = self.detect_media_type(disc_label, tracks)
-        search_term = self.parse_disc_label(cleaned_title if label_media_type == 'tv' else disc_label, verbose=debug_enabled)
+        upper_label = disc_label.upper()
+        label_media_type, season_number, cleaned_title = self.detect_media_type(disc_label, tracks, upper_label=upper_label)
+        if label_media_type == 'tv':
+            search_term = self.parse_disc_label(cleaned_title, verbose=debug_enabled)
+        else:
+            search_term = self.parse_disc_label(disc_label, verbose=debug_enabled, upper_label=upper_label)
 
         if debug_enabled:
             activity.log_info(f"EARLY ID: Label analysis suggests '{label_media_type}' (search: '{search_term}')")
@@ -1329,18 +1627,12 @@ class SmartIdentifier:
 
         try:
             # Look up series by TVDB ID
-            response = requests.get(
-                f"{self.sonarr_url}/api/v3/series/lookup",
-                params={'term': f"tvdb:{tvdb_id}"},
-                headers={'X-Api-Key': self.sonarr_api},
-                timeout=10
-            )
-
-            if response.status_code != 200:
+            status, series_data = self._lookup('sonarr', 'series/lookup', f"tvdb:{tvdb_id}",
+                                               ttl=EPISODES_CACHE_TTL)
+            if status != 200:
                 activity.log_warning(f"SONARR: Could not fetch series {tvdb_id}")
                 return []
 
-            series_data = response.json()
             if not series_data:
                 return []
 
@@ -1376,6 +1668,37 @@ class SmartIdentifier:
             return []
 
 
+_PATTERNS = _Patterns(
+    # Every studio prefix is optional and tried in list order, so one match strips
+    # the same stacked prefixes as checking them one by one
+    studio_prefixes=re.compile(
+        '^' + ''.join(f'({prefix})?' for prefix in SmartIdentifier.STUDIO_PREFIXES), re.IGNORECASE),
+    disc_suffix=re.compile(r'_?(DISC_?\d*|D\d+)$', re.IGNORECASE),
+    region_suffix=re.compile(
+        r'_?(PS|US|UK|EU|AU|CA|JP|KR|FR|DE|ES|IT|NL|BR|MX|AC|R1|R2|R3|R4|REGION_?\d)$', re.IGNORECASE),
+    # Any run of stacked STRIP_SUFFIXES at the end of the label, removed in one match
+    strip_suffixes=re.compile(
+        r'(?:[_\s]+(?:' + '|'.join(SmartIdentifier.STRIP_SUFFIXES) + r'))+$', re.IGNORECASE),
+    separators=re.compile(r'[_\s]+'),
+    # All franchise patterns fused into one alternation (first match wins, same
+    # priority as list order). Dispatch on lastgroup -> index into FRANCHISE_PATTERNS.
+    franchise=re.compile(
+        '|'.join(f'(?P<f{i}>{pattern[1:]})' for i, (pattern, _) in enumerate(SmartIdentifier.FRANCHISE_PATTERNS)),
+        re.IGNORECASE),
+    franchise_each=tuple(re.compile(pattern, re.IGNORECASE) for pattern, _ in SmartIdentifier.FRANCHISE_PATTERNS),
+    tv=tuple((re.compile(pattern, re.IGNORECASE), pattern_type)
+             for pattern, pattern_type in SmartIdentifier.TV_PATTERNS),
+    digits=re.compile(r'(\d+)'),
+    whitespace=re.compile(r'\s+'),
+    trailing_vol=re.compile(r'\s+Vol\s*$'),
+    # " (2019)" / " (2019)_2" suffix that rips add to output folder names
+    folder_year=re.compile(r'\s*\(\d{4}\)(_\d+)?$'),
+    # Folder names: colon -> space-dash, drop other invalid characters
+    folder_trans=str.maketrans({':': ' -', '<': None, '>': None, '"': None,
+                                '|': None, '?': None, '*': None}),
+)
+
+
 def match_tracks_to_episodes(tracks: List[dict], episodes: List[dict], tolerance_secs: int = 120) -> List[dict]:
     """Match ripped tracks to known episodes by duration.
 
@@ -0,0 +1,85 @@
+"""
+RipForge Identify Cache
+Persists identify() results keyed by disc label + runtime, so rip retries and
+re-scans of the same disc skip the community DB and Radarr/Sonarr searches
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, Dict
+
+CACHE_DB = Path(__file__).parent.parent / "config" / "identify_cache.db"
+CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating the table on first use"""
+    CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_DB, timeout=5)
+    # WAL lets concurrent rip workers read while another writes
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS identify_cache (
+            disc_label TEXT,
+            runtime_bucket INTEGER,
+            result_json TEXT,
+            ts INTEGER,
+            PRIMARY KEY (disc_label, runtime_bucket)
+        )
+    """)
+    return conn
+
+
+def _bucket(runtime_secs: int) -> int:
+    """Runtime to the minute, so ffprobe/EBML rounding noise still hits"""
+    return (runtime_secs or 0) // 60
+
+
+def get(disc_label: str, runtime_secs: int) -> Optional[Dict]:
+    """Return the cached result dict for a disc, if present and fresh"""
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute(
+                "SELECT result_json, ts FROM identify_cache WHERE disc_label = ? AND runtime_bucket = ?",
+                (disc_label, _bucket(runtime_secs))
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+
+    if not row or time.time() - row[1] > CACHE_MAX_AGE:
+        return None
+    return json.loads(row[0])
+
+
+def put(disc_label: str, runtime_secs: int, result: Dict):
+    """Store a result dict for a disc (best effort)"""
+    try:
+        conn = _connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO identify_cache VALUES (?, ?, ?, ?)",
+                    (disc_label, _bucket(runtime_secs), json.dumps(result), int(time.time()))
+                )
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def clear():
+    """Remove all cached results"""
+    try:
+        conn = _connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM identify_cache")
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        pass
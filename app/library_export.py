@@ -4,10 +4,12 @@ Library Export - Generate PDF of movies/TV shows
 
 import os
 import io
-import requests
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
@@ -15,17 +17,63 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
+from PIL import Image as PILImage, ImageFile  # installed with reportlab
 
 from . import config
+from . import http
 
 
 EXPORT_DIR = Path(__file__).parent.parent / "exports"
 EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Concurrent poster downloads when exporting with images
+POSTER_DOWNLOAD_WORKERS = 16
+
+# On-disk poster cache - posters are effectively immutable per URL
+POSTER_CACHE_DIR = EXPORT_DIR / ".poster_cache"
+POSTER_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
+POSTER_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Posters render at 0.75"x1", so anything past ~2x that in pixels is wasted
+POSTER_THUMB_SIZE = (150, 200)
+POSTER_JPEG_QUALITY = 75
+
+# Rows per poster table; each chunk is laid out independently
+POSTER_TABLE_ROWS = 50
+_POSTER_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+])
+
+# Fail fast when Radarr/Sonarr is down instead of waiting out the 30s read timeout
+ARR_CONNECT_TIMEOUT = 2  # seconds
+
+# Back-to-back exports reuse the full library pull
+LIBRARY_FETCH_CACHE_TTL = 60  # seconds
+_fetch_cache: Dict[Tuple[str, str], Tuple[float, List[Dict]]] = {}
+
+
+def _cached_library(service: str, url: str) -> Optional[List[Dict]]:
+    """Return a recently fetched library list, if still fresh"""
+    cached = _fetch_cache.get((service, url))
+    if cached and time.monotonic() - cached[0] < LIBRARY_FETCH_CACHE_TTL:
+        return cached[1]
+    return None
 
-def fetch_movies_from_radarr() -> List[Dict]:
-    """Fetch all movies from Radarr"""
-    cfg = config.load_config()
+
+def clear_fetch_cache():
+    """Drop cached Radarr/Sonarr library lists"""
+    _fetch_cache.clear()
+
+
+def fetch_movies_from_radarr(cfg: Optional[dict] = None) -> List[Dict]:
+    """Fetch all movies from Radarr (cfg: already-loaded config, loaded if omitted)"""
+    if cfg is None:
+        cfg = config.load_config()
     radarr = cfg.get('integrations', {}).get('radarr', {})
 
     if not radarr.get('enabled') or not radarr.get('api_key'):
@@ -34,25 +82,32 @@ def fetch_movies_from_radarr() -> List[Dict]:
     url = radarr.get('url', 'http://localhost:7878')
     api_key = radarr.get('api_key')
 
+    cached = _cached_library('radarr', url)
+    if cached is not None:
+        return cached
+
     try:
-        r = requests.get(
+        r = http.SESSION.get(
             f"{url}/api/v3/movie",
             headers={"X-Api-Key": api_key},
-            timeout=30
+            timeout=(ARR_CONNECT_TIMEOUT, 30)
         )
         if r.status_code == 200:
-            movies = r.json()
+            movies = http.json_body(r)
             # Sort by title
-            return sorted(movies, key=lambda m: m.get('title', '').lower())
+            movies = sorted(movies, key=lambda m: m.get('title', '').lower())
+            _fetch_cache[('radarr', url)] = (time.monotonic(), movies)
+            return movies
     except Exception as e:
         print(f"Error fetching Radarr movies: {e}")
 
     return []
 
 
-def fetch_shows_from_sonarr() -> List[Dict]:
-    """Fetch all TV shows from Sonarr"""
-    cfg = config.load_config()
+def fetch_shows_from_sonarr(cfg: Optional[dict] = None) -> List[Dict]:
+    """Fetch all TV shows from Sonarr (cfg: already-loaded config, loaded if omitted)"""
+    if cfg is None:
+        cfg = config.load_config()
     sonarr = cfg.get('integrations', {}).get('sonarr', {})
 
     if not sonarr.get('enabled') or not sonarr.get('api_key'):
@@ -61,39 +116,173 @@ def fetch_shows_from_sonarr() -> List[Dict]:
     url = sonarr.get('url', 'http://localhost:8989')
     api_key = sonarr.get('api_key')
 
+    cached = _cached_library('sonarr', url)
+    if cached is not None:
+        return cached
+
     try:
-        r = requests.get(
+        r = http.SESSION.get(
             f"{url}/api/v3/series",
             headers={"X-Api-Key": api_key},
-            timeout=30
+            timeout=(ARR_CONNECT_TIMEOUT, 30)
         )
         if r.status_code == 200:
-            shows = r.json()
+            shows = http.json_body(r)
             # Sort by title
-            return sorted(shows, key=lambda s: s.get('title', '').lower())
+            shows = sorted(shows, key=lambda s: s.get('title', '').lower())
+            _fetch_cache[('sonarr', url)] = (time.monotonic(), shows)
+            return shows
     except Exception as e:
         print(f"Error fetching Sonarr shows: {e}")
 
     return []
 
 
+def _poster_cache_path(url: str) -> Path:
+    """Cache file for a poster URL, sharded by the first two hex digits of its hash"""
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return POSTER_CACHE_DIR / key[:2] / key
+
+
+def _read_cached_poster(url: str) -> Optional[bytes]:
+    """Return cached poster bytes if present and fresh"""
+    path = _poster_cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime > POSTER_CACHE_MAX_AGE:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _write_cached_poster(url: str, data: bytes):
+    """Store poster bytes in the cache (best effort)"""
+    path = _poster_cache_path(url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(data)
+        tmp.replace(path)
+    except OSError as e:
+        print(f"Error caching poster: {e}")
+
+
+def prune_poster_cache(max_bytes: int = None):
+    """Evict least recently used posters until the cache fits in max_bytes"""
+    if max_bytes is None:
+        max_bytes = POSTER_CACHE_MAX_BYTES
+
+    entries = []
+    total = 0
+    try:
+        for path in POSTER_CACHE_DIR.glob('*/*'):
+            st = path.stat()
+            entries.append((max(st.st_atime, st.st_mtime), st.st_size, path))
+            total += st.st_size
+    except OSError:
+        return
+
+    if total <= max_bytes:
+        return
+
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
+
+
+def _poster_thumbnail(chunks) -> Optional[bytes]:
+    """Decode a poster from streamed chunks and re-encode it as a small JPEG"""
+    parser = ImageFile.Parser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    img = parser.close()
+
+    img.thumbnail(POSTER_THUMB_SIZE, PILImage.LANCZOS)
+    out = io.BytesIO()
+    img.convert('RGB').save(out, 'JPEG', quality=POSTER_JPEG_QUALITY)
+    return out.getvalue()
+
+
 def download_poster(url: str, max_width: float = 0.75*inch, max_height: float = 1*inch) -> Optional[Image]:
-    """Download a poster image and return as reportlab Image"""
+    """Download a poster image (or load it from the cache) and return as reportlab Image"""
     if not url:
         return None
 
     try:
-        r = requests.get(url, timeout=10)
-        if r.status_code == 200:
-            img_data = io.BytesIO(r.content)
-            img = Image(img_data, width=max_width, height=max_height)
-            return img
+        data = _read_cached_poster(url)
+        if data is None:
+            r = http.SESSION.get(url, timeout=10, stream=True)
+            try:
+                if r.status_code != 200:
+                    return None
+                data = _poster_thumbnail(r.iter_content(8192))
+            finally:
+                r.close()
+            _write_cached_poster(url, data)
+        return Image(io.BytesIO(data), width=max_width, height=max_height)
     except Exception as e:
         print(f"Error downloading poster: {e}")
 
     return None
 
 
+def _poster_url(item: Dict) -> Optional[str]:
+    """Get the poster URL for a Radarr movie / Sonarr show, if any"""
+    for image in item.get('images', []):
+        if image.get('coverType') == 'poster':
+            return image.get('remoteUrl') or image.get('url')
+    return None
+
+
+def download_posters(urls: List[Optional[str]]) -> List[Optional[Image]]:
+    """Download posters concurrently, returning images in the same order as urls"""
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=POSTER_DOWNLOAD_WORKERS) as executor:
+        posters = list(executor.map(download_poster, urls))
+    prune_poster_cache()
+    return posters
+
+
+def _movie_label(movie: Dict) -> str:
+    """'Title (Year)' line for a Radarr movie"""
+    year = movie.get('year', '')
+    return f"{movie.get('title', 'Unknown')} ({year})" if year else movie.get('title', 'Unknown')
+
+
+def _show_label(show: Dict) -> str:
+    """'Title (Year) - N seasons' line for a Sonarr show"""
+    year = show.get('year', '')
+    seasons = show.get('seasonCount', 0)
+    title = f"{show.get('title', 'Unknown')} ({year})" if year else show.get('title', 'Unknown')
+    return title + f" - {seasons} season{'s' if seasons != 1 else ''}"
+
+
+def _section_flowables(items: List[Dict], label, include_images: bool, normal_style) -> List:
+    """Flowables listing one library section, as poster tables or bullet lines"""
+    if not include_images:
+        return [Paragraph(f"• {label(item)}", normal_style) for item in items]
+
+    # Table with images - fetch all posters up front, in parallel
+    posters = download_posters([_poster_url(item) for item in items])
+    rows = [[poster or '', label(item)] for item, poster in zip(items, posters)]
+
+    # One table per chunk of rows: reportlab re-splits the remainder of a table
+    # at every page break, which goes quadratic on a single library-sized table
+    tables = []
+    for start in range(0, len(rows), POSTER_TABLE_ROWS):
+        table = Table(rows[start:start + POSTER_TABLE_ROWS], colWidths=[1*inch, 6*inch])
+        table.setStyle(_POSTER_TABLE_STYLE)
+        tables.append(table)
+    return tables
+
+
 def generate_library_pdf(
     include_movies: bool = True,
     include_shows: bool = True,
@@ -160,97 +349,27 @@ def generate_library_pdf(
     ))
     story.append(Spacer(1, 20))
 
+    # Radarr and Sonarr pulls are independent, so run them side by side
+    # (sharing one config load)
+    cfg = config.load_config()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        movies_future = executor.submit(fetch_movies_from_radarr, cfg) if include_movies else None
+        shows_future = executor.submit(fetch_shows_from_sonarr, cfg) if include_shows else None
+    movies = movies_future.result() if movies_future else []
+    shows = shows_future.result() if shows_future else []
+
     # Movies section
     if include_movies:
-        movies = fetch_movies_from_radarr()
         if movies:
             story.append(Paragraph(f"Movies ({len(movies)})", section_style))
-
-            if include_images:
-                # Table with images
-                movie_data = []
-                for movie in movies:
-                    year = movie.get('year', '')
-                    title = f"{movie.get('title', 'Unknown')} ({year})" if year else movie.get('title', 'Unknown')
-
-                    # Get poster URL
-                    poster = None
-                    for image in movie.get('images', []):
-                        if image.get('coverType') == 'poster':
-                            poster_url = image.get('remoteUrl') or image.get('url')
-                            if poster_url:
-                                poster = download_poster(poster_url)
-                            break
-
-                    movie_data.append([poster or '', title])
-
-                # Create table
-                if movie_data:
-                    table = Table(movie_data, colWidths=[1*inch, 6*inch])
-                    table.setStyle(TableStyle([
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-                        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-                        ('TOPPADDING', (0, 0), (-1, -1), 4),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-                        ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                    ]))
-                    story.append(table)
-            else:
-                # Simple text list
-                for movie in movies:
-                    year = movie.get('year', '')
-                    title = f"{movie.get('title', 'Unknown')} ({year})" if year else movie.get('title', 'Unknown')
-                    story.append(Paragraph(f"• {title}", normal_style))
-
+            story.extend(_section_flowables(movies, _movie_label, include_images, normal_style))
             story.append(Spacer(1, 20))
 
     # TV Shows section
     if include_shows:
-        shows = fetch_shows_from_sonarr()
         if shows:
             story.append(Paragraph(f"TV Shows ({len(shows)})", section_style))
-
-            if include_images:
-                # Table with images
-                show_data = []
-                for show in shows:
-                    year = show.get('year', '')
-                    seasons = show.get('seasonCount', 0)
-                    title = f"{show.get('title', 'Unknown')} ({year})" if year else show.get('title', 'Unknown')
-                    title += f" - {seasons} season{'s' if seasons != 1 else ''}"
-
-                    # Get poster URL
-                    poster = None
-                    for image in show.get('images', []):
-                        if image.get('coverType') == 'poster':
-                            poster_url = image.get('remoteUrl') or image.get('url')
-                            if poster_url:
-                                poster = download_poster(poster_url)
-                            break
-
-                    show_data.append([poster or '', title])
-
-                # Create table
-                if show_data:
-                    table = Table(show_data, colWidths=[1*inch, 6*inch])
-                    table.setStyle(TableStyle([
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-                        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-                        ('TOPPADDING', (0, 0), (-1, -1), 4),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-                        ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                    ]))
-                    story.append(table)
-            else:
-                # Simple text list
-                for show in shows:
-                    year = show.get('year', '')
-                    seasons = show.get('seasonCount', 0)
-                    title = f"{show.get('title', 'Unknown')} ({year})" if year else show.get('title', 'Unknown')
-                    title += f" - {seasons} season{'s' if seasons != 1 else ''}"
-                    story.append(Paragraph(f"• {title}", normal_style))
+            story.extend(_section_flowables(shows, _show_label, include_images, normal_style))
 
     # Build PDF
     doc.build(story)
@@ -3,25 +3,480 @@ RipForge Ripping Engine
 Handles disc detection, MakeMKV control, and rip job management
 """
 
+import copy
+import fcntl
 import os
 import glob
+import hashlib
 import re
+import select
+import signal
+import struct
 import subprocess
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import json
+import operator
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List, Callable
+from typing import Optional, Dict, List, Callable, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
+try:
+    from enum import StrEnum
+except ImportError:  # Python 3.10
+    class StrEnum(str, Enum):
+        """Minimal StrEnum backport: members are (and print as) their values"""
+
+        def __str__(self):
+            return self.value
+
 from . import activity
 from . import config
 from . import community_db
 from . import email as email_utils
 from . import error_detection
+from .identify import read_mkv_duration
+
+
+# MakeMKV robot-mode info lines, e.g. CINFO:2,0,"LABEL" / TINFO:0,9,0,"1:45:30" /
+# SINFO:0,1,3,0,"eng" - found with finditer over the whole info output, then
+# dispatched on the field id. Matched as bytes; only values that end up as
+# strings get decoded.
+_CINFO_RE = re.compile(rb'^CINFO:(\d+),\d+,"([^"]*)"', re.MULTILINE)
+_TINFO_RE = re.compile(rb'^TINFO:(\d+),(\d+),\d+,"([^"]*)"', re.MULTILINE)
+_SINFO_RE = re.compile(rb'^SINFO:(\d+),(\d+),(\d+),\d+,"([^"]*)"', re.MULTILINE)
+INFO_OUTPUT_MAX_BYTES = 16 << 20  # makemkvcon info output is normally well under 2 MiB
+
+# Text-mode MakeMKV output (version/license check and rip messages)
+_VERSION_RE = re.compile(r'MakeMKV v(\d+\.\d+\.\d+)')
+_EVAL_DAYS_RE = re.compile(r'(\d+) day\(s\) out of (\d+) remaining')
+_FILE_URL_RE = re.compile(r'file://(/[^\s]+)')
+
+_UNSAFE_NAME_CHARS_RE = re.compile(r'[<>"|?*]')  # Problematic for MakeMKV/filesystems
+_WHITESPACE_RE = re.compile(r'\s+')
+_LEADING_DIGITS_RE = re.compile(r'\d+')
+_BLKID_LABEL_RE = re.compile(r'LABEL="([^"]*)"')
+
+PROGRESS_MIN_INTERVAL = 1.0  # seconds between MakeMKV PRGV progress callbacks
+OUTPUT_IDLE_TICK = 5  # seconds of MakeMKV silence before the size poll/heartbeat run anyway
+MAKEMKV_RUNNING_TTL = 1.5  # seconds to reuse a makemkvcon process lookup
+STATUS_SAMPLE_INTERVAL = 1.0  # seconds between background size/progress samples while ripping
+MAKEMKV_EXIT_GRACE = 5  # seconds MakeMKV must stay gone before post-processing (TV rips restart it per episode)
+CORRUPTION_SAMPLE_SIZE = 10  # corrupt-data MSGs kept and logged per run (a bad disc can emit thousands)
+
+# Common makemkvcon exit codes, for rip failure messages
+MAKEMKV_ERROR_CODES = {
+    1: "General error",
+    2: "Invalid argument",
+    12: "Disc read error - disc may be damaged or dirty",
+    13: "Drive error",
+    15: "Copy protection error"
+}
+CDROMEJECT = 0x5309  # linux/cdrom.h tray-eject ioctl
+DISC_INFO_CACHE_TTL = 600  # seconds - makemkvcon info scans of the same disc
+_disc_info_cache: Dict[tuple, Tuple[float, Dict]] = {}
+
+
+def _dir_size(path: str, suffix: str = "", recursive: bool = False) -> int:
+    """Total size of the regular files in a directory, optionally only *suffix.
+
+    os.scandir gets file types from the directory read itself, so the only
+    per-file syscall left is the stat for st_size. Subdirectories go on an
+    explicit stack rather than recursing; unreadable ones count as empty.
+    """
+    total = 0
+    pending = [path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        if entry.name.endswith(suffix):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            continue  # Missing, or removed mid-walk
+    return total
+
+
+def _has_files(path: str, suffix: str = "") -> bool:
+    """True if a directory holds any regular *suffix file (False if it's missing)"""
+    try:
+        with os.scandir(path) as entries:
+            return any(entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False)
+                       for entry in entries)
+    except OSError:
+        return False
+
+
+def _newest_file(path: str, suffix: str = "") -> Optional[str]:
+    """Most recently modified regular *suffix file in a directory, None if there isn't one"""
+    newest, newest_mtime = None, 0.0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False):
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                    if newest is None or mtime > newest_mtime:
+                        newest, newest_mtime = entry.path, mtime
+    except OSError:
+        return None
+    return newest
+
+
+def _recent_mkv_dir(base: str, cutoff: float) -> Optional[str]:
+    """First subdirectory of base holding an MKV modified after cutoff, or None"""
+    try:
+        with os.scandir(base) as entries:
+            subdirs = [entry.path for entry in entries if entry.is_dir()]
+    except OSError:
+        return None
+
+    for subdir in subdirs:
+        try:
+            with os.scandir(subdir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".mkv") and entry.stat().st_mtime > cutoff:
+                        return subdir
+        except OSError:
+            continue
+    return None
+
+
+def _file_sizes(path: str, suffix: str = "") -> Dict[str, int]:
+    """{path: size} for the regular *suffix files in a directory, one scandir pass"""
+    with os.scandir(path) as entries:
+        return {entry.path: entry.stat(follow_symlinks=False).st_size for entry in entries
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith(suffix)}
+
+
+class _BackupSizeTracker:
+    """Running total of a MakeMKV backup folder for progress polling.
+
+    A rescan of the whole BDMV tree every poll is O(files) each time. Directories
+    are only re-listed when their mtime changes (an entry was added), and since
+    MakeMKV copies files one after another, files that existed before the newest
+    one appeared are finished and never stat'ed again. Use _dir_size() for the
+    final, exact total.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._listings: Dict[str, Tuple[int, List[str], List[str]]] = {}  # dir -> (mtime_ns, subdirs, files)
+        self._sizes: Dict[str, int] = {}  # file -> last seen size
+        self._open: set = set()  # files that may still be growing
+        self._settled_total = 0
+
+    def _list(self, path: str, new_files: List[str]):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+        cached = self._listings.get(path)
+        if cached is None or cached[0] != mtime:
+            subdirs, files = [], []
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        files.append(entry.path)
+                        if entry.path not in self._sizes:
+                            new_files.append(entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+            # A listing taken in the same second as the last change may miss
+            # entries created a moment later with the same mtime, so re-list it
+            racy = time.time_ns() - mtime < 1_000_000_000
+            cached = self._listings[path] = (-1 if racy else mtime, subdirs, files)
+        for subdir in cached[1]:
+            self._list(subdir, new_files)
+
+    def total(self) -> int:
+        """Current size of the backup in bytes"""
+        new_files: List[str] = []
+        self._list(self.root, new_files)
+
+        for path in list(self._open):
+            try:
+                self._sizes[path] = os.stat(path).st_size
+            except OSError:
+                pass
+            if new_files:
+                # A newer file has been started, so this one is complete
+                self._open.discard(path)
+                self._settled_total += self._sizes.get(path, 0)
+        for path in new_files:
+            try:
+                self._sizes[path] = os.stat(path).st_size
+            except OSError:
+                self._sizes[path] = 0
+            self._open.add(path)
+
+        return self._settled_total + sum(self._sizes[path] for path in self._open)
+
+
+class _MkvGrowthWatcher:
+    """Largest MKV size in a rip folder, for the no-PRGV progress fallback.
+
+    The folder is only re-listed when its mtime changes (MakeMKV created a
+    file); otherwise a poll is a stat of the folder and of the file being
+    written, rather than a fresh scan of every entry.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._mtime = None
+        self.sizes: Dict[str, int] = {}  # MKV path -> last seen size
+        self._growing: Optional[str] = None
+
+    def largest_size(self) -> int:
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime != self._mtime:
+            self.sizes = _file_sizes(self.path, ".mkv")
+            # A listing in the same second as the change may miss a file created
+            # a moment later with the same mtime, so re-list next time
+            self._mtime = None if time.time_ns() - mtime < 1_000_000_000 else mtime
+            self._growing = max(self.sizes, key=self.sizes.get, default=None)
+        elif self._growing is not None:
+            try:
+                self.sizes[self._growing] = os.stat(self._growing).st_size
+            except OSError:
+                self._mtime = None
+        return max(self.sizes.values(), default=0)
+
+
+def clear_disc_info_cache():
+    """Drop cached disc scans (on eject, so the next disc is always rescanned)"""
+    _disc_info_cache.clear()
+
+
+def _udev_fs_ids(device: str) -> bytes:
+    """ID_FS_LABEL/ID_FS_UUID lines from the device's udev record (empty if unavailable)
+
+    udev refreshes the record on media change, so it follows a disc swapped
+    with the drive button rather than by our own eject.
+    """
+    try:
+        rdev = os.stat(device).st_rdev
+        if not rdev:
+            return b""
+        with open(f"/run/udev/data/b{os.major(rdev)}:{os.minor(rdev)}", "rb") as f:
+            return b"".join(line for line in f if line.startswith((b"E:ID_FS_LABEL=", b"E:ID_FS_UUID=")))
+    except OSError:
+        return b""
+
+
+def _udf_volume_ids(fd: int) -> bytes:
+    """Identifier fields and recording time from the UDF volume descriptors
+
+    Follows the anchor at sector 256 to the main volume descriptor sequence and
+    keeps the PVD volume id, volume set id (which starts with a unique hex
+    stamp) and recording time, plus the LVD logical volume id. Returns b"" for
+    discs without UDF.
+    """
+    anchor = os.pread(fd, 2048, 256 * 2048)
+    if len(anchor) < 24 or struct.unpack_from('<H', anchor)[0] != 2:  # Anchor Volume Descriptor Pointer
+        return b""
+    length, location = struct.unpack_from('<II', anchor, 16)
+    sequence = os.pread(fd, min(length, 16 * 2048), location * 2048)
+    ids = []
+    for offset in range(0, len(sequence) - 2047, 2048):
+        tag = struct.unpack_from('<H', sequence, offset)[0]
+        if tag == 1:  # Primary Volume Descriptor
+            ids.append(sequence[offset + 24:offset + 200])  # volume id + volume set id
+            ids.append(sequence[offset + 376:offset + 388])  # recording date and time
+        elif tag == 6:  # Logical Volume Descriptor
+            ids.append(sequence[offset + 84:offset + 212])  # logical volume id
+        elif tag == 8:  # Terminating Descriptor
+            break
+    return b"".join(ids)
+
+
+def _disc_identity(device: str) -> Optional[str]:
+    """SHA-1 identifying the inserted disc, or None if the device can't be read.
+
+    Combines the udev filesystem label/UUID, the sector at 32 KiB (ISO 9660
+    volume descriptor: volume id, creation time) and the UDF volume
+    identifiers. On UDF-only Blu-rays the 32 KiB sector is the same BEA01
+    marker on every disc, so the UDF fields are what tell those apart.
+    """
+    try:
+        fd = os.open(device, os.O_RDONLY | os.O_NONBLOCK)
+        try:
+            sector = os.pread(fd, 2048, 0x8000)
+            udf_ids = _udf_volume_ids(fd) if sector else b""
+        finally:
+            os.close(fd)
+    except (OSError, struct.error):
+        return None
+    if not sector:
+        return None
+    return hashlib.sha1(_udev_fs_ids(device) + sector + udf_ids).hexdigest()
+
+
+def _read_lines(stream, idle_tick: float):
+    """Yield lines from a binary pipe, or None after each idle_tick seconds of silence.
+
+    MakeMKV can go quiet for minutes (disc spin-up, copy protection), and a
+    blocking readline would stall the size fallback and heartbeat with it.
+    """
+    fd = stream.fileno()
+    poller = select.poll()
+    poller.register(fd, select.POLLIN)
+    pending = b""
+    while True:
+        if not poller.poll(idle_tick * 1000):
+            yield None
+            continue
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).split(b"\n")
+        yield from lines
+    if pending:
+        yield pending
+
+
+def _makemkvcon_pids() -> List[int]:
+    """PIDs of running makemkvcon processes, oldest first, read from /proc like pgrep"""
+    pids = []
+    try:
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f"/proc/{entry.name}/comm", "rb") as f:
+                        if b"makemkvcon" in f.read():
+                            pids.append(int(entry.name))
+                except OSError:
+                    continue  # Exited while we were looking
+    except OSError:
+        return []
+    return sorted(pids)
+
+
+def _makemkvcon_argv() -> Optional[Tuple[int, List[str]]]:
+    """(pid, argv) of the oldest running makemkvcon"""
+    for pid in _makemkvcon_pids():
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                argv = f.read().rstrip(b"\0").split(b"\0")
+        except OSError:
+            continue  # Exited since the scan
+        return pid, [os.fsdecode(arg) for arg in argv]
+    return None
+
+
+def _eject_ioctl(device: str) -> bool:
+    """Open the tray with CDROMEJECT; False if that didn't work (callers fall back to eject)"""
+    try:
+        fd = os.open(device, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return False
+    try:
+        fcntl.ioctl(fd, CDROMEJECT)
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def _parse_prgv(line: bytes) -> Optional[Tuple[int, int, int]]:
+    """(current, total, max) from a PRGV:current,total,max progress line, None if malformed"""
+    try:
+        current, total, max_val = line[5:].split(b',', 2)
+        return int(current), int(total), int(max_val)
+    except ValueError:
+        return None
+
+
+def _parse_msg(line: bytes) -> Optional[str]:
+    """Message text from a MSG:code,flags,count,"message",... line, None if malformed.
+
+    Only the message itself is decoded; the rest of the line stays bytes.
+    """
+    fields = line[4:].split(b',', 3)
+    if len(fields) < 4 or not fields[3].startswith(b'"'):
+        return None
+    end = fields[3].find(b'"', 1)
+    return _mkv_text(fields[3][1:end]) if end != -1 else None
+
+
+def _mkv_text(value: bytes) -> str:
+    """Decode a quoted MakeMKV value (UTF-8; disc and language names may be non-ASCII)"""
+    return value.decode("utf-8", "replace")
+
+
+def _video_duration(path: str) -> float:
+    """Duration of a video file in seconds, 0 if unknown.
+
+    MKV output is read straight from its Segment Info header; ffprobe is only
+    spawned for other containers or headers without a Duration. ffprobe
+    timeouts propagate so callers keep their own handling.
+    """
+    if path.endswith('.mkv'):
+        duration = read_mkv_duration(path)
+        if duration:
+            return duration
+
+    result = subprocess.run([
+        "ffprobe", "-v", "error", "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1", path
+    ], capture_output=True, text=True, timeout=30)
+    if result.returncode != 0:
+        return 0.0
+    try:
+        return float(result.stdout.strip())
+    except ValueError:
+        return 0.0  # "N/A" for streams without a container duration
+
+
+def _parse_makemkv_duration(duration_str: str) -> Optional[int]:
+    """Convert a MakeMKV duration ("1:45:30" or "45:30") to seconds, None if malformed"""
+    try:
+        parts = duration_str.split(":")
+        if len(parts) == 3:
+            return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+        if len(parts) == 2:
+            return int(parts[0]) * 60 + int(parts[1])
+        return 0
+    except ValueError:
+        return None
+
+
+_NO_PLAYLIST = 10 ** 9  # Sorts tracks without a numbered playlist last
+
+
+def _playlist_number(playlist: str) -> int:
+    """Numeric id of a playlist name ("00800.mpls" -> 800) for angle ordering"""
+    digits = _LEADING_DIGITS_RE.match(playlist or "")
+    return int(digits.group()) if digits else _NO_PLAYLIST
+
+
+def _rip_step_detail(backup_method: bool, backup_phase_complete: bool, pct: int) -> str:
+    """Rip step detail for a size-based progress percent.
+
+    Backup rips spend 0-50% copying the disc and 50-100% extracting, so each
+    phase is shown rescaled to its own 0-100.
+    """
+    if not backup_method:
+        return f"Direct ({pct}%)"
+    if backup_phase_complete:
+        return f"Copying (✓) → Extracting ({max(0, (pct - 50) * 2)}%)"
+    return f"Copying ({min(pct * 2, 100)}%) → Extracting (--)"
+
+
+def _part_filenames(mkv_files: List[str], base_name: str) -> List[Tuple[str, str]]:
+    """(source, new filename) pairs: "<base>.mkv", or "<base> - Part N.mkv" for multi-file rips"""
+    if len(mkv_files) == 1:
+        return [(mkv_files[0], f"{base_name}.mkv")]
+    return [(mkv_file, f"{base_name} - Part {idx}.mkv") for idx, mkv_file in enumerate(mkv_files, 1)]
 
 
 def sanitize_folder_name(name: str) -> str:
@@ -29,12 +484,18 @@ def sanitize_folder_name(name: str) -> str:
 
     Removes/replaces characters that cause issues with MakeMKV or filesystems.
     """
+    # Fast path: most titles have nothing to clean. isprintable() rules out all
+    # whitespace except plain spaces, so the whitespace collapse would be a no-op
+    if (name.isprintable() and "  " not in name and name == name.strip()
+            and not any(c in name for c in ':<>"|?*')):
+        return name
+
     # Replace colons with dashes (common in movie titles like "Star Wars: The Rise of Skywalker")
     name = name.replace(':', ' -')
     # Remove other problematic characters
-    name = re.sub(r'[<>"|?*]', '', name)
+    name = _UNSAFE_NAME_CHARS_RE.sub('', name)
     # Clean up multiple spaces
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _WHITESPACE_RE.sub(' ', name).strip()
     return name
 
 
@@ -54,19 +515,27 @@ def set_default_audio_track(mkv_path: str, preferred_lang: str = "eng") -> bool:
         return True  # Don't modify if user wants all languages as-is
 
     try:
-        # Get audio track info with ffprobe
+        # Get audio track index, default flag and language with ffprobe,
+        # one "index,default,language" line per track
         result = subprocess.run([
-            "ffprobe", "-v", "quiet", "-print_format", "json",
-            "-show_streams", "-select_streams", "a", mkv_path
+            "ffprobe", "-v", "quiet", "-select_streams", "a",
+            "-show_entries", "stream=index:stream_disposition=default:stream_tags=language",
+            "-of", "csv=p=0", mkv_path
         ], capture_output=True, text=True, timeout=30)
 
         if result.returncode != 0:
             activity.log_warning(f"ffprobe failed for {mkv_path}")
             return False
 
-        import json as json_module
-        data = json_module.loads(result.stdout)
-        streams = data.get("streams", [])
+        streams = []
+        for line in result.stdout.splitlines():
+            fields = line.strip().split(',')
+            if fields[0]:
+                streams.append({
+                    "index": int(fields[0]),
+                    "default": len(fields) > 1 and fields[1] == "1",
+                    "language": (fields[2] if len(fields) > 2 else "") or "und"
+                })
 
         if not streams:
             return True  # No audio tracks to modify
@@ -74,32 +543,29 @@ def set_default_audio_track(mkv_path: str, preferred_lang: str = "eng") -> bool:
         # Find the first track matching preferred language
         preferred_track_idx = None
         for stream in streams:
-            lang = stream.get("tags", {}).get("language", "und")
-            if lang == preferred_lang:
+            if stream["language"] == preferred_lang:
                 # MKV track numbers are 1-indexed, and we need to count from video
                 # ffprobe index is 0-indexed overall, audio tracks start after video
-                preferred_track_idx = stream.get("index")
+                preferred_track_idx = stream["index"]
                 break
 
         if preferred_track_idx is None:
             activity.log_info(f"No {preferred_lang} audio track found in {os.path.basename(mkv_path)}")
             return True  # No matching track, leave as-is
 
-        # Build mkvpropedit commands to set default flags
-        # First, clear all audio track default flags, then set the preferred one
+        # Build mkvpropedit edits, touching only flags that actually change:
+        # clear other audio tracks that are default, then set the preferred one
         cmd = ["mkvpropedit", mkv_path]
-
-        # Count audio tracks to clear their default flags
         for i, stream in enumerate(streams):
             track_num = i + 1  # mkvpropedit uses 1-indexed audio track numbers
-            cmd.extend(["--edit", f"track:a{track_num}", "--set", "flag-default=0"])
+            if stream["index"] == preferred_track_idx:
+                if not stream["default"]:
+                    cmd.extend(["--edit", f"track:a{track_num}", "--set", "flag-default=1"])
+            elif stream["default"]:
+                cmd.extend(["--edit", f"track:a{track_num}", "--set", "flag-default=0"])
 
-        # Find which audio track number corresponds to our preferred language
-        for i, stream in enumerate(streams):
-            if stream.get("index") == preferred_track_idx:
-                track_num = i + 1
-                cmd.extend(["--edit", f"track:a{track_num}", "--set", "flag-default=1"])
-                break
+        if len(cmd) == 2:
+            return True  # Already the only default - skip rewriting the file
 
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
 
@@ -118,22 +584,63 @@ def set_default_audio_track(mkv_path: str, preferred_lang: str = "eng") -> bool:
         return False
 
 
-def check_file_integrity(mkv_path: str, progress_callback=None) -> dict:
-    """Check MKV file for corruption using spot-check decode test.
+INTEGRITY_XATTR = "user.ripforge.integrity"  # Cached spot-check result on the MKV itself
 
-    Instead of decoding the entire file (slow, can hang on warning spam),
-    decodes 10 random 5-second segments across the file. This catches
-    most real corruption while completing in under a minute.
 
-    Catches issues like:
-    - H.264 macroblock decode errors
-    - Audio decode failures
+def _read_integrity_marker(mkv_path: str, deep: bool) -> Optional[dict]:
+    """Cached integrity result for an unchanged file, or None.
+
+    The marker records the file's size and mtime when it was checked; any
+    rewrite changes those and invalidates it. A deep result also answers a
+    demux-only check, not the other way round.
+    """
+    try:
+        st = os.stat(mkv_path)
+        marker = json.loads(os.getxattr(mkv_path, INTEGRITY_XATTR))
+    except (OSError, AttributeError, ValueError):
+        return None  # No marker, no xattr support, or not Linux
+    if marker.get("size") != st.st_size or marker.get("mtime_ns") != st.st_mtime_ns:
+        return None
+    if deep and not marker.get("deep"):
+        return None
+    return marker.get("result")
+
+
+def _write_integrity_marker(mkv_path: str, deep: bool, result: dict):
+    """Store an integrity result on the file (best effort)"""
+    try:
+        st = os.stat(mkv_path)
+        marker = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "deep": deep, "result": result}
+        os.setxattr(mkv_path, INTEGRITY_XATTR, json.dumps(marker).encode())
+    except (OSError, AttributeError):
+        pass
+
+
+def check_file_integrity(mkv_path: str, progress_callback=None, deep: bool = False,
+                         threads: int = 0) -> dict:
+    """Check MKV file for corruption using a spot-check of 10 segments.
+
+    Instead of reading the entire file (slow, can hang on warning spam),
+    checks 10 5-second segments spread across the file.
+
+    By default each segment is only demuxed (-c copy): FFmpeg parses the
+    packets without running the video/audio decoders, which catches:
     - Truncated files
+    - Container/packet errors
     - Missing keyframes
 
+    With deep=True the segments are fully decoded, which also catches:
+    - H.264 macroblock decode errors
+    - Audio decode failures
+
+    Results are cached in a user xattr on the file, so re-checking an
+    unchanged file (e.g. after a move) skips FFmpeg entirely.
+
     Args:
         mkv_path: Path to the MKV file to check
         progress_callback: Optional callback(percent) for progress updates
+        deep: Decode segments instead of demuxing them (slower, more CPU)
+        threads: Decoder threads for deep checks (0 = one per core)
 
     Returns:
         dict with keys:
@@ -153,18 +660,15 @@ def check_file_integrity(mkv_path: str, progress_callback=None) -> dict:
         result["error_count"] = 1
         return result
 
-    try:
-        # Get file duration
-        duration_result = subprocess.run([
-            "ffprobe", "-v", "quiet", "-print_format", "json",
-            "-show_entries", "format=duration", mkv_path
-        ], capture_output=True, text=True, timeout=30)
+    cached = _read_integrity_marker(mkv_path, deep)
+    if cached is not None:
+        activity.log_info(f"INTEGRITY: {os.path.basename(mkv_path)} unchanged since last check, reusing result")
+        if progress_callback:
+            progress_callback(100)
+        return cached
 
-        total_duration = 0
-        if duration_result.returncode == 0:
-            import json as json_module
-            data = json_module.loads(duration_result.stdout)
-            total_duration = float(data.get("format", {}).get("duration", 0))
+    try:
+        total_duration = _video_duration(mkv_path)
 
         if total_duration < 10:
             # Very short file - just validate container
@@ -173,13 +677,18 @@ def check_file_integrity(mkv_path: str, progress_callback=None) -> dict:
                 progress_callback(100)
             return result
 
-        # Spot-check: decode 10 segments of 5 seconds each across the file
+        # Spot-check: 10 segments of 5 seconds each across the file
         # Positions: 5%, 15%, 25%, ... 95% of duration
         num_spots = 10
         spot_duration = 5  # seconds per spot
         errors = []
+        # Demux-only unless a deep check was asked for; decoding is frame/slice
+        # threaded (-threads is an input option, so it goes before -i)
+        input_args = ["-threads", str(threads)] if deep else []
+        codec_args = [] if deep else ["-c", "copy"]
 
-        activity.log_info(f"INTEGRITY: Spot-checking {os.path.basename(mkv_path)} ({num_spots} segments)")
+        activity.log_info(f"INTEGRITY: Spot-checking {os.path.basename(mkv_path)} "
+                          f"({num_spots} segments, {'decode' if deep else 'demux'})")
 
         for i in range(num_spots):
             # Calculate position (5%, 15%, 25%, ... 95%)
@@ -190,21 +699,26 @@ def check_file_integrity(mkv_path: str, progress_callback=None) -> dict:
             if progress_callback:
                 progress_callback(int((i / num_spots) * 100))
 
-            # Decode this segment with timeout
+            # Check this segment with timeout
             try:
+                # Only stderr carries anything (the null muxer writes nothing), so
+                # stdout isn't piped; -nostdin stops ffmpeg polling for keypresses
                 proc = subprocess.run(
-                    ["ffmpeg", "-v", "error", "-ss", str(int(seek_time)),
-                     "-i", mkv_path, "-t", str(spot_duration), "-f", "null", "-"],
-                    capture_output=True,
+                    ["ffmpeg", "-nostdin", "-v", "error", *input_args, "-ss", str(int(seek_time)),
+                     "-i", mkv_path, "-t", str(spot_duration), *codec_args, "-f", "null", "-"],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
                     timeout=30  # 30 second timeout per segment
                 )
 
-                # Collect errors (ignore DTS warnings - they're cosmetic)
+                # Collect errors (ignore DTS warnings - they're cosmetic). ffmpeg
+                # prints that warning in fixed lowercase, so no need to lower()
                 if proc.stderr:
                     for line in proc.stderr.strip().split('\n'):
                         line = line.strip()
-                        if line and "non monotonically increasing dts" not in line.lower():
+                        if line and "non monotonically increasing dts" not in line:
                             errors.append(f"@{position_pct}%: {line}")
 
             except subprocess.TimeoutExpired:
@@ -220,6 +734,8 @@ def check_file_integrity(mkv_path: str, progress_callback=None) -> dict:
         else:
             activity.log_info(f"INTEGRITY: {os.path.basename(mkv_path)} passed spot-check ({num_spots} segments OK)")
 
+        _write_integrity_marker(mkv_path, deep, result)
+
         if progress_callback:
             progress_callback(100)
 
@@ -239,7 +755,16 @@ def check_file_integrity(mkv_path: str, progress_callback=None) -> dict:
         return result
 
 
-class RipStatus(Enum):
+def integrity_options(cfg: dict) -> dict:
+    """check_file_integrity keyword arguments from the ripping config"""
+    ripping_cfg = cfg.get('ripping', {})
+    return {
+        'deep': ripping_cfg.get('integrity_deep_check', False),
+        'threads': ripping_cfg.get('integrity_threads', 0),
+    }
+
+
+class RipStatus(StrEnum):
     IDLE = "idle"
     DETECTING = "detecting"
     SCANNING = "scanning"
@@ -250,22 +775,26 @@ class RipStatus(Enum):
     ERROR = "error"
 
 
-class StepStatus(Enum):
+class StepStatus(StrEnum):
     PENDING = "pending"
     ACTIVE = "active"
     COMPLETE = "complete"
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class RipStep:
     status: str = "pending"
     detail: str = ""
 
 
-@dataclass
+# Pipeline steps shown in the UI, in order
+RIP_STEP_NAMES = ("insert", "detect", "scan", "rip", "verify", "identify", "library", "move", "scan-plex")
+
+
+@dataclass(slots=True)
 class RipJob:
-    """Represents an active or completed rip job"""
+    """Represents an active or completed rip job (slotted - polled every second by the UI)"""
     id: str = ""
     disc_label: str = ""
     disc_type: str = ""  # dvd, bluray, unknown
@@ -323,17 +852,24 @@ class RipJob:
     disc_tracks: List[dict] = field(default_factory=list)
     disc_track_sizes: Dict[int, int] = field(default_factory=dict)
     disc_cinfo_raw: Dict[str, str] = field(default_factory=dict)
-    steps: Dict[str, RipStep] = field(default_factory=lambda: {
-        "insert": RipStep(),
-        "detect": RipStep(),
-        "scan": RipStep(),
-        "rip": RipStep(),
-        "verify": RipStep(),
-        "identify": RipStep(),
-        "library": RipStep(),
-        "move": RipStep(),
-        "scan-plex": RipStep(),
-    })
+    disc_fingerprint: str = ""  # SHA-1 of the CINFO lines
+    steps: Dict[str, RipStep] = field(default_factory=lambda: {name: RipStep() for name in RIP_STEP_NAMES})
+    _folder_label: Tuple[str, str] = field(default=("", ""), repr=False)  # (disc_label, sanitized) memo
+    _fallback_title: Tuple[str, str] = field(default=("", ""), repr=False)  # (disc_label, title) memo
+
+    @property
+    def folder_label(self) -> str:
+        """disc_label sanitized for the raw/backup folder names, re-derived only when the label changes"""
+        if self._folder_label[0] != self.disc_label:
+            self._folder_label = (self.disc_label, sanitize_folder_name(self.disc_label))
+        return self._folder_label[1]
+
+    @property
+    def fallback_title(self) -> str:
+        """Title guessed from the disc label, re-derived only when the label changes"""
+        if self._fallback_title[0] != self.disc_label:
+            self._fallback_title = (self.disc_label, self.disc_label.replace("_", " ").title())
+        return self._fallback_title[1]
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
@@ -342,7 +878,7 @@ class RipJob:
             "disc_label": self.disc_label,
             "disc_type": self.disc_type,
             "device": self.device,
-            "status": self.status.value if isinstance(self.status, RipStatus) else self.status,
+            "status": self.status,
             "progress": self.progress,
             "eta": self.eta,
             "started_at": self.started_at,
@@ -382,29 +918,64 @@ class RipJob:
         }
 
 
+@dataclass(slots=True)
+class _MakeMKVOutput:
+    """What MakeMKV._follow_output() collected from a makemkvcon run"""
+    return_code: int = 0
+    line_count: int = 0
+    prgv_count: int = 0
+    msg_count: int = 0
+    last_error: str = ""
+    output_path: Optional[str] = None  # From the "Saving ... into directory" MSG
+    corruption_count: int = 0
+    corruption_warnings: List[str] = field(default_factory=list)  # First CORRUPTION_SAMPLE_SIZE only
+
+
 class MakeMKV:
     """Wrapper for MakeMKV command-line interface"""
 
     def __init__(self, use_docker: bool = False, container_name: str = "arm"):
         self.use_docker = use_docker
         self.container_name = container_name
+        self.rip_process: Optional[subprocess.Popen] = None  # Last rip/backup handed to _follow_output
+
+    def _run_cmd(self, args: List[str], callback: Optional[Callable] = None,
+                 binary: bool = False) -> subprocess.Popen:
+        """Run makemkvcon with optional progress callback.
 
-    def _run_cmd(self, args: List[str], callback: Optional[Callable] = None) -> subprocess.Popen:
-        """Run makemkvcon with optional progress callback"""
+        binary=True gives raw bytes output for the info scan and rip/backup
+        parsers; otherwise stdout is UTF-8 text. Both are fully buffered - the text
+        reader still hands back lines as soon as MakeMKV writes them, since
+        it fills its buffer with read1() rather than waiting for a full block.
+        """
         if self.use_docker:
             cmd = ["docker", "exec", self.container_name, "makemkvcon"] + args
         else:
             cmd = ["makemkvcon"] + args
 
+        if binary:
+            return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
-            bufsize=1
+            encoding='utf-8',
+            errors='replace',  # Disc/track names aren't always valid UTF-8
+            bufsize=-1
         )
         return process
 
+    def _read_info_output(self, args: List[str]) -> bytes:
+        """Run an info scan and return its whole robot-mode output in one read"""
+        process = self._run_cmd(args, binary=True)
+        data = process.stdout.read(INFO_OUTPUT_MAX_BYTES)
+        # Past the cap makemkvcon gets SIGPIPE instead of blocking the wait
+        process.stdout.close()
+        process.wait()
+        return data
+
     def get_makemkv_info(self) -> Dict:
         """Get MakeMKV version and license information.
 
@@ -433,13 +1004,13 @@ class MakeMKV:
 
                 # Parse version: MSG:1005,0,1,"MakeMKV v1.18.3 linux(x64-release) started"
                 if line.startswith("MSG:1005,"):
-                    match = re.search(r'MakeMKV v(\d+\.\d+\.\d+)', line)
+                    match = _VERSION_RE.search(line)
                     if match:
                         info["version"] = match.group(1)
 
                 # Parse evaluation: MSG:5050,0,2,"Evaluation version, 13 day(s) out of 30 remaining"
                 if line.startswith("MSG:5050,"):
-                    match = re.search(r'(\d+) day\(s\) out of (\d+) remaining', line)
+                    match = _EVAL_DAYS_RE.search(line)
                     if match:
                         info["days_remaining"] = int(match.group(1))
                         info["license_type"] = "evaluation"
@@ -476,6 +1047,10 @@ class MakeMKV:
     def get_disc_info(self, device: str = "/dev/sr0", config: dict = None) -> Dict:
         """Get information about the disc in the drive.
 
+        Successful scans are cached for DISC_INFO_CACHE_TTL, keyed by the disc's
+        volume descriptor hash, so repeat calls for the same inserted disc skip
+        the (30-90s) makemkvcon scan.
+
         Args:
             device: Optical drive device path
             config: Optional config dict for TV episode detection thresholds
@@ -483,6 +1058,31 @@ class MakeMKV:
         Returns:
             Dict with disc info including episode_tracks for TV detection
         """
+        identity = _disc_identity(device)
+        if identity is None:
+            # No readable media - whatever was cached belongs to a disc that's gone
+            clear_disc_info_cache()
+            return self._scan_disc_info(device, config)
+
+        ripping_cfg = (config or {}).get('ripping', {})
+        key = (device, identity,
+               ripping_cfg.get('tv_min_episode_length'),
+               ripping_cfg.get('tv_max_episode_length'),
+               ripping_cfg.get('preferred_language'))
+        now = time.monotonic()
+        cached = _disc_info_cache.get(key)
+        if cached and now - cached[0] < DISC_INFO_CACHE_TTL:
+            activity.log_info(f"DISC: Using cached scan for {cached[1]['disc_label'] or device}")
+            return copy.deepcopy(cached[1])
+
+        info = self._scan_disc_info(device, config)
+        # Only cache real reads - an empty result means the drive wasn't ready
+        if info["tracks"] or info["disc_label"]:
+            _disc_info_cache[key] = (now, copy.deepcopy(info))
+        return info
+
+    def _scan_disc_info(self, device: str, config: dict = None) -> Dict:
+        """Run makemkvcon info on the disc and parse the result (uncached)"""
         # Get TV detection thresholds from config or use defaults
         tv_min = 1200  # 20 min default
         tv_max = 3600  # 60 min default
@@ -499,7 +1099,8 @@ class MakeMKV:
             "track_sizes": {},  # Track index -> size in bytes
             "episode_tracks": [],  # Tracks that look like TV episodes (20-60 min)
             "is_tv_disc": False,  # True if multiple episode-length tracks detected
-            "cinfo_raw": {},  # Raw CINFO fields for disc fingerprinting
+            "cinfo_raw": {},  # Raw CINFO fields for disc data capture
+            "cinfo_fingerprint": "",  # SHA-1 over the CINFO lines, hashed as they stream in
             "needs_angle_selection": False,  # True if user needs to choose angle
             "angle_candidates": []  # Details of angles for user selection
         }
@@ -514,139 +1115,95 @@ class MakeMKV:
             disc_num = int(device.replace("/dev/sr", ""))
 
         args = ["-r", "info", f"disc:{disc_num}"]
-        process = self._run_cmd(args)
+        data = self._read_info_output(args)
 
         longest_track = {"index": None, "duration": 0, "playlist": ""}
         track_playlists = {}  # track_num -> playlist name (e.g., "00800.mpls")
+        fingerprint = hashlib.sha1()
+
+        # Track attributes: TINFO:track,field,code,"value"
+        for match in _TINFO_RE.finditer(data):
+            track_num = int(match.group(1))
+            field_id = int(match.group(2))
+            value = match.group(3)
+
+            if field_id == 9:
+                # Duration: TINFO:0,9,0,"1:45:30"
+                duration_str = _mkv_text(value)
+                duration_secs = _parse_makemkv_duration(duration_str)
+                if duration_secs is not None:
+                    info["tracks"].append({
+                        "index": track_num,
+                        "duration": duration_secs,
+                        "duration_str": duration_str
+                    })
 
-        for line in process.stdout:
-            line = line.strip()
-
-            # Capture all CINFO fields for fingerprinting
-            if line.startswith("CINFO:"):
-                cinfo_match = re.match(r'CINFO:(\d+),\d+,"([^"]*)"', line)
-                if cinfo_match:
-                    info["cinfo_raw"][f"CINFO:{cinfo_match.group(1)}"] = cinfo_match.group(2)
-
-            # Parse disc name: CINFO:2,0,"GUARDIANS_VOL_3"
-            if line.startswith("CINFO:2,0,"):
-                match = re.search(r'CINFO:2,0,"([^"]*)"', line)
-                if match:
-                    info["disc_label"] = match.group(1)
-
-            # Parse disc type: CINFO:1,6xxx,"Blu-ray disc"
-            if "Blu-ray" in line:
-                info["disc_type"] = "bluray"
-            elif "DVD" in line:
-                info["disc_type"] = "dvd"
-
-            # Parse playlist name: TINFO:0,16,0,"00800.mpls"
-            # Important for multi-angle discs (e.g., Star Wars) where different
-            # playlists have different language text burned into video
-            if line.startswith("TINFO:") and ",16,0," in line:
-                match = re.search(r'TINFO:(\d+),16,0,"([^"]*)"', line)
-                if match:
-                    track_num = int(match.group(1))
-                    playlist = match.group(2)
-                    track_playlists[track_num] = playlist
-
-            # Parse track info: TINFO:0,9,0,"1:45:30" (duration)
-            if line.startswith("TINFO:") and ",9,0," in line:
-                match = re.search(r'TINFO:(\d+),9,0,"([^"]*)"', line)
-                if match:
-                    track_num = int(match.group(1))
-                    duration_str = match.group(2)
-
-                    # Parse duration to seconds
-                    try:
-                        parts = duration_str.split(":")
-                        if len(parts) == 3:
-                            duration_secs = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-                        elif len(parts) == 2:
-                            duration_secs = int(parts[0]) * 60 + int(parts[1])
-                        else:
-                            duration_secs = 0
-
-                        info["tracks"].append({
-                            "index": track_num,
-                            "duration": duration_secs,
-                            "duration_str": duration_str
-                        })
-
-                        # Track longest for main feature detection
-                        if duration_secs > longest_track["duration"]:
-                            longest_track = {"index": track_num, "duration": duration_secs}
-                    except:
-                        pass
-
-            # Parse track size: TINFO:0,11,0,"5446510592" (bytes)
-            if line.startswith("TINFO:") and ",11,0," in line:
-                match = re.search(r'TINFO:(\d+),11,0,"(\d+)"', line)
-                if match:
-                    track_num = int(match.group(1))
-                    size_bytes = int(match.group(2))
-                    info["track_sizes"][track_num] = size_bytes
-
-            # Parse stream info: SINFO:title_idx,stream_idx,attr_id,attr_type,"value"
-            # Attribute IDs from MakeMKV:
-            #   1 = stream type ("Video", "Audio", "Subtitles")
-            #   3 = language code (ISO 639-2, e.g., "eng", "spa")
-            #   4 = language name (e.g., "English", "Spanish")
-            #   5 = codec short name (e.g., "DTS-HD MA", "TrueHD")
-            #   39 = default flag (value contains "Default" if default track)
-            if line.startswith("SINFO:"):
-                # SINFO:0,1,1,6202,"Audio" - stream type
-                type_match = re.search(r'SINFO:(\d+),(\d+),1,\d+,"([^"]*)"', line)
-                if type_match:
-                    title_idx = int(type_match.group(1))
-                    stream_idx = int(type_match.group(2))
-                    stream_type = type_match.group(3)
-                    if stream_type == "Audio":
-                        if title_idx not in track_audio_streams:
-                            track_audio_streams[title_idx] = {}
-                        if stream_idx not in track_audio_streams[title_idx]:
-                            track_audio_streams[title_idx][stream_idx] = {
-                                "stream_idx": stream_idx, "lang_code": "", "lang_name": "",
-                                "codec": "", "is_default": False
-                            }
-
-                # SINFO:0,1,3,0,"eng" - language code (ISO 639-2)
-                lang_code_match = re.search(r'SINFO:(\d+),(\d+),3,\d+,"([^"]*)"', line)
-                if lang_code_match:
-                    title_idx = int(lang_code_match.group(1))
-                    stream_idx = int(lang_code_match.group(2))
-                    lang_code = lang_code_match.group(3)
-                    if title_idx in track_audio_streams and stream_idx in track_audio_streams[title_idx]:
-                        track_audio_streams[title_idx][stream_idx]["lang_code"] = lang_code
-
-                # SINFO:0,1,4,0,"English" - language name
-                lang_name_match = re.search(r'SINFO:(\d+),(\d+),4,\d+,"([^"]*)"', line)
-                if lang_name_match:
-                    title_idx = int(lang_name_match.group(1))
-                    stream_idx = int(lang_name_match.group(2))
-                    lang_name = lang_name_match.group(3)
-                    if title_idx in track_audio_streams and stream_idx in track_audio_streams[title_idx]:
-                        track_audio_streams[title_idx][stream_idx]["lang_name"] = lang_name
-
-                # SINFO:0,1,5,0,"DTS-HD MA" - codec short name
-                codec_match = re.search(r'SINFO:(\d+),(\d+),5,\d+,"([^"]*)"', line)
-                if codec_match:
-                    title_idx = int(codec_match.group(1))
-                    stream_idx = int(codec_match.group(2))
-                    codec = codec_match.group(3)
-                    if title_idx in track_audio_streams and stream_idx in track_audio_streams[title_idx]:
-                        track_audio_streams[title_idx][stream_idx]["codec"] = codec
-
-                # SINFO:0,1,39,0,"Default" - default flag
-                default_match = re.search(r'SINFO:(\d+),(\d+),39,\d+,"([^"]*)"', line)
-                if default_match:
-                    title_idx = int(default_match.group(1))
-                    stream_idx = int(default_match.group(2))
-                    is_default = "Default" in default_match.group(3)
-                    if title_idx in track_audio_streams and stream_idx in track_audio_streams[title_idx]:
-                        track_audio_streams[title_idx][stream_idx]["is_default"] = is_default
+                    # Track longest for main feature detection
+                    if duration_secs > longest_track["duration"]:
+                        longest_track = {"index": track_num, "duration": duration_secs}
+            elif field_id == 11:
+                # Size: TINFO:0,11,0,"5446510592" (bytes)
+                if value.isdigit():
+                    info["track_sizes"][track_num] = int(value)
+            elif field_id == 16:
+                # Playlist name: TINFO:0,16,0,"00800.mpls"
+                # Important for multi-angle discs (e.g., Star Wars) where different
+                # playlists have different language text burned into video
+                track_playlists[track_num] = _mkv_text(value)
+
+        # Parse stream info: SINFO:title_idx,stream_idx,attr_id,attr_type,"value"
+        # Attribute IDs from MakeMKV:
+        #   1 = stream type ("Video", "Audio", "Subtitles")
+        #   3 = language code (ISO 639-2, e.g., "eng", "spa")
+        #   4 = language name (e.g., "English", "Spanish")
+        #   5 = codec short name (e.g., "DTS-HD MA", "TrueHD")
+        #   39 = default flag (value contains "Default" if default track)
+        for match in _SINFO_RE.finditer(data):
+            title_idx = int(match.group(1))
+            stream_idx = int(match.group(2))
+            attr_id = int(match.group(3))
+            value = match.group(4)
+
+            if attr_id == 1:
+                if value == b"Audio":
+                    streams = track_audio_streams.setdefault(title_idx, {})
+                    if stream_idx not in streams:
+                        streams[stream_idx] = {
+                            "stream_idx": stream_idx, "lang_code": "", "lang_name": "",
+                            "codec": "", "is_default": False
+                        }
+                continue
 
-        process.wait()
+            stream = track_audio_streams.get(title_idx, {}).get(stream_idx)
+            if stream is not None:
+                if attr_id == 3:
+                    stream["lang_code"] = _mkv_text(value)
+                elif attr_id == 4:
+                    stream["lang_name"] = _mkv_text(value)
+                elif attr_id == 5:
+                    stream["codec"] = _mkv_text(value)
+                elif attr_id == 39:
+                    stream["is_default"] = b"Default" in value
+
+        # Disc attributes: CINFO:id,code,"value" - all kept for fingerprinting
+        for match in _CINFO_RE.finditer(data):
+            fingerprint.update(match.group(0))
+            field_id = int(match.group(1))
+            value = _mkv_text(match.group(2))
+            info["cinfo_raw"][f"CINFO:{field_id}"] = value
+
+            if field_id == 1:
+                # Disc type: CINFO:1,6209,"Blu-ray disc"
+                if "Blu-ray" in value:
+                    info["disc_type"] = "bluray"
+                elif "DVD" in value:
+                    info["disc_type"] = "dvd"
+            elif field_id == 2:
+                # Disc name: CINFO:2,0,"GUARDIANS_VOL_3"
+                info["disc_label"] = value
+
+        if info["cinfo_raw"]:
+            info["cinfo_fingerprint"] = fingerprint.hexdigest()
 
         # Get preferred language from config
         preferred_lang = "eng"  # Default
@@ -704,14 +1261,12 @@ class MakeMKV:
                     activity.log_info(f"ANGLE: Selected track {best_track['index']} - primary audio matches preferred_language ({preferred_lang})")
                 elif len(matching_angles) > 1:
                     # Multiple angles have preferred language as primary - use lowest playlist
-                    matching_angles.sort(key=lambda t: track_playlists.get(t["index"], "zzzzz"))
-                    best_track = matching_angles[0]
+                    best_track = min(matching_angles, key=lambda t: _playlist_number(track_playlists.get(t["index"])))
                     info["main_feature"] = best_track["index"]
                     activity.log_info(f"ANGLE: Multiple angles have {preferred_lang} primary audio, selected track {best_track['index']} (lowest playlist)")
                 elif not any(candidate.get("audio_tracks") for candidate in angle_candidates):
                     # No audio info available - fall back to lowest playlist (old behavior)
-                    angle_candidates.sort(key=lambda t: track_playlists.get(t["index"], "zzzzz"))
-                    best_track = angle_candidates[0]
+                    best_track = min(angle_candidates, key=lambda t: _playlist_number(track_playlists.get(t["index"])))
                     info["main_feature"] = best_track["index"]
                     activity.log_info(f"ANGLE: No audio track info available, falling back to lowest playlist: track {best_track['index']}")
                 else:
@@ -785,47 +1340,29 @@ class MakeMKV:
         activity.log_info(f"BACKUP SCAN: Scanning {backup_path} for main feature track...")
 
         args = ["-r", "info", f"file:{backup_path}"]
-        process = self._run_cmd(args)
+        data = self._read_info_output(args)
 
         longest_track = {"index": None, "duration": 0}
         tracks_found = []  # (track_num, duration_secs, duration_str, playlist)
         track_playlists = {}  # track_num -> playlist name
 
-        for line in process.stdout:
-            line = line.strip()
-
-            # Parse playlist name: TINFO:0,16,0,"00800.mpls"
-            if line.startswith("TINFO:") and ",16,0," in line:
-                match = re.search(r'TINFO:(\d+),16,0,"([^"]*)"', line)
-                if match:
-                    track_num = int(match.group(1))
-                    playlist = match.group(2)
-                    track_playlists[track_num] = playlist
-
-            # Parse track duration: TINFO:0,9,0,"1:45:30"
-            if line.startswith("TINFO:") and ",9,0," in line:
-                match = re.search(r'TINFO:(\d+),9,0,"([^"]*)"', line)
-                if match:
-                    track_num = int(match.group(1))
-                    duration_str = match.group(2)
+        for match in _TINFO_RE.finditer(data):
+            track_num = int(match.group(1))
+            field_id = int(match.group(2))
+            value = match.group(3)
 
-                    try:
-                        parts = duration_str.split(":")
-                        if len(parts) == 3:
-                            duration_secs = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-                        elif len(parts) == 2:
-                            duration_secs = int(parts[0]) * 60 + int(parts[1])
-                        else:
-                            duration_secs = 0
+            if field_id == 9:
+                # Track duration: TINFO:0,9,0,"1:45:30"
+                duration_str = _mkv_text(value)
+                duration_secs = _parse_makemkv_duration(duration_str)
+                if duration_secs is not None:
+                    tracks_found.append((track_num, duration_secs, duration_str))
 
-                        tracks_found.append((track_num, duration_secs, duration_str))
-
-                        if duration_secs > longest_track["duration"]:
-                            longest_track = {"index": track_num, "duration": duration_secs}
-                    except:
-                        pass
-
-        process.wait()
+                    if duration_secs > longest_track["duration"]:
+                        longest_track = {"index": track_num, "duration": duration_secs}
+            elif field_id == 16:
+                # Playlist name: TINFO:0,16,0,"00800.mpls"
+                track_playlists[track_num] = _mkv_text(value)
 
         if tracks_found:
             activity.log_info(f"BACKUP SCAN: Found {len(tracks_found)} tracks")
@@ -844,8 +1381,7 @@ class MakeMKV:
                 # Multiple tracks with same duration = likely angles
                 activity.log_info(f"BACKUP SCAN: Detected {len(angle_candidates)} angles (same duration tracks)")
                 # Sort by playlist number (00800 < 00801 < 00802)
-                angle_candidates.sort(key=lambda t: track_playlists.get(t[0], "zzzzz"))
-                best_track = angle_candidates[0]
+                best_track = min(angle_candidates, key=lambda t: _playlist_number(track_playlists.get(t[0])))
                 activity.log_info(f"BACKUP SCAN: Selected track {best_track[0]} (playlist {track_playlists.get(best_track[0], 'unknown')}) as main feature")
                 return best_track[0]
 
@@ -874,40 +1410,34 @@ class MakeMKV:
         if not tracks or not official_runtime_seconds:
             return (None, False)
 
-        # First, check if we have a fake playlist situation:
-        # Multiple tracks with durations within 60 seconds of each other
-        long_tracks = [t for t in tracks if t.get('duration', 0) > 2700]  # > 45 min
-        fake_playlist_detected = False
-
-        if len(long_tracks) >= 3:
-            # Check if multiple tracks have similar durations
-            durations = sorted([t['duration'] for t in long_tracks])
-            # If 3+ tracks are within 120 seconds of each other, it's likely fake playlists
-            for i in range(len(durations) - 2):
-                if durations[i + 2] - durations[i] <= 120:
-                    fake_playlist_detected = True
-                    activity.log_warning(f"TRACK SELECT: Fake playlist detected - {len(long_tracks)} tracks with similar runtimes")
-                    break
-
-        # Find tracks within tolerance of official runtime
+        # One pass: collect long-track durations for fake playlist detection and
+        # candidates (index, diff from official runtime, duration) for selection
+        long_durations = []
         candidates = []
         for track in tracks:
             duration = track.get('duration', 0)
             if duration < 2700:  # Skip short tracks
                 continue
-            diff = abs(duration - official_runtime_seconds)
-            candidates.append((track['index'], diff, duration))
+            if duration > 2700:  # > 45 min
+                long_durations.append(duration)
+            candidates.append((track['index'], abs(duration - official_runtime_seconds), duration))
+
+        # Fake playlist situation: multiple tracks with near-identical durations
+        fake_playlist_detected = False
+        if len(long_durations) >= 3:
+            long_durations.sort()
+            # If 3+ tracks are within 120 seconds of each other, it's likely fake playlists.
+            # Sorted, that's the tightest 3-track window: min(d[i+2] - d[i]), computed by map()
+            if min(map(operator.sub, long_durations[2:], long_durations)) <= 120:
+                fake_playlist_detected = True
+                activity.log_warning(f"TRACK SELECT: Fake playlist detected - {len(long_durations)} tracks with similar runtimes")
 
         if not candidates:
             activity.log_warning("TRACK SELECT: No suitable tracks found")
             return (None, fake_playlist_detected)
 
-        # Sort by difference from official runtime
-        candidates.sort(key=lambda x: x[1])
-
-        best_track = candidates[0][0]
-        best_diff = candidates[0][1]
-        best_duration = candidates[0][2]
+        # Closest to official runtime (first one wins ties)
+        best_track, best_diff, best_duration = min(candidates, key=lambda x: x[1])
 
         # Log selection reasoning
         official_mins = official_runtime_seconds // 60
@@ -923,6 +1453,127 @@ class MakeMKV:
 
         return (best_track, fake_playlist_detected)
 
+    def _follow_output(self, process: subprocess.Popen, label: str, output_dir: str,
+                       progress_callback: Optional[Callable] = None,
+                       message_callback: Optional[Callable] = None, expected_size: int = 0,
+                       debug_enabled: bool = False, backup: bool = False) -> _MakeMKVOutput:
+        """Consume makemkvcon robot-mode output for a rip or backup.
+
+        Reports progress from PRGV lines (throttled to ~1 Hz), or from the output
+        size against expected_size when there are none. Backups always use the
+        folder size, since their PRGV restarts at 0 for every segment. label
+        prefixes the activity log lines ("RIP", "BACKUP", ...).
+
+        process must come from _run_cmd(..., binary=True): lines are matched as
+        bytes and only MSG text is decoded.
+        """
+        out = _MakeMKVOutput()
+        self.rip_process = process
+        if backup:
+            measure_size = _BackupSizeTracker(output_dir).total
+        else:
+            measure_size = _MkvGrowthWatcher(output_dir).largest_size
+
+        last_size_check = time.monotonic()
+        last_emit = 0.0  # monotonic time of the last PRGV progress callback
+        last_percent = -1  # Last value passed to progress_callback, from either source
+        last_heartbeat = time.monotonic()
+        start_time = time.monotonic()
+        for line in _read_lines(process.stdout, OUTPUT_IDLE_TICK):
+            current_size = None  # Output size, measured at most once per line or idle tick
+            if line is not None:
+                line = line.strip()
+                out.line_count += 1
+
+                # Log first few lines for debugging
+                if out.line_count <= 5 and debug_enabled:
+                    activity.log_info(f"{label} MakeMKV[{out.line_count}]: {_mkv_text(line[:100])}")
+
+                # Parse progress: PRGV:current,total,max
+                if line.startswith(b"PRGV:"):
+                    out.prgv_count += 1
+                    prgv = _parse_prgv(line) if not backup else None
+                    if prgv and progress_callback:
+                        current, _, max_val = prgv
+                        if max_val > 0:
+                            percent = current * 100 // max_val
+                            # MakeMKV emits PRGV many times a second - report changes at most ~1 Hz
+                            now = time.monotonic()
+                            if percent != last_percent and (now - last_emit >= PROGRESS_MIN_INTERVAL or percent >= 100):
+                                progress_callback(percent)
+                                last_emit = now
+                                last_percent = percent
+                            # Log occasional progress for debugging
+                            if debug_enabled and (out.prgv_count == 1 or out.prgv_count % 100 == 0):
+                                activity.log_info(f"{label} DEBUG: Progress {percent}% (PRGV #{out.prgv_count})")
+                # Parse messages for errors/status and track actual output path
+                elif line.startswith(b"MSG:"):
+                    out.msg_count += 1
+                    # Extract message text: MSG:code,flags,count,"message",...
+                    msg = _parse_msg(line)
+                    if msg is not None:
+                        msg_lower = msg.lower()
+                        if message_callback:
+                            message_callback(msg)
+                        if "error" in msg_lower or "fail" in msg_lower:
+                            out.last_error = msg
+                        # Detect corruption in hash check
+                        if "corrupt" in msg_lower:
+                            out.corruption_count += 1
+                            if out.corruption_count <= CORRUPTION_SAMPLE_SIZE:
+                                out.corruption_warnings.append(msg)
+                                activity.log_warning(f"{label}: Corruption detected - {msg[:100]}")
+                        # Track actual output path from "Saving X title(s) into directory file:///path"
+                        elif "saving" in msg_lower and "directory" in msg_lower:
+                            path_match = _FILE_URL_RE.search(msg)
+                            if path_match:
+                                out.output_path = path_match.group(1)
+                                if debug_enabled:
+                                    activity.log_info(f"{label} DEBUG: MakeMKV saving to: {out.output_path}")
+                        # Log MSG status during initialization (when still at 0%)
+                        elif debug_enabled and out.prgv_count == 0:
+                            activity.log_info(f"{label} DEBUG MSG[{out.msg_count}]: {msg[:80]}")
+
+            # Size-based progress: always for backups, else only until PRGV shows up
+            if (backup or out.prgv_count == 0) and expected_size > 0 and progress_callback:
+                now = time.monotonic()
+                if now - last_size_check >= 3:  # Check every 3 seconds
+                    last_size_check = now
+                    try:
+                        current_size = measure_size()
+                        percent = min(99, current_size * 100 // expected_size)
+                        if percent > last_percent:
+                            progress_callback(percent)
+                            last_percent = percent
+                            # Log progress at reasonable intervals
+                            if backup and (percent % 10 == 0 or percent > 95):
+                                activity.log_info(f"{label}: {current_size / (1024 ** 3):.1f} GB ({percent}%)")
+                            elif debug_enabled:
+                                activity.log_info(f"{label} DEBUG: File size progress: {current_size / (1024 * 1024):.1f} MB ({percent}%)")
+                    except:
+                        pass
+
+            # Heartbeat logging: when at 0% for extended periods, log periodic status
+            if debug_enabled and last_percent <= 0:
+                now = time.monotonic()
+                if now - last_heartbeat >= 60:  # Every 60 seconds
+                    last_heartbeat = now
+                    elapsed = now - start_time
+                    try:
+                        if current_size is None:
+                            current_size = measure_size()
+                        if current_size:
+                            activity.log_info(f"{label} DEBUG: Still initializing ({int(elapsed)}s elapsed), {current_size / (1024 * 1024):.1f} MB so far, {out.line_count} lines processed")
+                        else:
+                            activity.log_info(f"{label} DEBUG: Still initializing ({int(elapsed)}s elapsed), no output yet, {out.line_count} lines processed, {out.msg_count} MSG lines")
+                    except:
+                        activity.log_info(f"{label} DEBUG: Still initializing ({int(elapsed)}s elapsed), {out.line_count} lines processed")
+
+        out.return_code = process.wait()
+        if debug_enabled:
+            activity.log_info(f"{label} DEBUG: MakeMKV finished. Lines: {out.line_count}, PRGV: {out.prgv_count}, MSG: {out.msg_count}, Return: {out.return_code}")
+        return out
+
     def rip_track(self, device: str, track: int, output_dir: str,
                   progress_callback: Optional[Callable] = None,
                   message_callback: Optional[Callable] = None, expected_size: int = 0) -> tuple:
@@ -955,141 +1606,36 @@ class MakeMKV:
         cmd_str = "makemkvcon " + " ".join(f'"{a}"' if " " in a else a for a in args)
         # Check debug logging setting
         from . import config as cfg_module
-        debug_cfg = cfg_module.load_config()
-        debug_enabled = debug_cfg.get('ripping', {}).get('debug_logging', False)
+        debug_enabled = cfg_module.debug_logging_enabled()
         if debug_enabled:
             activity.log_info(f"DEBUG: Running: {cmd_str}")
 
-        process = self._run_cmd(args)
-        last_error = ""
-        actual_output_path = None  # Track where MakeMKV actually saves
-
-        line_count = 0
-        prgv_count = 0
-        last_size_check = time.time()
-        last_progress = 0
-        last_heartbeat = time.time()
-        start_time = time.time()
-        msg_count = 0  # Track MSG lines for initialization logging
-        for line in process.stdout:
-            line = line.strip()
-            line_count += 1
-
-            # Log first few lines for debugging
-            if line_count <= 5:
-                if debug_enabled:
-                    activity.log_info(f"DEBUG MakeMKV[{line_count}]: {line[:100]}")
-
-            # Parse progress: PRGV:current,total,max
-            if line.startswith("PRGV:"):
-                prgv_count += 1
-                match = re.search(r'PRGV:(\d+),(\d+),(\d+)', line)
-                if match and progress_callback:
-                    current = int(match.group(1))
-                    total = int(match.group(2))
-                    max_val = int(match.group(3))
-                    if max_val > 0:
-                        percent = int((current / max_val) * 100)
-                        progress_callback(percent)
-                        # Log occasional progress for debugging
-                        if prgv_count == 1 or prgv_count % 100 == 0:
-                            if debug_enabled:
-                                activity.log_info(f"DEBUG: Progress {percent}% (PRGV #{prgv_count})")
-
-            # Fallback: poll folder size if no PRGV and expected_size provided
-            if prgv_count == 0 and expected_size > 0 and progress_callback:
-                now = time.time()
-                if now - last_size_check >= 3:  # Check every 3 seconds
-                    last_size_check = now
-                    try:
-                        mkv_files = list(Path(output_dir).glob("*.mkv"))
-                        if mkv_files:
-                            current_size = max(f.stat().st_size for f in mkv_files)
-                            percent = min(99, int((current_size / expected_size) * 100))
-                            if percent > last_progress:
-                                progress_callback(percent)
-                                last_progress = percent
-                                # Log size progress in debug mode
-                                if debug_enabled:
-                                    size_mb = current_size / (1024 * 1024)
-                                    activity.log_info(f"DEBUG: File size progress: {size_mb:.1f} MB ({percent}%)")
-                    except:
-                        pass
-
-            # Heartbeat logging: when at 0% for extended periods, log periodic status
-            if debug_enabled and last_progress == 0:
-                now = time.time()
-                elapsed = now - start_time
-                if now - last_heartbeat >= 60:  # Every 60 seconds
-                    last_heartbeat = now
-                    # Check for any mkv files starting to appear
-                    try:
-                        mkv_files = list(Path(output_dir).glob("*.mkv"))
-                        if mkv_files:
-                            current_size = max(f.stat().st_size for f in mkv_files)
-                            size_mb = current_size / (1024 * 1024)
-                            activity.log_info(f"DEBUG: Still initializing ({int(elapsed)}s elapsed), {len(mkv_files)} file(s), {size_mb:.1f} MB so far, {line_count} lines processed")
-                        else:
-                            activity.log_info(f"DEBUG: Still initializing ({int(elapsed)}s elapsed), no output yet, {line_count} lines processed, {msg_count} MSG lines")
-                    except:
-                        activity.log_info(f"DEBUG: Still initializing ({int(elapsed)}s elapsed), {line_count} lines processed")
-
-            # Parse messages for errors/status and track actual output path
-            if line.startswith("MSG:"):
-                msg_count += 1
-                # Extract message text: MSG:code,flags,count,"message",...
-                match = re.search(r'MSG:\d+,\d+,\d+,"([^"]*)"', line)
-                if match:
-                    msg = match.group(1)
-                    if message_callback:
-                        message_callback(msg)
-                    # Track error messages
-                    if "error" in msg.lower() or "fail" in msg.lower():
-                        last_error = msg
-                    # Track actual output path from "Saving X title(s) into directory file:///path"
-                    if "saving" in msg.lower() and "directory" in msg.lower():
-                        path_match = re.search(r'file://(/[^\s]+)', msg)
-                        if path_match:
-                            actual_output_path = path_match.group(1)
-                            if debug_enabled:
-                                activity.log_info(f"DEBUG: MakeMKV saving to: {actual_output_path}")
-                    # Log MSG status during initialization (when still at 0%)
-                    elif debug_enabled and prgv_count == 0:
-                        # Log status messages during initialization phase
-                        activity.log_info(f"DEBUG MSG[{msg_count}]: {msg[:80]}")
-
-        return_code = process.wait()
-        if debug_enabled:
-            activity.log_info(f"DEBUG: MakeMKV finished. Lines: {line_count}, PRGV: {prgv_count}, Return: {return_code}")
+        process = self._run_cmd(args, binary=True)
+        out = self._follow_output(process, "RIP", output_dir, progress_callback,
+                                  message_callback, expected_size, debug_enabled)
+        last_error, actual_output_path = out.last_error, out.output_path
+        prgv_count, return_code = out.prgv_count, out.return_code
 
         if return_code == 0:
             # Detect silent failures: MakeMKV returned success but never reported progress
             if prgv_count == 0:
                 activity.log_info("RIP: No progress messages received, verifying output...")
-                mkv_files = list(Path(output_dir).glob("*.mkv"))
+                mkv_files = _file_sizes(output_dir, ".mkv") if os.path.isdir(output_dir) else {}
                 if mkv_files:
-                    largest = max(mkv_files, key=lambda f: f.stat().st_size)
-                    size = largest.stat().st_size
+                    largest = max(mkv_files, key=mkv_files.get)
+                    size = mkv_files[largest]
                     if size > 100_000_000:  # > 100 MB
-                        activity.log_success(f"RIP: Verified - {size / (1024**3):.1f} GB in {largest.name}")
-                        return (True, "", str(largest))
+                        activity.log_success(f"RIP: Verified - {size / (1024**3):.1f} GB in {os.path.basename(largest)}")
+                        return (True, "", largest)
                     else:
                         activity.log_warning(f"RIP: MKV exists but only {size / (1024**2):.1f} MB")
-                        return (False, f"Output file too small ({size / (1024**2):.1f} MB)", str(largest))
+                        return (False, f"Output file too small ({size / (1024**2):.1f} MB)", largest)
                 else:
                     activity.log_warning("RIP: No MKV files found - possible disc read failure or copy protection")
                     return (False, "MakeMKV reported success but no output file found", actual_output_path)
             return (True, "", actual_output_path)
         else:
-            # Map common MakeMKV error codes
-            error_map = {
-                1: "General error",
-                2: "Invalid argument",
-                12: "Disc read error - disc may be damaged or dirty",
-                13: "Drive error",
-                15: "Copy protection error"
-            }
-            error_desc = error_map.get(return_code, f"Unknown error (code {return_code})")
+            error_desc = MAKEMKV_ERROR_CODES.get(return_code, f"Unknown error (code {return_code})")
             if last_error:
                 error_desc = f"{error_desc}: {last_error}"
             return (False, error_desc, actual_output_path)
@@ -1122,107 +1668,34 @@ class MakeMKV:
 
         # Check debug logging setting
         from . import config as cfg_module
-        debug_cfg = cfg_module.load_config()
-        debug_enabled = debug_cfg.get('ripping', {}).get('debug_logging', False)
+        debug_enabled = cfg_module.debug_logging_enabled()
 
         activity.log_info(f"BACKUP: Running: makemkvcon {' '.join(args)}")
 
-        process = self._run_cmd(args)
-        last_error = ""
-        corruption_detected = []  # Track any corruption warnings
-
-        line_count = 0
-        prgv_count = 0
-        last_size_check = time.time()
-        last_progress = 0
-        last_heartbeat = time.time()
-        start_time = time.time()
-        msg_count = 0
-        for line in process.stdout:
-            line = line.strip()
-            line_count += 1
-
-            # Log first few lines for debugging
-            if line_count <= 5 and debug_enabled:
-                activity.log_info(f"BACKUP MakeMKV[{line_count}]: {line[:100]}")
-
-            # Parse progress: PRGV:current,total,max
-            # NOTE: For backup mode, PRGV cycles 0-100 per segment, not overall.
-            # We count PRGV to know MakeMKV is working, but use file-size for actual progress.
-            if line.startswith("PRGV:"):
-                prgv_count += 1
-
-            # For backup mode, always use file-size based progress (PRGV cycles per-segment)
-            if expected_size > 0 and progress_callback:
-                now = time.time()
-                if now - last_size_check >= 3:  # Check every 3 seconds
-                    last_size_check = now
-                    try:
-                        current_size = sum(f.stat().st_size for f in Path(output_dir).rglob("*") if f.is_file())
-                        percent = min(99, int((current_size / expected_size) * 100))
-                        if percent > last_progress:
-                            progress_callback(percent)
-                            last_progress = percent
-                            # Log progress at reasonable intervals
-                            if percent % 10 == 0 or percent > 95:
-                                size_gb = current_size / (1024 ** 3)
-                                activity.log_info(f"BACKUP: {size_gb:.1f} GB ({percent}%)")
-                    except:
-                        pass
-
-            # Heartbeat logging: when at 0% for extended periods
-            if debug_enabled and last_progress == 0:
-                now = time.time()
-                elapsed = now - start_time
-                if now - last_heartbeat >= 60:  # Every 60 seconds
-                    last_heartbeat = now
-                    try:
-                        current_size = sum(f.stat().st_size for f in Path(output_dir).rglob("*") if f.is_file())
-                        size_mb = current_size / (1024 * 1024)
-                        activity.log_info(f"BACKUP DEBUG: Still initializing ({int(elapsed)}s elapsed), {size_mb:.1f} MB so far, {line_count} lines processed")
-                    except:
-                        activity.log_info(f"BACKUP DEBUG: Still initializing ({int(elapsed)}s elapsed), {line_count} lines processed")
-
-            # Parse messages for errors/status
-            if line.startswith("MSG:"):
-                msg_count += 1
-                match = re.search(r'MSG:\d+,\d+,\d+,"([^"]*)"', line)
-                if match:
-                    msg = match.group(1)
-                    if message_callback:
-                        message_callback(msg)
-                    if "error" in msg.lower() or "fail" in msg.lower():
-                        last_error = msg
-                    # Detect corruption in hash check
-                    elif "corrupt" in msg.lower():
-                        corruption_detected.append(msg)
-                        activity.log_warning(f"BACKUP: Corruption detected - {msg[:100]}")
-                    # Log MSG status during initialization (when still at 0%)
-                    elif debug_enabled and prgv_count == 0:
-                        activity.log_info(f"BACKUP DEBUG MSG[{msg_count}]: {msg[:80]}")
-
-        return_code = process.wait()
-        if debug_enabled:
-            activity.log_info(f"BACKUP DEBUG: Finished. Lines: {line_count}, PRGV: {prgv_count}, MSG: {msg_count}, Return: {return_code}")
+        process = self._run_cmd(args, binary=True)
+        out = self._follow_output(process, "BACKUP", output_dir, progress_callback,
+                                  message_callback, expected_size, debug_enabled, backup=True)
+        last_error, corruption_count = out.last_error, out.corruption_count
+        line_count, prgv_count, return_code = out.line_count, out.prgv_count, out.return_code
         activity.log_info(f"BACKUP: Finished. Lines: {line_count}, PRGV: {prgv_count}, Return: {return_code}")
 
         # Warn about corruption at the end
-        if corruption_detected:
-            activity.log_warning(f"BACKUP: {len(corruption_detected)} file(s) had corruption during backup - extraction may fail")
+        if corruption_count:
+            activity.log_warning(f"BACKUP: {corruption_count} file(s) had corruption during backup - extraction may fail")
 
         if return_code == 0:
             if prgv_count == 0:
                 # PRGV messages not received - verify backup succeeded by checking folder
                 activity.log_info("BACKUP: No progress messages received, verifying backup folder...")
                 # Check for Blu-ray (BDMV) or DVD (VIDEO_TS) structure
-                bdmv_path = Path(output_dir) / "BDMV"
-                video_ts_path = Path(output_dir) / "VIDEO_TS"
-                has_valid_structure = bdmv_path.exists() or video_ts_path.exists()
-                disc_type = "Blu-ray" if bdmv_path.exists() else "DVD" if video_ts_path.exists() else "unknown"
+                has_bdmv = os.path.exists(os.path.join(output_dir, "BDMV"))
+                has_video_ts = os.path.exists(os.path.join(output_dir, "VIDEO_TS"))
+                has_valid_structure = has_bdmv or has_video_ts
+                disc_type = "Blu-ray" if has_bdmv else "DVD" if has_video_ts else "unknown"
                 
                 if has_valid_structure:
                     # Calculate total size
-                    total_size = sum(f.stat().st_size for f in Path(output_dir).rglob("*") if f.is_file())
+                    total_size = _dir_size(output_dir, recursive=True)
                     # DVDs are smaller than Blu-rays, adjust threshold
                     min_size = 100_000_000 if disc_type == "DVD" else 1_000_000_000  # 100MB for DVD, 1GB for BR
                     if total_size > min_size:
@@ -1264,93 +1737,37 @@ class MakeMKV:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
 
         # Check if debug logging is enabled
-        debug_cfg = config.load_config()
-        debug_enabled = debug_cfg.get('ripping', {}).get('debug_logging', False)
+        debug_enabled = config.debug_logging_enabled()
 
         args = ["-r", "--progress=-stdout", "mkv", f"file:{backup_path}", str(track), output_dir]
 
         activity.log_info(f"RIP FROM BACKUP: Running: makemkvcon {' '.join(args)}")
 
-        process = self._run_cmd(args)
-        last_error = ""
-        actual_output_path = None
-        corruption_warnings = []
-
-        line_count = 0
-        prgv_count = 0
-        last_size_check = time.time()
-        last_progress = 0
-        for line in process.stdout:
-            line = line.strip()
-            line_count += 1
-
-            if line_count <= 5 and debug_enabled:
-                activity.log_info(f"RIP FROM BACKUP MakeMKV[{line_count}]: {line[:100]}")
-
-            if line.startswith("PRGV:"):
-                prgv_count += 1
-                match = re.search(r'PRGV:(\d+),(\d+),(\d+)', line)
-                if match and progress_callback:
-                    current = int(match.group(1))
-                    max_val = int(match.group(3))
-                    if max_val > 0:
-                        percent = int((current / max_val) * 100)
-                        progress_callback(percent)
-                        if prgv_count == 1 or prgv_count % 100 == 0:
-                            activity.log_info(f"RIP FROM BACKUP: Progress {percent}%")
-
-            # Fallback: poll folder size if no PRGV and expected_size provided
-            if prgv_count == 0 and expected_size > 0 and progress_callback:
-                now = time.time()
-                if now - last_size_check >= 3:  # Check every 3 seconds
-                    last_size_check = now
-                    try:
-                        mkv_files = list(Path(output_dir).glob("*.mkv"))
-                        if mkv_files:
-                            current_size = max(f.stat().st_size for f in mkv_files)
-                            percent = min(99, int((current_size / expected_size) * 100))
-                            if percent > last_progress:
-                                progress_callback(percent)
-                                last_progress = percent
-                    except:
-                        pass
-
-            if line.startswith("MSG:"):
-                match = re.search(r'MSG:\d+,\d+,\d+,"([^"]*)"', line)
-                if match:
-                    msg = match.group(1)
-                    if message_callback:
-                        message_callback(msg)
-                    if "error" in msg.lower() or "fail" in msg.lower():
-                        last_error = msg
-                    if "corrupt" in msg.lower():
-                        corruption_warnings.append(msg)
-                        activity.log_warning(f"RIP FROM BACKUP: {msg[:100]}")
-                    if "saving" in msg.lower() and "directory" in msg.lower():
-                        path_match = re.search(r'file://(/[^\s]+)', msg)
-                        if path_match:
-                            actual_output_path = path_match.group(1)
-
-        return_code = process.wait()
+        process = self._run_cmd(args, binary=True)
+        out = self._follow_output(process, "RIP FROM BACKUP", output_dir, progress_callback,
+                                  message_callback, expected_size, debug_enabled)
+        last_error, actual_output_path = out.last_error, out.output_path
+        corruption_count = out.corruption_count
+        line_count, prgv_count, return_code = out.line_count, out.prgv_count, out.return_code
         activity.log_info(f"RIP FROM BACKUP: Finished. Lines: {line_count}, PRGV: {prgv_count}, Return: {return_code}")
 
         if return_code == 0:
             if prgv_count == 0:
                 # PRGV messages not received - verify rip succeeded by checking output
                 activity.log_info("RIP FROM BACKUP: No progress messages received, verifying output...")
-                mkv_files = list(Path(output_dir).glob("*.mkv"))
+                mkv_files = _file_sizes(output_dir, ".mkv") if os.path.isdir(output_dir) else {}
                 if mkv_files:
-                    largest = max(mkv_files, key=lambda f: f.stat().st_size)
-                    size = largest.stat().st_size
+                    largest = max(mkv_files, key=mkv_files.get)
+                    size = mkv_files[largest]
                     if size > 100_000_000:  # > 100 MB
-                        activity.log_success(f"RIP FROM BACKUP: Verified - {size / (1024**3):.1f} GB in {largest.name}")
-                        return (True, "", str(largest))
+                        activity.log_success(f"RIP FROM BACKUP: Verified - {size / (1024**3):.1f} GB in {os.path.basename(largest)}")
+                        return (True, "", largest)
                     else:
                         activity.log_warning(f"RIP FROM BACKUP: MKV exists but only {size / (1024**2):.1f} MB")
-                        return (False, f"Output file too small ({size / (1024**2):.1f} MB)", str(largest))
+                        return (False, f"Output file too small ({size / (1024**2):.1f} MB)", largest)
                 else:
-                    if corruption_warnings:
-                        activity.log_error(f"RIP FROM BACKUP: No MKV produced - likely due to {len(corruption_warnings)} corruption warning(s) during backup")
+                    if corruption_count:
+                        activity.log_error(f"RIP FROM BACKUP: No MKV produced - likely due to {corruption_count} corruption warning(s) during backup")
                         return (False, "Extraction failed - backup has corrupted data (try cleaning disc)", actual_output_path)
                     else:
                         activity.log_warning("RIP FROM BACKUP: No MKV files found in output directory")
@@ -1378,6 +1795,11 @@ class RipEngine:
         self._rip_thread: Optional[threading.Thread] = None
         self._cancelled = False  # Flag to track manual cancellation
         self._selected_angle: Optional[int] = None  # User-selected angle for multi-angle discs
+        self._saved_job_state: Optional[bytes] = None  # Last state written, to skip no-op saves
+        self._mkv_running_cache = (0.0, None)  # (monotonic time, _is_makemkv_running result)
+        self._size_trackers: Dict[str, _BackupSizeTracker] = {}  # output dir -> status sampler size tracker
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._makemkv_gone_at: Optional[float] = None  # monotonic time MakeMKV was first seen gone with output
 
         # Initialize MakeMKV wrapper - use host installation
         self.makemkv = MakeMKV(use_docker=False)
@@ -1402,7 +1824,7 @@ class RipEngine:
                 "disc_label": self.current_job.disc_label,
                 "disc_type": self.current_job.disc_type,
                 "device": self.current_job.device,
-                "status": self.current_job.status.value if isinstance(self.current_job.status, RipStatus) else self.current_job.status,
+                "status": self.current_job.status,
                 "identified_title": self.current_job.identified_title,
                 "expected_size_bytes": self.current_job.expected_size_bytes,
                 "rip_output_dir": self.current_job.rip_output_dir,
@@ -1414,14 +1836,23 @@ class RipEngine:
                 "runtime_str": self.current_job.runtime_str,
                 "media_type": self.current_job.media_type,
             }
+            data = json.dumps(state).encode()
+            if data == self._saved_job_state and self.JOB_STATE_FILE.exists():
+                return
             self.JOB_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.JOB_STATE_FILE, 'w') as f:
-                json.dump(state, f)
+            # Write then rename, so a crash mid-write can't leave half a JSON file
+            # for _recover_job_state to trip over
+            tmp_file = self.JOB_STATE_FILE.with_suffix(".json.tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.JOB_STATE_FILE)
+            self._saved_job_state = data
         except Exception as e:
             activity.log_warning(f"Failed to save job state: {e}")
 
     def _clear_job_state(self):
         """Remove persisted job state file"""
+        self._saved_job_state = None
         try:
             if self.JOB_STATE_FILE.exists():
                 self.JOB_STATE_FILE.unlink()
@@ -1429,23 +1860,34 @@ class RipEngine:
             pass
 
     def _is_makemkv_running(self) -> Optional[dict]:
-        """Check if MakeMKV is running and return info about it"""
-        try:
-            result = subprocess.run(
-                ["pgrep", "-a", "makemkvcon"],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                # Parse the output dir from command line
-                # Example: 12345 makemkvcon -r mkv disc:0 0 /mnt/media/rips/raw/DISC_LABEL
-                line = result.stdout.strip().split('\n')[0]
-                parts = line.split()
-                if len(parts) >= 6:
-                    output_dir = parts[-1]  # Last arg is output dir
-                    return {"pid": parts[0], "output_dir": output_dir}
-            return None
-        except Exception:
-            return None
+        """Check if MakeMKV is running and return info about it.
+
+        Once this engine has started a rip, its own process is checked with a
+        non-blocking waitpid. Before that (recovering a rip left running by a
+        previous service instance) /proc is scanned, and the answer is reused
+        for MAKEMKV_RUNNING_TTL seconds.
+        """
+        process = self.makemkv.rip_process
+        if process is not None:
+            if process.poll() is not None:
+                return None
+            # The output dir is the last arg of both the mkv and backup commands
+            return {"pid": str(process.pid), "output_dir": process.args[-1]}
+
+        checked_at, info = self._mkv_running_cache
+        now = time.monotonic()
+        if now - checked_at < MAKEMKV_RUNNING_TTL:
+            return info
+
+        info = None
+        process = _makemkvcon_argv()
+        # Parse the output dir from the command line
+        # Example: makemkvcon -r mkv disc:0 0 /mnt/media/rips/raw/DISC_LABEL
+        if process and len(process[1]) >= 5:
+            output_dir = process[1][-1]  # Last arg is output dir
+            info = {"pid": str(process[0]), "output_dir": output_dir}
+        self._mkv_running_cache = (now, info)
+        return info
 
     def _recover_job_state(self):
         """Recover job state after service restart"""
@@ -1487,11 +1929,10 @@ class RipEngine:
                 # MakeMKV not running - check if rip completed
                 output_dir = state.get("rip_output_dir", "")
                 if output_dir and os.path.isdir(output_dir):
-                    import glob
-                    mkv_files = glob.glob(os.path.join(output_dir, "*.mkv"))
-                    if mkv_files:
+                    mkv_sizes = _file_sizes(output_dir, ".mkv")
+                    if mkv_sizes:
                         # Check if output size is at least 90% of expected (to detect incomplete rips)
-                        total_size = sum(os.path.getsize(f) for f in mkv_files)
+                        total_size = sum(mkv_sizes.values())
                         expected_size = state.get("expected_size_bytes", 0)
 
                         if expected_size > 0:
@@ -1550,14 +1991,14 @@ class RipEngine:
         thread.start()
 
     def _run_post_rip_identification(self, job: RipJob):
-        """Run smart identification after rip using actual file runtime from ffprobe"""
+        """Run smart identification after rip using the actual file runtime"""
         from .identify import SmartIdentifier
         identifier = SmartIdentifier(self.config)
 
         activity.log_info(f"=== IDENTIFICATION START: {job.disc_label} ===")
 
-        # Get actual runtime from the ripped file using ffprobe
-        activity.log_info(f"IDENTIFY: Getting video runtime via ffprobe...")
+        # Get actual runtime from the ripped file (MKV header, ffprobe fallback)
+        activity.log_info(f"IDENTIFY: Getting video runtime...")
         actual_runtime = identifier.get_video_runtime(job.output_path)
         if actual_runtime:
             activity.log_info(f"IDENTIFY: File runtime: {actual_runtime // 60}m {actual_runtime % 60}s")
@@ -1591,12 +2032,13 @@ class RipEngine:
                 tmdb_id=job.tmdb_id,
                 confidence=id_result.confidence,
                 resolution_source="radarr",
-                cinfo_raw=job.disc_cinfo_raw
+                cinfo_raw=job.disc_cinfo_raw,
+                cinfo_fingerprint=job.disc_fingerprint
             )
-            # Contribute to community disc database (if enabled)
+            # Contribute to community disc database (if enabled) - off-thread, it's an HTTP POST
             track_durations = [t.get("duration", 0) for t in (job.disc_tracks or [])]
             main_duration = max(track_durations) if track_durations else 0
-            community_db.contribute_disc(
+            community_db.contribute_disc_async(
                 disc_label=job.disc_label,
                 disc_type=job.disc_type,
                 duration_secs=main_duration,
@@ -1624,7 +2066,7 @@ class RipEngine:
                 self._update_step("identify", "complete", f"{job.identified_title} [POSSIBLE DUPLICATE]")
         else:
             # Fall back to disc label - mark for review
-            fallback_title = job.disc_label.replace("_", " ").title()
+            fallback_title = job.fallback_title
             job.identified_title = fallback_title
             job.needs_review = True  # Flag for review queue
             self._update_step("identify", "complete", f"{job.identified_title} [NEEDS REVIEW]")
@@ -1641,7 +2083,8 @@ class RipEngine:
                 tmdb_id=None,
                 confidence=None,
                 resolution_source="fallback",
-                cinfo_raw=job.disc_cinfo_raw
+                cinfo_raw=job.disc_cinfo_raw,
+                cinfo_fingerprint=job.disc_fingerprint
             )
 
     def _run_post_processing(self):
@@ -1651,14 +2094,15 @@ class RipEngine:
             return
 
         try:
-            import glob
             import shutil
             from . import config as cfg_module
             cfg = cfg_module.load_config()
 
             # Step: Verify file integrity (if enabled) - BEFORE moving files
             source_path = job.output_path or job.rip_output_dir
-            mkv_files = glob.glob(os.path.join(source_path, "*.mkv"))
+            # Sizes taken now are reused for the history entry after the move
+            mkv_sizes = _file_sizes(source_path, ".mkv") if os.path.isdir(source_path) else {}
+            mkv_files = list(mkv_sizes)
 
             if cfg.get('ripping', {}).get('verify_integrity', True) and mkv_files:
                 self._update_step("verify", "active", "Checking integrity...")
@@ -1667,7 +2111,7 @@ class RipEngine:
                     filename = os.path.basename(mkv_file)
                     if len(mkv_files) > 1:
                         self._update_step("verify", "active", f"Checking {i+1}/{len(mkv_files)}...")
-                    result = check_file_integrity(mkv_file)
+                    result = check_file_integrity(mkv_file, **integrity_options(cfg))
                     if not result["valid"]:
                         integrity_errors.append((filename, result["error_count"]))
 
@@ -1692,7 +2136,7 @@ class RipEngine:
             job.status = RipStatus.MOVING
 
             # Build folder name with year (like normal flow)
-            title = job.identified_title or job.disc_label.replace("_", " ").title()
+            title = job.identified_title or job.fallback_title
             if job.year:
                 dest_folder_name = sanitize_folder_name(f"{title} ({job.year})")
             else:
@@ -1702,11 +2146,7 @@ class RipEngine:
 
             if mkv_files:
                 Path(dest_path).mkdir(parents=True, exist_ok=True)
-                for mkv_file in mkv_files:
-                    new_filename = f"{dest_folder_name}.mkv"
-                    if len(mkv_files) > 1:
-                        idx = mkv_files.index(mkv_file) + 1
-                        new_filename = f"{dest_folder_name} - Part {idx}.mkv"
+                for mkv_file, new_filename in _part_filenames(mkv_files, dest_folder_name):
                     dest_file = os.path.join(dest_path, new_filename)
                     shutil.move(mkv_file, dest_file)
 
@@ -1733,8 +2173,7 @@ class RipEngine:
             activity.rip_completed(job.identified_title or job.disc_label, "recovered")
 
             # Calculate file size for history
-            mkv_files = glob.glob(os.path.join(job.output_path, "*.mkv"))
-            total_size = sum(os.path.getsize(f) for f in mkv_files) / (1024**3) if mkv_files else 0
+            total_size = sum(mkv_sizes.values()) / (1024**3)
 
             # Save to rip history (was missing for recovered rips)
             activity.enrich_and_save_rip(
@@ -1773,172 +2212,213 @@ class RipEngine:
 
         Returns the path containing MKV files, or None if not found.
         """
-        import glob
-
         # Normalize disc label for matching (handle spaces, underscores, case)
-        label_variants = [
+        label_variants = dict.fromkeys([
             disc_label,
             disc_label.replace("_", " "),
             disc_label.replace(" ", "_"),
             disc_label.title(),
             disc_label.upper(),
-        ]
+        ])
 
-        # Search locations in order of likelihood
-        search_bases = [
+        # Search locations in order of likelihood. Movies and TV may share a
+        # folder, and a missing base rules out every variant under it at once
+        search_bases = [base for base in dict.fromkeys([
             self.raw_path,
             self.movies_path,
             self.tv_path,
-        ]
+        ]) if os.path.isdir(base)]
+        if not search_bases:
+            return None
 
-        for base in search_bases:
-            for variant in label_variants:
-                search_path = os.path.join(base, variant)
-                if os.path.isdir(search_path):
-                    mkv_files = glob.glob(os.path.join(search_path, "*.mkv"))
-                    if mkv_files:
-                        activity.log_info(f"Found rip output at: {search_path}")
-                        return search_path
-
-        # Last resort: search for recently created folders with MKV files
-        for base in search_bases:
-            if os.path.isdir(base):
-                for entry in os.listdir(base):
-                    entry_path = os.path.join(base, entry)
-                    if os.path.isdir(entry_path):
-                        mkv_files = glob.glob(os.path.join(entry_path, "*.mkv"))
-                        if mkv_files:
-                            # Check if any MKV was created in last 5 minutes
-                            for mkv in mkv_files:
-                                mtime = os.path.getmtime(mkv)
-                                if time.time() - mtime < 300:  # 5 minutes
-                                    activity.log_info(f"Found recent rip at: {entry_path}")
-                                    return entry_path
+        candidates = [os.path.join(base, variant) for base in search_bases for variant in label_variants]
+        for search_path in candidates:
+            if _has_files(search_path, ".mkv"):
+                activity.log_info(f"Found rip output at: {search_path}")
+                return search_path
+
+        # Last resort: search for folders with an MKV written in the last 5 minutes.
+        # The bases are often separate mounts, so scan them side by side and
+        # keep the first hit in search order
+        cutoff = time.time() - 300
+        with ThreadPoolExecutor(max_workers=len(search_bases)) as executor:
+            recent = list(executor.map(lambda base: _recent_mkv_dir(base, cutoff), search_bases))
+        for entry_path in recent:
+            if entry_path:
+                activity.log_info(f"Found recent rip at: {entry_path}")
+                return entry_path
 
         return None
 
     def get_status(self) -> Optional[dict]:
-        """Get current rip status for the UI"""
+        """Get current rip status for the UI
+
+        No disk or process I/O happens here while ripping: sizes, progress and
+        ETA are kept current by the status sampler thread.
+        """
         with self._lock:
             # If no job in memory, try to recover from disk
             if not self.current_job:
                 self._recover_job_state()
 
             if self.current_job:
-                # Update current file size if ripping
-                if self.current_job.status == RipStatus.RIPPING and self.current_job.rip_output_dir:
-                    # Check both raw output dir and backup dir (backup writes to different location)
-                    raw_size = self._get_output_size(self.current_job.rip_output_dir)
-                    backup_dir = os.path.join(self.backup_path, sanitize_folder_name(self.current_job.disc_label))
-                    backup_size = self._get_output_size(backup_dir) if os.path.exists(backup_dir) else 0
-                    self.current_job.current_size_bytes = max(raw_size, backup_size)
-                    # Always calculate progress from file size (MakeMKV doesn't report PRGV for DVDs)
-                    if self.current_job.expected_size_bytes > 0:
-                        size_progress = int((self.current_job.current_size_bytes / self.current_job.expected_size_bytes) * 100)
-                        self.current_job.progress = min(size_progress, 99)  # Cap at 99% until actually done
-                        # Update step detail with dynamic status (for when MakeMKV doesn't report PRGV)
-                        pct = self.current_job.progress
-                        # Check if using backup method to show correct phase
-                        is_backup_method = self.current_job.rip_method == "backup"
-                        backup_dir = os.path.join(self.backup_path, sanitize_folder_name(self.current_job.disc_label))
-                        raw_dir = self.current_job.rip_output_dir
-                        raw_has_mkv = os.path.exists(raw_dir) and any(Path(raw_dir).glob("*.mkv")) if raw_dir else False
-
-                        if is_backup_method:
-                            if self.current_job.backup_phase_complete:
-                                # Extraction phase - backup done, show extraction progress
-                                # pct is 50-100 for extraction, convert to 0-100
-                                extract_pct = max(0, (pct - 50) * 2)
-                                status_msg = f"Copying (✓) → Extracting ({extract_pct}%)"
-                            else:
-                                # Backup phase - pct is 0-50, convert to 0-100
-                                backup_pct = min(pct * 2, 100)
-                                status_msg = f"Copying ({backup_pct}%) → Extracting (--)"
-                        else:
-                            status_msg = f"Direct ({pct}%)"
-                        self._update_step("rip", "active", status_msg)
-
-                        # Update ETA based on elapsed time and progress
-                        if pct > 0:
-                            # Set rip start time if not already set
-                            if not self.current_job.rip_started_at:
-                                self.current_job.rip_started_at = time.time()
-
-                            # Calculate time-based ETA
-                            elapsed = time.time() - self.current_job.rip_started_at
-                            if pct >= 5 and elapsed > 30:  # Need enough data for reasonable estimate
-                                # Estimate total time = elapsed / (pct / 100)
-                                estimated_total = elapsed / (pct / 100)
-                                remaining_secs = estimated_total - elapsed
-                                if remaining_secs > 60:
-                                    mins = int(remaining_secs / 60)
-                                    self.current_job.eta = f"~{mins} min remaining"
-                                elif remaining_secs > 0:
-                                    self.current_job.eta = f"<1 min remaining"
-                                else:
-                                    self.current_job.eta = "Finishing..."
-                            else:
-                                self.current_job.eta = f"{100 - pct}% remaining"
-
-                    # Check if MakeMKV finished (process gone but we're still in ripping state)
-                    # IMPORTANT: Only trigger post-processing if we have actual MKV output.
-                    # During backup mode, there's a gap between backup completion and rip_from_backup
-                    # where MakeMKV isn't running but we don't have MKV files yet.
-                    # For TV/multi-track rips, MakeMKV stops between episodes - wait 5 seconds
-                    # and re-check to avoid falsely triggering post-processing mid-rip.
-                    # Only trigger STATUS_CHECK if we're still in RIPPING status
-                    # This prevents re-entry when already in IDENTIFYING (post-processing)
-                    if not self._is_makemkv_running() and raw_has_mkv and self.current_job.status == RipStatus.RIPPING:
-                        # MakeMKV finished AND we have MKV output - but wait to confirm it's really done
-                        if self.current_job.current_size_bytes > 0:
-                            # CRITICAL: Change status IMMEDIATELY to prevent race condition
-                            # During the 5s sleep, other get_status() calls could also enter this block
-                            self.current_job.status = RipStatus.IDENTIFYING
-
-                            # Check debug logging setting
-                            from . import config as cfg_module
-                            debug_cfg = cfg_module.load_config()
-                            debug_enabled = debug_cfg.get('ripping', {}).get('debug_logging', False)
-                            if debug_enabled:
-                                activity.log_info("STATUS_CHECK: MakeMKV not running + MKV files found, waiting 5s...")
-                            # Wait 5 seconds and re-check (handles gap between TV episodes)
-                            time.sleep(5)
-                            if not self._is_makemkv_running():
-                                # Still not running after delay - safe to post-process
-                                if debug_enabled:
-                                    activity.log_info("STATUS_CHECK: Still not running after 5s, triggering post-processing")
-                                activity.log_info("MakeMKV finished, starting post-processing")
-                                self.current_job.progress = 100
-                                self._update_step("rip", "complete", "Rip finished")
-                                thread = threading.Thread(target=self._run_post_processing)
-                                thread.daemon = True
-                                thread.start()
-                            else:
-                                # MakeMKV restarted (likely next TV episode) - go back to ripping
-                                self.current_job.status = RipStatus.RIPPING
-                                if debug_enabled:
-                                    activity.log_info("STATUS_CHECK: MakeMKV restarted (likely next episode), resuming rip status")
-
+                if self.current_job.status == RipStatus.RIPPING:
+                    self._ensure_status_sampler()
                 return self.current_job.to_dict()
             return None
 
+    def _ensure_status_sampler(self):
+        """Start the status sampler thread if it isn't running (caller holds _lock)"""
+        if self._sampler_thread and self._sampler_thread.is_alive():
+            return
+        self._makemkv_gone_at = None
+        self._sampler_thread = threading.Thread(target=self._status_sampler)
+        self._sampler_thread.daemon = True
+        self._sampler_thread.start()
+
+    def _status_sampler(self):
+        """Refresh size/progress/ETA every STATUS_SAMPLE_INTERVAL until the rip ends"""
+        while True:
+            with self._lock:
+                job = self.current_job
+                if not job or job.status != RipStatus.RIPPING:
+                    self._sampler_thread = None
+                    return
+            try:
+                self._sample_status(job)
+            except Exception as e:
+                activity.log_warning(f"STATUS_CHECK: Sampling failed: {e}")
+            time.sleep(STATUS_SAMPLE_INTERVAL)
+
+    def _sample_status(self, job: RipJob):
+        """Update a ripping job from its output on disk
+
+        The directory walks and the MakeMKV process check run without _lock, so
+        get_status and the rip thread never wait on them; the lock is only taken
+        to read the job's paths and to publish the results.
+        """
+        with self._lock:
+            output_dir = job.rip_output_dir
+            backup_dir = os.path.join(self.backup_path, job.folder_label)
+        if not output_dir:
+            return
+        # Check both raw output dir and backup dir (backup writes to different location)
+        raw_size = self._get_output_size(output_dir)
+        backup_size = self._get_output_size(backup_dir) if os.path.exists(backup_dir) else 0
+        raw_has_mkv = _has_files(output_dir, ".mkv")
+        makemkv_running = self._is_makemkv_running() is not None
+
+        with self._lock:
+            if self.current_job is not job or job.status != RipStatus.RIPPING:
+                return  # Cancelled or finished while we were sampling
+            self._publish_sample(job, max(raw_size, backup_size), raw_has_mkv, makemkv_running)
+
+    def _publish_sample(self, job: RipJob, size: int, raw_has_mkv: bool, makemkv_running: bool):
+        """Apply one sample to the job: size, progress, ETA, exit detection (caller holds _lock)"""
+        job.current_size_bytes = size
+        # Always calculate progress from file size (MakeMKV doesn't report PRGV for DVDs)
+        if job.expected_size_bytes > 0:
+            size_progress = int((job.current_size_bytes / job.expected_size_bytes) * 100)
+            job.progress = min(size_progress, 99)  # Cap at 99% until actually done
+            # Update step detail with dynamic status (for when MakeMKV doesn't report PRGV)
+            pct = job.progress
+            self._update_step("rip", "active",
+                              _rip_step_detail(job.rip_method == "backup", job.backup_phase_complete, pct))
+
+            # Update ETA based on elapsed time and progress
+            if pct > 0:
+                # Set rip start time if not already set
+                if not job.rip_started_at:
+                    job.rip_started_at = time.time()
+
+                # Calculate time-based ETA
+                elapsed = time.time() - job.rip_started_at
+                if pct >= 5 and elapsed > 30:  # Need enough data for reasonable estimate
+                    # Estimate total time = elapsed / (pct / 100)
+                    estimated_total = elapsed / (pct / 100)
+                    remaining_secs = estimated_total - elapsed
+                    if remaining_secs > 60:
+                        mins = int(remaining_secs / 60)
+                        job.eta = f"~{mins} min remaining"
+                    elif remaining_secs > 0:
+                        job.eta = f"<1 min remaining"
+                    else:
+                        job.eta = "Finishing..."
+                else:
+                    job.eta = f"{100 - pct}% remaining"
+
+        # Check if MakeMKV finished (process gone but we're still in ripping state)
+        # IMPORTANT: Only trigger post-processing if we have actual MKV output.
+        # During backup mode, there's a gap between backup completion and rip_from_backup
+        # where MakeMKV isn't running but we don't have MKV files yet.
+        # For TV/multi-track rips, MakeMKV stops between episodes - it has to stay gone
+        # for MAKEMKV_EXIT_GRACE seconds of samples before we post-process.
+        debug_enabled = config.debug_logging_enabled()
+        if not makemkv_running and raw_has_mkv and job.current_size_bytes > 0:
+            now = time.monotonic()
+            if self._makemkv_gone_at is None:
+                self._makemkv_gone_at = now
+                if debug_enabled:
+                    activity.log_info(f"STATUS_CHECK: MakeMKV not running + MKV files found, waiting {MAKEMKV_EXIT_GRACE}s...")
+            elif now - self._makemkv_gone_at >= MAKEMKV_EXIT_GRACE:
+                # Still not running after the grace period - safe to post-process
+                self._makemkv_gone_at = None
+                if debug_enabled:
+                    activity.log_info(f"STATUS_CHECK: Still not running after {MAKEMKV_EXIT_GRACE}s, triggering post-processing")
+                activity.log_info("MakeMKV finished, starting post-processing")
+                job.status = RipStatus.IDENTIFYING
+                job.progress = 100
+                self._update_step("rip", "complete", "Rip finished")
+                thread = threading.Thread(target=self._run_post_processing)
+                thread.daemon = True
+                thread.start()
+        elif self._makemkv_gone_at is not None:
+            # MakeMKV restarted (likely next TV episode) - keep ripping
+            self._makemkv_gone_at = None
+            if debug_enabled:
+                activity.log_info("STATUS_CHECK: MakeMKV restarted (likely next episode), resuming rip status")
+
     def _get_output_size(self, output_dir: str) -> int:
-        """Get total size of files in output directory (MKV for rips, all files for backups)"""
+        """Get total size of files in output directory (MKV for rips, all files for backups)
+
+        The status sampler calls this every second, so the recursive backup total
+        comes from a _BackupSizeTracker kept per directory for the current job
+        rather than a fresh stat of the whole BDMV tree.
+        """
         total = 0
         try:
             if os.path.isdir(output_dir):
                 # Check for MKV files (rip output)
-                for f in Path(output_dir).glob("*.mkv"):
-                    total += f.stat().st_size
+                total = _dir_size(output_dir, ".mkv")
                 # If no MKVs, count all files recursively (backup output has BDMV structure)
                 if total == 0:
-                    for f in Path(output_dir).rglob("*"):
-                        if f.is_file():
-                            total += f.stat().st_size
+                    tracker = self._size_trackers.get(output_dir)
+                    if tracker is None:
+                        tracker = self._size_trackers[output_dir] = _BackupSizeTracker(output_dir)
+                    total = tracker.total()
         except:
             pass
         return total
 
+    def _check_existing_raw_files(self, job: RipJob, output_dir: str):
+        """Flag MKVs left in the raw folder by a previous failed rip for review"""
+        if not os.path.isdir(output_dir):
+            return
+        existing_mkvs = _file_sizes(output_dir, ".mkv")
+        if not existing_mkvs:
+            return
+        names = [os.path.basename(path) for path in existing_mkvs]
+        job.has_existing_raw_files = True
+        job.existing_raw_info = {
+            "files": names,
+            "total_size_gb": round(sum(existing_mkvs.values()) / (1024**3), 2),
+            "path": output_dir
+        }
+        job.needs_review = True
+        activity.log_warning(f"EXISTING FILES: Found {len(names)} MKV(s) in raw folder ({job.existing_raw_info['total_size_gb']} GB)")
+        for name in names[:5]:
+            activity.log_warning(f"EXISTING FILES:   {name}")
+
     def reset_job(self) -> bool:
         """Reset/cancel the current job - clears state so a new rip can start"""
         with self._lock:
@@ -1960,14 +2440,17 @@ class RipEngine:
     def _kill_makemkv(self):
         """Kill any running MakeMKV process"""
         try:
-            result = subprocess.run(
-                ["pkill", "-f", "makemkvcon"],
-                capture_output=True,
-                timeout=5
-            )
-            if result.returncode == 0:
+            killed = False
+            for pid in _makemkvcon_pids():
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                    killed = True
+                except ProcessLookupError:
+                    pass  # Already exited
+            if killed:
                 activity.log_info("MakeMKV process killed")
-            return result.returncode == 0
+                self._mkv_running_cache = (0.0, None)
+            return killed
         except Exception as e:
             activity.log_error(f"Failed to kill MakeMKV: {e}")
             return False
@@ -1990,7 +2473,9 @@ class RipEngine:
 
         # Eject disc (unconditionally)
         try:
-            subprocess.run(["eject", device], capture_output=True, timeout=10)
+            if not _eject_ioctl(device):
+                subprocess.run(["eject", device], capture_output=True, timeout=10)
+            clear_disc_info_cache()
             activity.log_success("Disc ejected")
             ejected = True
         except Exception as e:
@@ -2042,7 +2527,9 @@ class RipEngine:
             # Step 2: Eject disc first
             activity.log_info("RESET: [2/5] Ejecting disc...")
             try:
-                subprocess.run(["eject", device], capture_output=True, timeout=10)
+                if not _eject_ioctl(device):
+                    subprocess.run(["eject", device], capture_output=True, timeout=10)
+                clear_disc_info_cache()
                 results["ejected"] = True
                 activity.log_info("RESET: [2/5] Disc ejected")
             except:
@@ -2195,7 +2682,9 @@ class RipEngine:
             # First try to unlock the drive in case it's stuck after I/O errors
             self.unlock_drive(device)
 
-            subprocess.run(["eject", device], capture_output=True, timeout=10)
+            if not _eject_ioctl(device):
+                subprocess.run(["eject", device], capture_output=True, timeout=10)
+            clear_disc_info_cache()
             activity.log_success("Disc ejected")
             # Mark disc as ejected in current job
             if self.current_job:
@@ -2261,38 +2750,39 @@ class RipEngine:
             # First get duration to calculate positions
             duration_secs = 0
             try:
-                result = subprocess.run(
-                    ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-                     '-of', 'default=noprint_wrappers=1:nokey=1', mkv_path],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    duration_secs = int(float(result.stdout.strip()))
+                duration_secs = int(_video_duration(mkv_path))
             except Exception as e:
                 activity.log_warning(f"THUMBNAIL: Could not get duration for {mkv_name}: {e}")
                 duration_secs = 1800  # Fallback to 30 min
 
-            # Generate thumbnails at each position
-            for idx, pct in enumerate(THUMB_POSITIONS):
-                try:
-                    seek_time = int(duration_secs * pct / 100)
-                    thumb_name = f"{stem}_{idx + 1}.jpg"
-                    thumb_path = os.path.join(review_folder, thumb_name)
-
-                    result = subprocess.run([
-                        'ffmpeg', '-y', '-ss', str(seek_time),
-                        '-i', mkv_path, '-vframes', '1',
-                        '-vf', 'scale=320:-1', thumb_path
-                    ], capture_output=True, timeout=30)
-
-                    if result.returncode == 0 and os.path.exists(thumb_path):
-                        thumb_list.append(thumb_name)
-                    else:
-                        activity.log_warning(f"THUMBNAIL: Failed frame {idx + 1} for {mkv_name}")
-                except subprocess.TimeoutExpired:
-                    activity.log_warning(f"THUMBNAIL: Timeout on frame {idx + 1} for {mkv_name}")
-                except Exception as e:
-                    activity.log_warning(f"THUMBNAIL: Error on frame {idx + 1} for {mkv_name}: {e}")
+            # One ffmpeg for all positions: each gets its own fast input seek
+            # (-ss before -i) and its own single-frame output, so the file is
+            # opened and the process started once instead of per frame
+            thumb_names = [f"{stem}_{idx + 1}.jpg" for idx in range(len(THUMB_POSITIONS))]
+            thumb_paths = [os.path.join(review_folder, name) for name in thumb_names]
+            cmd = ['ffmpeg', '-y']
+            for pct in THUMB_POSITIONS:
+                cmd += ['-ss', str(int(duration_secs * pct / 100)), '-i', mkv_path]
+            for idx, thumb_path in enumerate(thumb_paths):
+                cmd += ['-map', f'{idx}:v:0', '-frames:v', '1', '-vf', 'scale=320:-1', thumb_path]
+
+            try:
+                # Frames are collected by existence below, so clear leftovers first
+                for thumb_path in thumb_paths:
+                    if os.path.exists(thumb_path):
+                        os.remove(thumb_path)
+                subprocess.run(cmd, capture_output=True, timeout=30 * len(THUMB_POSITIONS))
+            except subprocess.TimeoutExpired:
+                activity.log_warning(f"THUMBNAIL: Timeout extracting frames for {mkv_name}")
+            except Exception as e:
+                activity.log_warning(f"THUMBNAIL: Error extracting frames for {mkv_name}: {e}")
+
+            # A failed seek only loses its own frame; keep the ones ffmpeg wrote
+            for idx, (thumb_name, thumb_path) in enumerate(zip(thumb_names, thumb_paths)):
+                if os.path.exists(thumb_path):
+                    thumb_list.append(thumb_name)
+                else:
+                    activity.log_warning(f"THUMBNAIL: Failed frame {idx + 1} for {mkv_name}")
 
             if thumb_list:
                 thumbnails[mkv_name] = thumb_list
@@ -2311,7 +2801,6 @@ class RipEngine:
         Returns:
             Dict with title, chapters list, and other metadata
         """
-        import json as json_module
         metadata = {
             "title": "",
             "chapters": [],
@@ -2326,7 +2815,7 @@ class RipEngine:
             ], capture_output=True, text=True, timeout=30)
 
             if result.returncode == 0 and result.stdout:
-                data = json_module.loads(result.stdout)
+                data = json.loads(result.stdout)
 
                 # Extract format-level title
                 fmt = data.get('format', {})
@@ -2381,15 +2870,9 @@ class RipEngine:
                 "metadata": {}
             }
 
-            # Get duration using ffprobe
+            # Get duration (MKV header, ffprobe fallback)
             try:
-                result = subprocess.run(
-                    ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-                     '-of', 'default=noprint_wrappers=1:nokey=1', mkv_path],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    track_info["duration_secs"] = int(float(result.stdout.strip()))
+                track_info["duration_secs"] = int(_video_duration(mkv_path))
             except Exception as e:
                 activity.log_warning(f"TRACK INFO: Could not get duration for {mkv_name}: {e}")
 
@@ -2486,8 +2969,9 @@ class RipEngine:
             if self.current_job and self.current_job.status not in [RipStatus.IDLE, RipStatus.COMPLETE, RipStatus.ERROR]:
                 return False  # Already ripping
 
-            # Reset cancelled flag for new rip
+            # Reset cancelled flag and size tracking for new rip
             self._cancelled = False
+            self._size_trackers = {}
 
             # Create new job
             self.current_job = RipJob(
@@ -2565,6 +3049,7 @@ class RipEngine:
             job.disc_tracks = disc_info.get("tracks", [])
             job.disc_track_sizes = disc_info.get("track_sizes", {})
             job.disc_cinfo_raw = disc_info.get("cinfo_raw", {})
+            job.disc_fingerprint = disc_info.get("cinfo_fingerprint", "")
 
             activity.disc_detected(job.disc_type.upper(), job.disc_label)
             self._update_step("detect", "complete", f"{job.disc_type.upper()}: {job.disc_label}")
@@ -2609,7 +3094,6 @@ class RipEngine:
                     episode_count = len(episode_tracks)
                     activity.log_info(f"PIPELINE: TV mode - {episode_count} episodes to rip")
                     job.tracks_to_rip = [t["index"] for t in episode_tracks]
-                    job.total_tracks = episode_count
                     self._run_tv_rip_pipeline_after_scan(disc_info)
                     return
                 else:
@@ -2678,24 +3162,11 @@ class RipEngine:
             job.status = RipStatus.RIPPING
             job.rip_started_at = time.time()  # Track for ETA calculation
 
-            output_dir = os.path.join(self.raw_path, sanitize_folder_name(job.disc_label))
+            output_dir = os.path.join(self.raw_path, job.folder_label)
             job.rip_output_dir = output_dir  # Track for file size monitoring
 
             # Check for existing MKV files in raw folder (orphaned from previous failed rips)
-            if os.path.exists(output_dir):
-                existing_mkvs = list(Path(output_dir).glob("*.mkv"))
-                if existing_mkvs:
-                    total_size = sum(f.stat().st_size for f in existing_mkvs)
-                    job.has_existing_raw_files = True
-                    job.existing_raw_info = {
-                        "files": [f.name for f in existing_mkvs],
-                        "total_size_gb": round(total_size / (1024**3), 2),
-                        "path": output_dir
-                    }
-                    job.needs_review = True
-                    activity.log_warning(f"EXISTING FILES: Found {len(existing_mkvs)} MKV(s) in raw folder ({job.existing_raw_info['total_size_gb']} GB)")
-                    for f in existing_mkvs[:5]:
-                        activity.log_warning(f"EXISTING FILES:   {f.name}")
+            self._check_existing_raw_files(job, output_dir)
 
             # Persist job state so we can recover if service restarts
             self._save_job_state()
@@ -2771,18 +3242,18 @@ class RipEngine:
                 job.rip_method = "backup"
 
                 # Create backup directory
-                backup_dir = os.path.join(self.backup_path, sanitize_folder_name(job.disc_label))
+                backup_dir = os.path.join(self.backup_path, job.folder_label)
 
                 # Check if valid backup already exists (skip re-backup on retry)
                 # Support both Blu-ray (BDMV) and DVD (VIDEO_TS) structures
-                bdmv_path = Path(backup_dir) / "BDMV"
-                video_ts_path = Path(backup_dir) / "VIDEO_TS"
-                has_backup_structure = bdmv_path.exists() or video_ts_path.exists()
-                is_dvd = video_ts_path.exists() and not bdmv_path.exists()
+                has_bdmv = os.path.exists(os.path.join(backup_dir, "BDMV"))
+                has_video_ts = os.path.exists(os.path.join(backup_dir, "VIDEO_TS"))
+                has_backup_structure = has_bdmv or has_video_ts
+                is_dvd = has_video_ts and not has_bdmv
                 existing_backup_valid = False
                 
                 if has_backup_structure:
-                    backup_size = sum(f.stat().st_size for f in Path(backup_dir).rglob("*") if f.is_file())
+                    backup_size = _dir_size(backup_dir, recursive=True)
                     # DVDs are smaller - use 100MB threshold, Blu-rays use 1GB
                     min_size = 100_000_000 if is_dvd else 1_000_000_000
                     if backup_size > min_size:
@@ -2891,7 +3362,7 @@ class RipEngine:
                     output_size = "0 bytes"
                     if job.rip_output_dir and os.path.exists(job.rip_output_dir):
                         try:
-                            total = sum(f.stat().st_size for f in Path(job.rip_output_dir).glob("*") if f.is_file())
+                            total = _dir_size(job.rip_output_dir)
                             if total > 0:
                                 output_size = f"{total / (1024*1024):.1f} MB"
                         except:
@@ -2925,19 +3396,13 @@ class RipEngine:
             self._set_progress(100)
 
             # Find actual output location (MakeMKV may have ignored our path)
-            import glob
-
             # First try MakeMKV's reported path, then our expected path, then search
             found_path = None
-            if actual_path and os.path.isdir(actual_path):
-                mkv_files = glob.glob(os.path.join(actual_path, "*.mkv"))
-                if mkv_files:
-                    found_path = actual_path
+            if actual_path and _has_files(actual_path, ".mkv"):
+                found_path = actual_path
 
-            if not found_path and os.path.isdir(output_dir):
-                mkv_files = glob.glob(os.path.join(output_dir, "*.mkv"))
-                if mkv_files:
-                    found_path = output_dir
+            if not found_path and _has_files(output_dir, ".mkv"):
+                found_path = output_dir
 
             if not found_path:
                 activity.log_warning(f"Searching for rip output...")
@@ -2945,8 +3410,9 @@ class RipEngine:
 
             if found_path:
                 job.output_path = found_path
-                mkv_files = glob.glob(os.path.join(found_path, "*.mkv"))
-                total_size = sum(os.path.getsize(f) for f in mkv_files)
+                mkv_sizes = _file_sizes(found_path, ".mkv")
+                mkv_files = list(mkv_sizes)
+                total_size = sum(mkv_sizes.values())
                 size_gb = total_size / (1024**3)
                 job.size_gb = size_gb  # Store for rip history
                 activity.log_success(f"Rip output: {found_path}/ ({size_gb:.1f} GB)")
@@ -2966,7 +3432,7 @@ class RipEngine:
                         filename = os.path.basename(mkv_file)
                         if len(mkv_files) > 1:
                             self._update_step("verify", "active", f"Checking {i+1}/{len(mkv_files)}...")
-                        result = check_file_integrity(mkv_file)
+                        result = check_file_integrity(mkv_file, **integrity_options(cfg))
                         if not result["valid"]:
                             integrity_errors.append((filename, result["error_count"]))
 
@@ -3017,7 +3483,6 @@ class RipEngine:
 
             try:
                 import shutil
-                import glob
 
                 # Check if this needs manual review
                 if job.needs_review:
@@ -3027,7 +3492,7 @@ class RipEngine:
 
                 # Determine destination folder name (sanitize for filesystem safety)
                 # Include year in folder name for Plex compatibility: "Movie Title (YYYY)"
-                title = job.identified_title or job.disc_label.replace("_", " ").title()
+                title = job.identified_title or job.fallback_title
                 if job.year:
                     dest_folder_name = sanitize_folder_name(f"{title} ({job.year})")
                 else:
@@ -3040,7 +3505,8 @@ class RipEngine:
                 activity.log_info(f"MOVE: Destination path: {dest_path}")
 
                 # Find all mkv files in source
-                mkv_files = glob.glob(os.path.join(source_path, "*.mkv"))
+                mkv_sizes = _file_sizes(source_path, ".mkv") if os.path.isdir(source_path) else {}
+                mkv_files = list(mkv_sizes)
                 activity.log_info(f"MOVE: Found {len(mkv_files)} MKV file(s) in source")
 
                 if not mkv_files:
@@ -3048,9 +3514,8 @@ class RipEngine:
                     self._update_step("move", "error", "No MKV files found")
                     return
 
-                for mkv in mkv_files:
-                    size_gb = os.path.getsize(mkv) / (1024**3)
-                    activity.log_info(f"MOVE:   - {os.path.basename(mkv)} ({size_gb:.2f} GB)")
+                for mkv, size in mkv_sizes.items():
+                    activity.log_info(f"MOVE:   - {os.path.basename(mkv)} ({size / (1024**3):.2f} GB)")
 
                 # Check if source is already in movies folder
                 source_in_movies = source_path.startswith(self.movies_path)
@@ -3059,11 +3524,7 @@ class RipEngine:
                 if source_in_movies and source_path == dest_path:
                     # Already in correct location, just rename files
                     activity.log_info(f"MOVE: Already in correct location, renaming files in place")
-                    for mkv_file in mkv_files:
-                        new_filename = f"{dest_folder_name}.mkv"
-                        if len(mkv_files) > 1:
-                            idx = mkv_files.index(mkv_file) + 1
-                            new_filename = f"{dest_folder_name} - Part {idx}.mkv"
+                    for mkv_file, new_filename in _part_filenames(mkv_files, dest_folder_name):
                         dest_file = os.path.join(dest_path, new_filename)
                         if mkv_file != dest_file:
                             activity.log_info(f"MOVE: Renaming: {os.path.basename(mkv_file)} -> {new_filename}")
@@ -3075,11 +3536,7 @@ class RipEngine:
                     # In movies but wrong folder - rename folder and files
                     activity.log_info(f"MOVE: In movies but different folder, moving to correct location")
                     Path(dest_path).mkdir(parents=True, exist_ok=True)
-                    for mkv_file in mkv_files:
-                        new_filename = f"{dest_folder_name}.mkv"
-                        if len(mkv_files) > 1:
-                            idx = mkv_files.index(mkv_file) + 1
-                            new_filename = f"{dest_folder_name} - Part {idx}.mkv"
+                    for mkv_file, new_filename in _part_filenames(mkv_files, dest_folder_name):
                         dest_file = os.path.join(dest_path, new_filename)
                         activity.log_info(f"MOVE: Moving: {os.path.basename(mkv_file)} -> {dest_path}/{new_filename}")
                         shutil.move(mkv_file, dest_file)
@@ -3099,11 +3556,7 @@ class RipEngine:
                     # Source is in rips/raw - move to movies
                     activity.log_info(f"MOVE: Moving from rips/raw to movies folder")
                     Path(dest_path).mkdir(parents=True, exist_ok=True)
-                    for mkv_file in mkv_files:
-                        new_filename = f"{dest_folder_name}.mkv"
-                        if len(mkv_files) > 1:
-                            idx = mkv_files.index(mkv_file) + 1
-                            new_filename = f"{dest_folder_name} - Part {idx}.mkv"
+                    for mkv_file, new_filename in _part_filenames(mkv_files, dest_folder_name):
                         dest_file = os.path.join(dest_path, new_filename)
                         activity.log_info(f"MOVE: Moving: {os.path.basename(mkv_file)} -> {dest_path}/{new_filename}")
                         shutil.move(mkv_file, dest_file)
@@ -3255,25 +3708,12 @@ class RipEngine:
             job.rip_started_at = time.time()  # Track for ETA calculation
 
             # Create output directory for this series/season
-            series_name = job.series_title or job.identified_title or job.disc_label.replace("_", " ").title()
+            series_name = job.series_title or job.identified_title or job.fallback_title
             output_dir = os.path.join(self.raw_path, sanitize_folder_name(f"{series_name}_S{job.season_number:02d}"))
             job.rip_output_dir = output_dir
 
             # Check for existing MKV files in raw folder (orphaned from previous failed rips)
-            if os.path.exists(output_dir):
-                existing_mkvs = list(Path(output_dir).glob("*.mkv"))
-                if existing_mkvs:
-                    total_size = sum(f.stat().st_size for f in existing_mkvs)
-                    job.has_existing_raw_files = True
-                    job.existing_raw_info = {
-                        "files": [f.name for f in existing_mkvs],
-                        "total_size_gb": round(total_size / (1024**3), 2),
-                        "path": output_dir
-                    }
-                    job.needs_review = True
-                    activity.log_warning(f"EXISTING FILES: Found {len(existing_mkvs)} MKV(s) in raw folder ({job.existing_raw_info['total_size_gb']} GB)")
-                    for f in existing_mkvs[:5]:
-                        activity.log_warning(f"EXISTING FILES:   {f.name}")
+            self._check_existing_raw_files(job, output_dir)
 
             # Persist job state
             self._save_job_state()
@@ -3320,12 +3760,9 @@ class RipEngine:
                 )
 
                 if success:
-                    # Find the ripped file
-                    import glob
-                    mkv_files = glob.glob(os.path.join(output_dir, "*.mkv"))
-                    # Get the newest file (just ripped)
-                    if mkv_files:
-                        newest = max(mkv_files, key=os.path.getmtime)
+                    # Find the ripped file - the newest one (just ripped)
+                    newest = _newest_file(output_dir, ".mkv")
+                    if newest:
                         # Apply language preference
                         preferred_lang = cfg.get('ripping', {}).get('preferred_language', 'eng')
                         if preferred_lang != 'all':
@@ -3368,7 +3805,7 @@ class RipEngine:
                     filename = os.path.basename(mkv_file)
                     if len(ripped_files) > 1:
                         self._update_step("verify", "active", f"Checking {i+1}/{len(ripped_files)}...")
-                    result = check_file_integrity(mkv_file)
+                    result = check_file_integrity(mkv_file, **integrity_options(cfg))
                     if not result["valid"]:
                         integrity_errors.append((filename, result["error_count"]))
 
@@ -3491,25 +3928,12 @@ class RipEngine:
             job.rip_started_at = time.time()
 
             # Create output directory
-            series_name = job.identified_title or job.disc_label.replace("_", " ").title()
+            series_name = job.identified_title or job.fallback_title
             output_dir = os.path.join(self.raw_path, sanitize_folder_name(f"{series_name}_S{job.season_number:02d}"))
             job.rip_output_dir = output_dir
 
             # Check for existing MKV files in raw folder (orphaned from previous failed rips)
-            if os.path.exists(output_dir):
-                existing_mkvs = list(Path(output_dir).glob("*.mkv"))
-                if existing_mkvs:
-                    total_size = sum(f.stat().st_size for f in existing_mkvs)
-                    job.has_existing_raw_files = True
-                    job.existing_raw_info = {
-                        "files": [f.name for f in existing_mkvs],
-                        "total_size_gb": round(total_size / (1024**3), 2),
-                        "path": output_dir
-                    }
-                    job.needs_review = True
-                    activity.log_warning(f"EXISTING FILES: Found {len(existing_mkvs)} MKV(s) in raw folder ({job.existing_raw_info['total_size_gb']} GB)")
-                    for f in existing_mkvs[:5]:
-                        activity.log_warning(f"EXISTING FILES:   {f.name}")
+            self._check_existing_raw_files(job, output_dir)
 
             self._save_job_state()
             activity.log_info(f"Saving episodes to {output_dir}/")
@@ -3542,10 +3966,8 @@ class RipEngine:
                 )
 
                 if success:
-                    import glob
-                    mkv_files = glob.glob(os.path.join(output_dir, "*.mkv"))
-                    if mkv_files:
-                        newest = max(mkv_files, key=os.path.getmtime)
+                    newest = _newest_file(output_dir, ".mkv")
+                    if newest:
                         ripped_files.append({
                             'path': newest,
                             'track': track_num,
@@ -3607,7 +4029,6 @@ class RipEngine:
                     track["thumbnails"] = thumbnails[track["filename"]]
 
             # Create review metadata file so it shows up in Review UI
-            import json
             metadata = {
                 "disc_label": job.disc_label,
                 "disc_type": job.disc_type,
@@ -3657,7 +4078,7 @@ class RipEngine:
         """
         import shutil
 
-        series_name = sanitize_folder_name(job.series_title or job.identified_title or job.disc_label.replace("_", " ").title())
+        series_name = sanitize_folder_name(job.series_title or job.identified_title or job.fallback_title)
 
         season_folder = f"Season {job.season_number:02d}"
         dest_dir = os.path.join(self.tv_path, series_name, season_folder)
@@ -3676,8 +4097,7 @@ class RipEngine:
                 # Build filename: "Series Name - SxxExx - Episode Title.mkv"
                 if ep_title and ep_title != f"Episode {ep_num}":
                     # Sanitize episode title
-                    safe_title = re.sub(r'[:]', '-', ep_title)
-                    safe_title = re.sub(r'[?<>"|*]', '', safe_title)
+                    safe_title = _UNSAFE_NAME_CHARS_RE.sub('', ep_title.replace(':', '-'))
                     filename = f"{series_name} - S{job.season_number:02d}E{ep_num:02d} - {safe_title}.mkv"
                 else:
                     filename = f"{series_name} - S{job.season_number:02d}E{ep_num:02d}.mkv"
@@ -3744,7 +4164,7 @@ class RipEngine:
                 shutil.move(mkv_file, dest_file)
                 moved_files.append(dest_file)
 
-            # Get video runtime using ffprobe
+            # Get video runtime from the moved files
             runtime_seconds = 0
             if moved_files:
                 from .identify import SmartIdentifier
@@ -3837,13 +4257,18 @@ class RipEngine:
                 return False
 
             activity.log_info(f"Ejecting disc from {device}")
-            result = subprocess.run(
-                ["eject", device],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode == 0:
+            if _eject_ioctl(device):
+                result = None
+            else:
+                # eject(1) also handles mounted discs and reports why it failed
+                result = subprocess.run(
+                    ["eject", device],
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+            if result is None or result.returncode == 0:
+                clear_disc_info_cache()
                 activity.log_success("Disc ejected")
                 # Mark disc as ejected in current job
                 if self.current_job:
@@ -3894,12 +4319,15 @@ class RipEngine:
             if proc.returncode == 0 and proc.stdout:
                 result["present"] = True
                 # Parse label if present
-                match = re.search(r'LABEL="([^"]*)"', proc.stdout)
+                match = _BLKID_LABEL_RE.search(proc.stdout)
                 if match:
                     result["label"] = match.group(1)
         except:
             pass
 
+        if not result["present"]:
+            # Drive is empty (possibly ejected with the button) - forget old scans
+            clear_disc_info_cache()
         return result
 
 
@@ -10,16 +10,29 @@ import threading
 from datetime import datetime
 from pathlib import Path
 
-from flask import Blueprint, render_template, jsonify, request, send_from_directory
+from flask import Blueprint, Response, render_template, jsonify, request, send_from_directory
 from . import config
 from . import ripper
 from . import email as email_utils
 from . import activity
 from . import community_db
 
+try:
+    import orjson  # Optional: faster encoding for the polled status endpoint
+except ImportError:
+    orjson = None
+
 main = Blueprint('main', __name__)
 
 
+def _json_response(data) -> Response:
+    """jsonify() equivalent that encodes with orjson when it's installed"""
+    if orjson is None:
+        return jsonify(data)
+    # episode_mapping etc. have int keys - stringify them like jsonify does
+    return Response(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS), mimetype='application/json')
+
+
 @main.route('/')
 def index():
     """Main dashboard"""
@@ -212,7 +225,7 @@ def api_rip_status():
 
     status = engine.get_status()
     if status:
-        return jsonify(status)
+        return _json_response(status)
     return jsonify({'status': 'idle'})
 
 
@@ -358,9 +371,11 @@ def api_disc_scan_identify():
     identifier = SmartIdentifier(cfg)
 
     # Detect media type from disc label and tracks
+    upper_label = info['disc_label'].upper()
     media_type, season_number, cleaned_title = identifier.detect_media_type(
         info['disc_label'],
-        info.get('tracks', [])
+        info.get('tracks', []),
+        upper_label=upper_label
     )
 
     # Also consider the disc info's TV detection
@@ -380,7 +395,10 @@ def api_disc_scan_identify():
             runtime_seconds = track.get('duration')
 
     # Parse disc label into search term
-    search_term = identifier.parse_disc_label(cleaned_title if media_type == 'tv' else info['disc_label'])
+    if media_type == 'tv':
+        search_term = identifier.parse_disc_label(cleaned_title)
+    else:
+        search_term = identifier.parse_disc_label(info['disc_label'], upper_label=upper_label)
 
     # Search based on media type
     result = None
@@ -605,6 +623,13 @@ def api_settings():
         deep_update(cfg, data)
         config.save_config(cfg)
 
+        # Radarr/Sonarr URLs or keys may have changed
+        from .identify import clear_lookup_cache
+        from . import identify_cache, library_export
+        clear_lookup_cache()
+        identify_cache.clear()
+        library_export.clear_fetch_cache()
+
         # Upload pending captures if community_db was just enabled
         if will_enable and not was_enabled:
             community_db.upload_pending_captures()
@@ -1742,6 +1767,10 @@ def api_review_apply():
         activity.file_moved(identified_title, dest_path)
         activity.log_success(f"REVIEW: Identified and moved: {identified_title}")
 
+        # A manual identification overrides whatever identify() cached for the disc
+        from . import identify_cache
+        identify_cache.clear()
+
         # Save to rip history
         activity.enrich_and_save_rip(
             title=identified_title,
@@ -1759,7 +1788,7 @@ def api_review_apply():
         # Contribute to community disc database (if enabled)
         # Manual identifications are valuable contributions
         # Guardrails in contribute_disc will filter out invalid entries
-        community_db.contribute_disc(
+        community_db.contribute_disc_async(
             disc_label=metadata.get('disc_label', folder_name),
             disc_type=metadata.get('disc_type', 'dvd'),
             duration_secs=metadata.get('duration_secs', 0),
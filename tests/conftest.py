@@ -21,6 +21,24 @@ def mock_activity_log(tmp_path):
                 yield
 
 
+@pytest.fixture(autouse=True)
+def identify_cache_db(tmp_path):
+    """Redirect the identify result cache to a temp database during tests"""
+    with patch('app.identify_cache.CACHE_DB', tmp_path / "identify_cache.db"):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_lookup_cache():
+    """Start every test with empty Radarr/Sonarr lookup and runtime caches"""
+    from app import identify
+    identify.clear_lookup_cache()
+    identify.clear_runtime_cache()
+    yield
+    identify.clear_lookup_cache()
+    identify.clear_runtime_cache()
+
+
 @pytest.fixture
 def sample_config():
     """Basic RipForge configuration for testing"""
@@ -119,6 +119,17 @@ class TestLookupDisc:
 class TestContributeDisc:
     """Tests for contribute_disc function"""
 
+    def test_async_runs_off_thread(self):
+        """Test contribute_disc_async hands its arguments to contribute_disc on another thread"""
+        import threading
+        calls = []
+        with patch('app.community_db.contribute_disc',
+                   side_effect=lambda **kw: calls.append((threading.current_thread(), kw))):
+            community_db.contribute_disc_async(disc_label='TEST', config={}).join(timeout=5)
+
+        assert calls[0][0] is not threading.main_thread()
+        assert calls[0][1] == {'disc_label': 'TEST', 'config': {}}
+
     def test_returns_false_when_disabled(self):
         """Test returns False when community DB disabled"""
         config = {'community_db': {'enabled': False}}
@@ -2,6 +2,7 @@
 Tests for RipForge configuration module
 """
 
+import os
 import pytest
 import yaml
 import tempfile
@@ -64,6 +65,50 @@ class TestSaveConfig:
                     assert loaded == test_config
 
 
+class TestDebugLoggingEnabled:
+    """Tests for the mtime-cached debug_logging lookup"""
+
+    def test_unchanged_file_not_reparsed(self, tmp_path):
+        """Test repeated calls reuse the cached flag while settings are unchanged"""
+        from app import config
+
+        settings = tmp_path / 'settings.yaml'
+        settings.write_text(yaml.dump({'ripping': {'debug_logging': True}}))
+
+        with patch.object(config, 'CONFIG_FILE', settings), \
+             patch.object(config, '_debug_logging_cache', None), \
+             patch.object(config, 'load_config', wraps=config.load_config) as mock_load:
+            assert config.debug_logging_enabled() is True
+            assert config.debug_logging_enabled() is True
+            assert mock_load.call_count == 1
+
+    def test_reloads_after_save(self, tmp_path):
+        """Test a changed settings file is picked up on the next call"""
+        from app import config
+
+        settings = tmp_path / 'settings.yaml'
+        settings.write_text(yaml.dump({'ripping': {'debug_logging': False}}))
+
+        with patch.object(config, 'CONFIG_FILE', settings), \
+             patch.object(config, '_debug_logging_cache', None):
+            assert config.debug_logging_enabled() is False
+
+            settings.write_text(yaml.dump({'ripping': {'debug_logging': True}}))
+            stat = settings.stat()
+            os.utime(settings, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            assert config.debug_logging_enabled() is True
+
+    def test_missing_settings_defaults_false(self, tmp_path):
+        """Test debug logging is off when no config exists"""
+        from app import config
+
+        with patch.object(config, 'CONFIG_FILE', tmp_path / 'missing.yaml'), \
+             patch.object(config, 'DEFAULT_CONFIG', tmp_path / 'default.yaml'), \
+             patch.object(config, '_debug_logging_cache', None):
+            assert config.debug_logging_enabled() is False
+
+
 class TestCheckForUpdates:
     """Tests for update checking"""
 
@@ -2,6 +2,8 @@
 Tests for RipForge identification module
 """
 
+import json
+import requests
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -110,6 +112,13 @@ class TestSmartIdentifier:
         assert "John Wick" in result
         assert "Chapter 4" in result
 
+    def test_parse_disc_label_franchise_backreference(self, sample_config):
+        """Test franchise replacement keeps its own group numbering"""
+        identifier = SmartIdentifier(sample_config)
+        assert identifier.parse_disc_label("FAST_AND_FURIOUS_7", verbose=False) == "Fast & Furious 7"
+        assert identifier.parse_disc_label("FAST_X", verbose=False) == "Fast X"
+        assert identifier.parse_disc_label("GUARDIANS_OF_THE_GALAXY_2", verbose=False) == "Guardians of the Galaxy Vol 2"
+
     def test_parse_disc_label_format_suffix(self, sample_config):
         """Test stripping format suffixes"""
         identifier = SmartIdentifier(sample_config)
@@ -117,6 +126,12 @@ class TestSmartIdentifier:
         assert "THX" not in result
         assert "DTS" not in result
 
+    def test_parse_disc_label_stacked_suffixes(self, sample_config):
+        """Test every stacked suffix is stripped, however many there are"""
+        identifier = SmartIdentifier(sample_config)
+        result = identifier.parse_disc_label("BLADE_RUNNER_DC_WS_DTS_THX_EXTENDED", verbose=False)
+        assert result == "Blade Runner"
+
     def test_detect_media_type_movie(self, sample_config, sample_tracks):
         """Test media type detection for movies"""
         identifier = SmartIdentifier(sample_config)
@@ -153,6 +168,111 @@ class TestSmartIdentifier:
         assert season == 0  # Unknown season for complete series
 
 
+class TestSplitTrailingNum:
+    """Tests for the sequel-number title helper"""
+
+    def test_splits_sequel_number(self):
+        """Test trailing number is split from the base title"""
+        from app.identify import _split_trailing_num
+        assert _split_trailing_num("Under Siege 2") == ("Under Siege", "2")
+
+    def test_no_trailing_number(self):
+        """Test titles without a trailing number are returned unchanged"""
+        from app.identify import _split_trailing_num
+        assert _split_trailing_num("Blade Runner 2049 Final Cut") == ("Blade Runner 2049 Final Cut", None)
+        assert _split_trailing_num("1917") == ("1917", None)
+
+
+def _ebml(elem_id: bytes, data: bytes) -> bytes:
+    """Encode an EBML element with an 8-byte size field"""
+    return elem_id + bytes([0x01]) + len(data).to_bytes(7, 'big') + data
+
+
+class TestReadMkvDuration:
+    """Tests for reading runtime from the MKV header"""
+
+    def _write_mkv(self, path, info_children: bytes):
+        header = _ebml(b'\x1a\x45\xdf\xa3', _ebml(b'\x42\x82', b'matroska'))
+        seek_head = _ebml(b'\x11\x4d\x9b\x74', b'\x00' * 16)
+        info = _ebml(b'\x15\x49\xa9\x66', info_children)
+        cluster = _ebml(b'\x1f\x43\xb6\x75', b'\x00' * 32)
+        segment = b'\x18\x53\x80\x67' + b'\x01\xff\xff\xff\xff\xff\xff\xff' + seek_head + info + cluster
+        path.write_bytes(header + segment)
+
+    def test_reads_duration_with_timecode_scale(self, tmp_path):
+        """Test Duration is scaled by TimecodeScale"""
+        import struct
+        from app.identify import read_mkv_duration
+        mkv = tmp_path / "title_t00.mkv"
+        # 7200.5s expressed in 1ms ticks
+        self._write_mkv(mkv, _ebml(b'\x2a\xd7\xb1', (1000000).to_bytes(3, 'big')) +
+                        _ebml(b'\x44\x89', struct.pack('>d', 7200500.0)))
+        assert read_mkv_duration(str(mkv)) == pytest.approx(7200.5)
+
+    def test_missing_duration_returns_none(self, tmp_path):
+        """Test files without a Duration element return None"""
+        from app.identify import read_mkv_duration
+        mkv = tmp_path / "title_t00.mkv"
+        self._write_mkv(mkv, _ebml(b'\x2a\xd7\xb1', (1000000).to_bytes(3, 'big')))
+        assert read_mkv_duration(str(mkv)) is None
+
+    def test_non_mkv_returns_none(self, tmp_path):
+        """Test non-Matroska files return None"""
+        from app.identify import read_mkv_duration
+        bogus = tmp_path / "bogus.mkv"
+        bogus.write_bytes(b'not a matroska file')
+        assert read_mkv_duration(str(bogus)) is None
+
+    def test_get_video_runtime_uses_header(self, tmp_path, sample_config):
+        """Test get_video_runtime reads MKV headers without ffprobe"""
+        import struct
+        self._write_mkv(tmp_path / "movie.mkv", _ebml(b'\x44\x89', struct.pack('>f', 5400000.0)))
+        identifier = SmartIdentifier(sample_config)
+        with patch('app.identify.subprocess.run') as mock_run:
+            assert identifier.get_video_runtime(str(tmp_path)) == 5400
+            mock_run.assert_not_called()
+
+    def test_get_video_runtime_cached_per_file_version(self, tmp_path, sample_config):
+        """Test ffprobe runs once per file, and again after the file changes"""
+        video = tmp_path / "movie.mp4"
+        video.write_bytes(b'x' * 10)
+        identifier = SmartIdentifier(sample_config)
+        probe = MagicMock(returncode=0, stdout='5400.2\n')
+
+        with patch('app.identify.subprocess.run', return_value=probe) as mock_run:
+            assert identifier.get_video_runtime(str(tmp_path)) == 5400
+            assert SmartIdentifier(sample_config).get_video_runtime(str(tmp_path)) == 5400
+            assert mock_run.call_count == 1
+
+            video.write_bytes(b'x' * 20)
+            identifier.get_video_runtime(str(tmp_path))
+            assert mock_run.call_count == 2
+
+    def test_runtime_cache_evicts_least_recently_used(self, tmp_path, sample_config):
+        """Test the runtime cache stays within RUNTIME_CACHE_MAX entries"""
+        from app import identify
+        folders = []
+        for name in ['a', 'b', 'c']:
+            folder = tmp_path / name
+            folder.mkdir()
+            (folder / "movie.mp4").write_bytes(b'x')
+            folders.append(str(folder))
+        identifier = SmartIdentifier(sample_config)
+        probe = MagicMock(returncode=0, stdout='5400\n')
+
+        with patch.object(identify, 'RUNTIME_CACHE_MAX', 2), \
+             patch('app.identify.subprocess.run', return_value=probe) as mock_run:
+            identifier.get_video_runtime(folders[0])
+            identifier.get_video_runtime(folders[1])
+            identifier.get_video_runtime(folders[0])  # a is now the most recently used
+            identifier.get_video_runtime(folders[2])  # evicts b
+            assert len(identify._runtime_cache) == 2
+            identifier.get_video_runtime(folders[0])
+            assert mock_run.call_count == 3
+            identifier.get_video_runtime(folders[1])
+            assert mock_run.call_count == 4
+
+
 class TestRuntimeMatching:
     """Tests for runtime-based matching logic"""
 
@@ -174,7 +294,7 @@ class TestRuntimeMatching:
 class TestRadarrSearch:
     """Tests for Radarr search functionality"""
 
-    @patch('app.identify.requests.get')
+    @patch('app.identify.requests.Session.get')
     def test_search_radarr_no_api_key(self, mock_get, sample_config):
         """Test search returns None when no API key configured"""
         config = sample_config.copy()
@@ -184,12 +304,13 @@ class TestRadarrSearch:
         assert result is None
         mock_get.assert_not_called()
 
-    @patch('app.identify.requests.get')
+    @patch('app.identify.requests.Session.get')
     def test_search_radarr_success(self, mock_get, sample_config, mock_radarr_response):
         """Test successful Radarr search"""
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = mock_radarr_response
+        mock_response.content = json.dumps(mock_radarr_response).encode()
         mock_get.return_value = mock_response
 
         identifier = SmartIdentifier(sample_config)
@@ -199,12 +320,29 @@ class TestRadarrSearch:
         assert "Guardians" in result.title
         assert result.media_type == "movie"
 
-    @patch('app.identify.requests.get')
+    @patch('app.identify.requests.Session.get')
+    def test_search_radarr_sequel_terms_deduped(self, mock_get, sample_config, mock_radarr_response):
+        """Test sequel titles query all search terms and dedupe by TMDB ID"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_radarr_response
+        mock_response.content = json.dumps(mock_radarr_response).encode()
+        mock_get.return_value = mock_response
+
+        identifier = SmartIdentifier(sample_config)
+        results = identifier.search_radarr_multi("Guardians of the Galaxy 3", limit=10)
+
+        terms = sorted(call.kwargs['params']['term'] for call in mock_get.call_args_list)
+        assert terms == ["Guardians of the Galaxy", "Guardians of the Galaxy 3", "Guardians of the Galaxy 3 movie"]
+        assert len(results) == len(mock_radarr_response)
+
+    @patch('app.identify.requests.Session.get')
     def test_search_radarr_no_results(self, mock_get, sample_config):
         """Test Radarr search with no results"""
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = []
+        mock_response.content = json.dumps([]).encode()
         mock_get.return_value = mock_response
 
         identifier = SmartIdentifier(sample_config)
@@ -212,7 +350,7 @@ class TestRadarrSearch:
 
         assert result is None
 
-    @patch('app.identify.requests.get')
+    @patch('app.identify.requests.Session.get')
     def test_search_radarr_api_error(self, mock_get, sample_config):
         """Test Radarr search handles API errors"""
         mock_response = MagicMock()
@@ -225,10 +363,65 @@ class TestRadarrSearch:
         assert result is None
 
 
+class TestRadarrRuntimeSearch:
+    """Tests for runtime-only Radarr library matching"""
+
+    LIBRARY = [
+        {'title': 'Short Film', 'year': 2001, 'tmdbId': 1, 'runtime': 20, 'images': []},
+        {'title': 'The Long Movie', 'year': 2010, 'tmdbId': 2, 'runtime': 121, 'images': []},
+        {'title': 'Unknown Runtime', 'year': 2015, 'tmdbId': 3, 'runtime': 0, 'images': []},
+    ]
+
+    @patch('app.identify.requests.Session.get')
+    def test_single_runtime_match(self, mock_get, sample_config):
+        """Test a single library movie within tolerance is returned"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = self.LIBRARY
+        mock_response.content = json.dumps(self.LIBRARY).encode()
+        mock_get.return_value = mock_response
+
+        identifier = SmartIdentifier(sample_config)
+        result = identifier.search_radarr_by_runtime(7300, verbose=False)
+
+        assert result is not None
+        assert result.title == 'The Long Movie'
+        assert result.confidence <= 85
+
+    @patch('app.identify.requests.Session.get')
+    def test_library_fetch_is_cached(self, mock_get, sample_config):
+        """Test repeated runtime searches reuse the cached library"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = self.LIBRARY
+        mock_response.content = json.dumps(self.LIBRARY).encode()
+        mock_get.return_value = mock_response
+
+        identifier = SmartIdentifier(sample_config)
+        identifier.search_radarr_by_runtime(7300, verbose=False)
+        assert identifier.search_radarr_by_runtime(9999, verbose=False) is None
+        assert mock_get.call_count == 1
+
+    @patch('app.identify.requests.Session.get')
+    def test_library_shared_across_instances(self, mock_get, sample_config):
+        """Test separate identifiers (one per identification) share one library fetch"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = self.LIBRARY
+        mock_response.content = json.dumps(self.LIBRARY).encode()
+        mock_get.return_value = mock_response
+
+        SmartIdentifier(sample_config).search_radarr_by_runtime(7300, verbose=False)
+        result = SmartIdentifier(sample_config).search_radarr_by_runtime(1200, verbose=False)
+
+        assert result.title == 'Short Film'
+        assert mock_get.call_count == 1
+
+
 class TestSonarrSearch:
     """Tests for Sonarr search functionality"""
 
-    @patch('app.identify.requests.get')
+    @patch('app.identify.requests.Session.get')
     def test_search_sonarr_no_api_key(self, mock_get, sample_config):
         """Test search returns None when no API key configured"""
         config = sample_config.copy()
@@ -238,12 +431,13 @@ class TestSonarrSearch:
         assert result is None
         mock_get.assert_not_called()
 
-    @patch('app.identify.requests.get')
+    @patch('app.identify.requests.Session.get')
     def test_search_sonarr_success(self, mock_get, sample_config, mock_sonarr_response):
         """Test successful Sonarr search"""
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = mock_sonarr_response
+        mock_response.content = json.dumps(mock_sonarr_response).encode()
         mock_get.return_value = mock_response
 
         identifier = SmartIdentifier(sample_config)
@@ -253,12 +447,13 @@ class TestSonarrSearch:
         assert result.title == "Breaking Bad"
         assert result.media_type == "tv"
 
-    @patch('app.identify.requests.get')
+    @patch('app.identify.requests.Session.get')
     def test_search_sonarr_with_episode_runtimes(self, mock_get, sample_config, mock_sonarr_response):
         """Test Sonarr search with episode runtime matching"""
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = mock_sonarr_response
+        mock_response.content = json.dumps(mock_sonarr_response).encode()
         mock_get.return_value = mock_response
 
         identifier = SmartIdentifier(sample_config)
@@ -269,6 +464,78 @@ class TestSonarrSearch:
         assert result is not None
         assert result.title == "Breaking Bad"
 
+    @patch('app.identify.requests.Session.get')
+    def test_repeat_lookup_uses_cache(self, mock_get, sample_config, mock_sonarr_response):
+        """Test repeat lookups for the same title reuse the cached response"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_sonarr_response
+        mock_response.content = json.dumps(mock_sonarr_response).encode()
+        mock_get.return_value = mock_response
+
+        SmartIdentifier(sample_config).search_sonarr("Breaking Bad", verbose=False)
+        result = SmartIdentifier(sample_config).search_sonarr("Breaking Bad", verbose=False)
+
+        assert result.title == "Breaking Bad"
+        assert mock_get.call_count == 1
+
+    @patch('app.identify.time.sleep')
+    @patch('app.identify.requests.Session.get')
+    def test_connection_error_not_retried_by_hand(self, mock_get, mock_sleep, sample_config):
+        """Test connection failures return None without a sleeping retry loop"""
+        mock_get.side_effect = requests.exceptions.ConnectionError("refused")
+
+        identifier = SmartIdentifier(sample_config)
+        result = identifier.search_sonarr("Breaking Bad", verbose=False)
+
+        assert result is None
+        mock_get.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('app.identify.requests.Session.get')
+    def test_error_responses_not_cached(self, mock_get, sample_config):
+        """Test failed lookups are retried on the next call"""
+        mock_response = MagicMock()
+        mock_response.status_code = 500
+        mock_get.return_value = mock_response
+
+        identifier = SmartIdentifier(sample_config)
+        identifier.search_sonarr("Breaking Bad", verbose=False)
+        identifier.search_sonarr("Breaking Bad", verbose=False)
+
+        assert mock_get.call_count == 2
+
+    @patch('app.identify.requests.Session.get')
+    def test_lookup_cache_evicts_least_recently_used(self, mock_get, sample_config):
+        """Test the lookup cache stays within LOOKUP_CACHE_MAX entries"""
+        from app import identify
+        mock_get.return_value = MagicMock(status_code=200, content=b'[]', **{'json.return_value': []})
+        identifier = SmartIdentifier(sample_config)
+
+        with patch.object(identify, 'LOOKUP_CACHE_MAX', 2):
+            identifier._lookup('sonarr', 'series/lookup', 'a')
+            identifier._lookup('sonarr', 'series/lookup', 'b')
+            identifier._lookup('sonarr', 'series/lookup', 'a')  # a is now the most recently used
+            identifier._lookup('sonarr', 'series/lookup', 'c')  # evicts b
+            assert mock_get.call_count == 3
+            identifier._lookup('sonarr', 'series/lookup', 'a')
+            assert mock_get.call_count == 3
+            identifier._lookup('sonarr', 'series/lookup', 'b')
+            assert mock_get.call_count == 4
+
+    @patch('app.identify.requests.Session.get')
+    def test_expired_lookups_swept_on_write(self, mock_get, sample_config):
+        """Test entries past their TTL are dropped when a new response is stored"""
+        from app import identify
+        mock_get.return_value = MagicMock(status_code=200, content=b'[]', **{'json.return_value': []})
+        identifier = SmartIdentifier(sample_config)
+
+        with patch('app.identify.time.monotonic', side_effect=[0.0, 1000.0]):
+            identifier._lookup('sonarr', 'series/lookup', 'old', ttl=600)
+            identifier._lookup('sonarr', 'series/lookup', 'new', ttl=600)
+
+        assert [key[2] for key in identify._lookup_cache] == ['new']
+
 
 class TestMediaTypeDetection:
     """Tests for media type detection"""
@@ -297,6 +564,21 @@ class TestMediaTypeDetection:
         media_type, _, _ = identifier.detect_media_type("TEST_DISC", tracks=track_info)
         assert media_type == "movie"
 
+    def test_repeated_season_indicator_removed_everywhere(self, sample_config):
+        """Test every occurrence of the season indicator is stripped from the title"""
+        identifier = SmartIdentifier(sample_config)
+        media_type, season, title = identifier.detect_media_type("FRIENDS_SEASON_2_DVD_SEASON_2")
+        assert media_type == "tv"
+        assert season == 2
+        assert title == "FRIENDS_DVD"
+
+    def test_pattern_priority_follows_list_order(self, sample_config):
+        """Test an earlier TV pattern wins even when a later one appears first in the label"""
+        identifier = SmartIdentifier(sample_config)
+        _, season, title = identifier.detect_media_type("COMPLETE_SERIES_LOST_S3")
+        assert season == 3
+        assert title == "COMPLETE_SERIES_LOST"
+
 
 class TestParseDiscLabel:
     """Tests for disc label parsing"""
@@ -425,6 +707,76 @@ class TestMatchTracksToEpisodes:
         assert result_high[0]['suggested_episode'] == 1
 
 
+class TestMatchEpisodesToTracks:
+    """Tests for SmartIdentifier.match_episodes_to_tracks"""
+
+    @staticmethod
+    def _episodes(runtimes):
+        return [{'episode_number': i + 1, 'season_number': 1, 'runtime': rt, 'title': f"Episode {i + 1}"}
+                for i, rt in enumerate(runtimes)]
+
+    def test_equal_runtimes_stay_sequential(self, sample_config):
+        """Test tracks map to episodes in order when every runtime matches"""
+        identifier = SmartIdentifier(sample_config)
+        with patch.object(identifier, 'get_sonarr_episodes', return_value=self._episodes([2700] * 4)):
+            mapping = identifier.match_episodes_to_tracks(1, 1, [2700, 2690, 2710, 2700])
+
+        assert [mapping[i]['episode_number'] for i in range(4)] == [1, 2, 3, 4]
+
+    def test_closer_later_track_keeps_its_episode(self, sample_config):
+        """Test an early track doesn't steal the episode a later track matches exactly"""
+        identifier = SmartIdentifier(sample_config)
+        episodes = self._episodes([2600, 2650])
+        with patch.object(identifier, 'get_sonarr_episodes', return_value=episodes):
+            # Track-by-track greedy gave track 0 ep 1 (20s off), leaving track 1 50s off ep 2
+            mapping = identifier.match_episodes_to_tracks(1, 1, [2620, 2600])
+
+        assert mapping[1]['episode_number'] == 1
+        assert mapping[0]['episode_number'] == 2
+
+    def test_unmatched_track_gets_sequential_number(self, sample_config):
+        """Test tracks outside tolerance fall back to their position"""
+        identifier = SmartIdentifier(sample_config)
+        with patch.object(identifier, 'get_sonarr_episodes', return_value=self._episodes([2700, 2700])):
+            mapping = identifier.match_episodes_to_tracks(1, 1, [2700, 600])
+
+        assert mapping[0]['episode_number'] == 1
+        assert mapping[1]['episode_number'] == 2
+        assert mapping[1]['title'] == "Episode 2"
+
+
+class TestGetSonarrEpisodesBulk:
+    """Tests for SmartIdentifier.get_sonarr_episodes_bulk"""
+
+    @patch('app.identify.requests.Session.get')
+    def test_one_lookup_per_series(self, mock_get, sample_config):
+        """Test each series is looked up once, however many seasons are requested"""
+        def lookup(url, params=None, **kwargs):
+            counts = {'tvdb:1': [10, 12], 'tvdb:2': [6]}[params['term']]
+            series = [{'runtime': 30, 'seasons': [
+                {'seasonNumber': n + 1, 'statistics': {'totalEpisodeCount': c}} for n, c in enumerate(counts)
+            ]}]
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = series
+            response.content = json.dumps(series).encode()
+            return response
+        mock_get.side_effect = lookup
+
+        identifier = SmartIdentifier(sample_config)
+        result = identifier.get_sonarr_episodes_bulk([(1, 1), (1, 2), (2, 1)])
+
+        assert mock_get.call_count == 2
+        assert [len(result[key]) for key in [(1, 1), (1, 2), (2, 1)]] == [10, 12, 6]
+        assert result[(2, 1)][0]['runtime'] == 30 * 60
+
+    def test_empty_without_api_key(self, sample_config):
+        """Test returns empty dict when Sonarr API key missing"""
+        config = sample_config.copy()
+        config['integrations'] = {'sonarr': {'url': 'http://localhost:8989', 'api_key': ''}}
+        assert SmartIdentifier(config).get_sonarr_episodes_bulk([(1, 1)]) == {}
+
+
 class TestGetSeasonEpisodesForReview:
     """Tests for get_season_episodes_for_review method"""
 
@@ -436,12 +788,12 @@ class TestGetSeasonEpisodesForReview:
         result = identifier.get_season_episodes_for_review(12345, 1)
         assert result == []
 
-    @patch('requests.get')
+    @patch('app.identify.requests.Session.get')
     def test_returns_episodes_on_success(self, mock_get, sample_config):
         """Test returns episode list on successful API call"""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [{
+        series = [{
             'title': 'Test Show',
             'runtime': 45,
             'seasons': [
@@ -449,6 +801,8 @@ class TestGetSeasonEpisodesForReview:
                 {'seasonNumber': 2, 'statistics': {'totalEpisodeCount': 12}},
             ]
         }]
+        mock_response.json.return_value = series
+        mock_response.content = json.dumps(series).encode()
         mock_get.return_value = mock_response
 
         identifier = SmartIdentifier(sample_config)
@@ -459,7 +813,7 @@ class TestGetSeasonEpisodesForReview:
         assert result[0]['runtime_secs'] == 45 * 60  # Converted to seconds
         assert result[9]['episode_num'] == 10
 
-    @patch('requests.get')
+    @patch('app.identify.requests.Session.get')
     def test_handles_api_error(self, mock_get, sample_config):
         """Test handles API errors gracefully"""
         mock_response = MagicMock()
@@ -470,25 +824,27 @@ class TestGetSeasonEpisodesForReview:
         result = identifier.get_season_episodes_for_review(12345, 1)
         assert result == []
 
-    @patch('requests.get')
+    @patch('app.identify.requests.Session.get')
     def test_handles_missing_season(self, mock_get, sample_config):
         """Test handles request for non-existent season"""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [{
+        series = [{
             'title': 'Test Show',
             'runtime': 45,
             'seasons': [
                 {'seasonNumber': 1, 'statistics': {'totalEpisodeCount': 10}},
             ]
         }]
+        mock_response.json.return_value = series
+        mock_response.content = json.dumps(series).encode()
         mock_get.return_value = mock_response
 
         identifier = SmartIdentifier(sample_config)
         result = identifier.get_season_episodes_for_review(12345, 5)  # Season 5 doesn't exist
         assert result == []
 
-    @patch('requests.get')
+    @patch('app.identify.requests.Session.get')
     def test_handles_network_exception(self, mock_get, sample_config):
         """Test handles network exceptions gracefully"""
         mock_get.side_effect = Exception("Connection failed")
@@ -0,0 +1,94 @@
+"""
+Tests for RipForge Identify Cache module
+"""
+
+import pytest
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import identify_cache
+from app.identify import SmartIdentifier, IdentificationResult
+
+
+class TestGetPut:
+    """Tests for get/put round-trips"""
+
+    def test_miss_on_empty_cache(self):
+        """Test unknown discs return None"""
+        assert identify_cache.get('UNKNOWN_DISC', 7200) is None
+
+    def test_round_trip(self):
+        """Test stored results come back unchanged"""
+        identify_cache.put('THE_MATRIX', 8160, {'title': 'The Matrix', 'year': 1999})
+        assert identify_cache.get('THE_MATRIX', 8160) == {'title': 'The Matrix', 'year': 1999}
+
+    def test_runtime_bucketed_by_minute(self):
+        """Test runtimes within the same minute share an entry"""
+        identify_cache.put('THE_MATRIX', 8160, {'title': 'The Matrix'})
+        assert identify_cache.get('THE_MATRIX', 8199) is not None
+        assert identify_cache.get('THE_MATRIX', 8220) is None
+
+    def test_expired_entry_ignored(self):
+        """Test entries older than CACHE_MAX_AGE are treated as misses"""
+        identify_cache.put('THE_MATRIX', 8160, {'title': 'The Matrix'})
+        conn = sqlite3.connect(identify_cache.CACHE_DB)
+        with conn:
+            conn.execute("UPDATE identify_cache SET ts = ts - ?", (identify_cache.CACHE_MAX_AGE + 10,))
+        conn.close()
+
+        assert identify_cache.get('THE_MATRIX', 8160) is None
+
+    def test_clear(self):
+        """Test clear removes all entries"""
+        identify_cache.put('THE_MATRIX', 8160, {'title': 'The Matrix'})
+        identify_cache.clear()
+        assert identify_cache.get('THE_MATRIX', 8160) is None
+
+
+class TestIdentifyUsesCache:
+    """Tests for SmartIdentifier.identify cache integration"""
+
+    def test_confident_result_cached_and_reused(self, sample_config):
+        """Test a second identify of the same disc skips the searches"""
+        found = IdentificationResult(title='Serenity', year=2005, tmdb_id=16320, confidence=90,
+                                     episode_mapping={0: {'episode_number': 1}})
+        identifier = SmartIdentifier(sample_config)
+
+        with patch.object(identifier, 'get_video_runtime', return_value=7140), \
+             patch.object(identifier, '_identify_uncached', return_value=found) as mock_cascade:
+            first = identifier.identify('/rips/SERENITY (2005)')
+            second = identifier.identify('/rips/SERENITY (2005)')
+
+        assert mock_cascade.call_count == 1
+        assert first is found
+        assert second.title == 'Serenity'
+        assert second.episode_mapping == {0: {'episode_number': 1}}
+
+    def test_low_confidence_result_not_cached(self, sample_config):
+        """Test weak matches are re-searched next time"""
+        weak = IdentificationResult(title='Serenity', confidence=30)
+        identifier = SmartIdentifier(sample_config)
+
+        with patch.object(identifier, 'get_video_runtime', return_value=7140), \
+             patch.object(identifier, '_identify_uncached', return_value=weak) as mock_cascade:
+            identifier.identify('/rips/SERENITY')
+            identifier.identify('/rips/SERENITY')
+
+        assert mock_cascade.call_count == 2
+
+    def test_stale_schema_entry_is_a_miss(self, sample_config):
+        """Test an entry with fields IdentificationResult no longer has is re-searched"""
+        identify_cache.put('SERENITY', 7140, {'title': 'Serenity', 'removed_field': 1})
+        found = IdentificationResult(title='Serenity', confidence=90)
+        identifier = SmartIdentifier(sample_config)
+
+        with patch.object(identifier, 'get_video_runtime', return_value=7140), \
+             patch.object(identifier, '_identify_uncached', return_value=found) as mock_cascade:
+            result = identifier.identify('/rips/SERENITY')
+
+        mock_cascade.assert_called_once()
+        assert result is found
@@ -4,6 +4,9 @@ Tests for RipForge Library Export module
 
 import pytest
 import io
+import os
+import json
+import threading
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -13,9 +16,27 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 # Skip tests if reportlab is not installed (dev dependency)
 pytest.importorskip('reportlab', reason='reportlab not installed')
 
+from PIL import Image as PILImage
+
 from app import library_export
 
 
+@pytest.fixture(autouse=True)
+def poster_cache_dir(tmp_path):
+    """Redirect the poster cache to a temp directory during tests"""
+    cache_dir = tmp_path / ".poster_cache"
+    with patch('app.library_export.POSTER_CACHE_DIR', cache_dir):
+        yield cache_dir
+
+
+@pytest.fixture(autouse=True)
+def clear_fetch_cache():
+    """Start every test with an empty library fetch cache"""
+    library_export.clear_fetch_cache()
+    yield
+    library_export.clear_fetch_cache()
+
+
 class TestFetchMoviesFromRadarr:
     """Tests for fetch_movies_from_radarr function"""
 
@@ -41,7 +62,7 @@ class TestFetchMoviesFromRadarr:
 
         assert result == []
 
-    @patch('app.library_export.requests.get')
+    @patch('app.library_export.http.SESSION.get')
     @patch('app.library_export.config.load_config')
     def test_fetches_and_sorts_movies(self, mock_config, mock_get):
         """Test fetches movies and sorts alphabetically"""
@@ -62,6 +83,7 @@ class TestFetchMoviesFromRadarr:
             {'title': 'Apple Movie', 'year': 2023},
             {'title': 'Moon Movie', 'year': 2022},
         ]
+        mock_resp.content = json.dumps(mock_resp.json.return_value).encode()
         mock_get.return_value = mock_resp
 
         result = library_export.fetch_movies_from_radarr()
@@ -71,7 +93,7 @@ class TestFetchMoviesFromRadarr:
         assert result[1]['title'] == 'Moon Movie'
         assert result[2]['title'] == 'Zebra Movie'
 
-    @patch('app.library_export.requests.get')
+    @patch('app.library_export.http.SESSION.get')
     @patch('app.library_export.config.load_config')
     def test_handles_api_error(self, mock_config, mock_get):
         """Test handles API error gracefully"""
@@ -93,7 +115,7 @@ class TestFetchMoviesFromRadarr:
 
         assert result == []
 
-    @patch('app.library_export.requests.get')
+    @patch('app.library_export.http.SESSION.get')
     @patch('app.library_export.config.load_config')
     def test_handles_network_exception(self, mock_config, mock_get):
         """Test handles network exceptions gracefully"""
@@ -138,7 +160,7 @@ class TestFetchShowsFromSonarr:
 
         assert result == []
 
-    @patch('app.library_export.requests.get')
+    @patch('app.library_export.http.SESSION.get')
     @patch('app.library_export.config.load_config')
     def test_fetches_and_sorts_shows(self, mock_config, mock_get):
         """Test fetches shows and sorts alphabetically"""
@@ -158,6 +180,7 @@ class TestFetchShowsFromSonarr:
             {'title': 'Zeta Show', 'year': 2020},
             {'title': 'Alpha Show', 'year': 2019},
         ]
+        mock_resp.content = json.dumps(mock_resp.json.return_value).encode()
         mock_get.return_value = mock_resp
 
         result = library_export.fetch_shows_from_sonarr()
@@ -166,6 +189,28 @@ class TestFetchShowsFromSonarr:
         assert result[0]['title'] == 'Alpha Show'
         assert result[1]['title'] == 'Zeta Show'
 
+    @patch('app.library_export.http.SESSION.get')
+    @patch('app.library_export.config.load_config')
+    def test_repeat_fetch_uses_cache(self, mock_config, mock_get):
+        """Test back-to-back fetches reuse the library list"""
+        mock_config.return_value = {
+            'integrations': {
+                'sonarr': {'enabled': True, 'url': 'http://localhost:8989', 'api_key': 'test_key'}
+            }
+        }
+
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = [{'title': 'Alpha Show', 'year': 2019}]
+        mock_resp.content = json.dumps(mock_resp.json.return_value).encode()
+        mock_get.return_value = mock_resp
+
+        first = library_export.fetch_shows_from_sonarr()
+        second = library_export.fetch_shows_from_sonarr()
+
+        assert first == second
+        mock_get.assert_called_once()
+
 
 class TestDownloadPoster:
     """Tests for download_poster function"""
@@ -180,7 +225,7 @@ class TestDownloadPoster:
         result = library_export.download_poster(None)
         assert result is None
 
-    @patch('app.library_export.requests.get')
+    @patch('app.library_export.http.SESSION.get')
     def test_downloads_and_creates_image(self, mock_get):
         """Test downloads poster and creates Image object"""
         # Create minimal valid JPEG data
@@ -198,7 +243,7 @@ class TestDownloadPoster:
             result = library_export.download_poster('https://example.com/poster.jpg')
             mock_get.assert_called_once()
 
-    @patch('app.library_export.requests.get')
+    @patch('app.library_export.http.SESSION.get')
     def test_handles_download_error(self, mock_get):
         """Test handles download errors gracefully"""
         mock_resp = MagicMock()
@@ -209,7 +254,7 @@ class TestDownloadPoster:
 
         assert result is None
 
-    @patch('app.library_export.requests.get')
+    @patch('app.library_export.http.SESSION.get')
     def test_handles_exception(self, mock_get):
         """Test handles exceptions gracefully"""
         mock_get.side_effect = Exception("Network error")
@@ -219,6 +264,159 @@ class TestDownloadPoster:
         assert result is None
 
 
+def _poster_response(size=(1000, 1500)):
+    """Mock streamed response carrying a real PNG poster"""
+    buf = io.BytesIO()
+    PILImage.new('RGB', size, (200, 30, 30)).save(buf, 'PNG')
+    data = buf.getvalue()
+
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.iter_content.return_value = [data[i:i + 8192] for i in range(0, len(data), 8192)]
+    return mock_resp
+
+
+class TestPosterThumbnail:
+    """Tests for poster downscaling"""
+
+    @patch('app.library_export.Image')
+    @patch('app.library_export.http.SESSION.get')
+    def test_poster_is_downscaled_to_jpeg(self, mock_get, mock_image):
+        """Test large posters are stored as small JPEG thumbnails"""
+        mock_get.return_value = _poster_response((1000, 1500))
+
+        library_export.download_poster('https://example.com/big.png')
+
+        assert mock_get.call_args.kwargs['stream'] is True
+        data = library_export._poster_cache_path('https://example.com/big.png').read_bytes()
+        with PILImage.open(io.BytesIO(data)) as thumb:
+            assert thumb.format == 'JPEG'
+            assert thumb.size[0] <= 150 and thumb.size[1] <= 200
+
+    @patch('app.library_export.http.SESSION.get')
+    def test_undecodable_poster_returns_none(self, mock_get):
+        """Test garbage image data is skipped"""
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.iter_content.return_value = [b'not an image']
+        mock_get.return_value = mock_resp
+
+        assert library_export.download_poster('https://example.com/bad.jpg') is None
+        assert not library_export._poster_cache_path('https://example.com/bad.jpg').exists()
+
+
+class TestPosterCache:
+    """Tests for the on-disk poster cache"""
+
+    @patch('app.library_export.Image')
+    @patch('app.library_export.http.SESSION.get')
+    def test_second_download_uses_cache(self, mock_get, mock_image, poster_cache_dir):
+        """Test a cached poster is not downloaded again"""
+        mock_get.return_value = _poster_response()
+
+        library_export.download_poster('https://example.com/poster.jpg')
+        library_export.download_poster('https://example.com/poster.jpg')
+
+        assert mock_get.call_count == 1
+        cached = library_export._poster_cache_path('https://example.com/poster.jpg')
+        assert cached.parent.parent == poster_cache_dir
+        assert cached.read_bytes().startswith(b'\xff\xd8')
+
+    @patch('app.library_export.Image')
+    @patch('app.library_export.http.SESSION.get')
+    def test_expired_entry_is_refetched(self, mock_get, mock_image):
+        """Test stale cache entries trigger a new download"""
+        url = 'https://example.com/old.jpg'
+        library_export._write_cached_poster(url, b'old')
+        path = library_export._poster_cache_path(url)
+        stale = path.stat().st_mtime - library_export.POSTER_CACHE_MAX_AGE - 10
+        os.utime(path, (stale, stale))
+
+        mock_get.return_value = _poster_response()
+
+        library_export.download_poster(url)
+
+        mock_get.assert_called_once()
+        assert path.read_bytes() != b'old'
+
+    def test_prune_evicts_oldest_first(self):
+        """Test pruning removes least recently used posters until under the limit"""
+        for i, url in enumerate(['a', 'b', 'c']):
+            library_export._write_cached_poster(url, b'x' * 100)
+            path = library_export._poster_cache_path(url)
+            os.utime(path, (1000 + i, 1000 + i))
+
+        library_export.prune_poster_cache(max_bytes=200)
+
+        assert not library_export._poster_cache_path('a').exists()
+        assert library_export._poster_cache_path('b').exists()
+        assert library_export._poster_cache_path('c').exists()
+
+
+class TestDownloadPosters:
+    """Tests for parallel poster downloads"""
+
+    def test_poster_url_prefers_remote_url(self):
+        """Test poster URL comes from the first poster image"""
+        item = {'images': [
+            {'coverType': 'fanart', 'remoteUrl': 'https://example.com/fanart.jpg'},
+            {'coverType': 'poster', 'remoteUrl': 'https://example.com/poster.jpg', 'url': '/local.jpg'},
+        ]}
+        assert library_export._poster_url(item) == 'https://example.com/poster.jpg'
+
+    def test_poster_url_missing(self):
+        """Test returns None when no poster image exists"""
+        assert library_export._poster_url({'images': []}) is None
+        assert library_export._poster_url({}) is None
+
+    @patch('app.library_export.download_poster')
+    def test_results_keep_input_order(self, mock_download):
+        """Test downloaded posters line up with their input URLs"""
+        mock_download.side_effect = lambda url: f"img:{url}" if url else None
+
+        result = library_export.download_posters(['a', None, 'c'])
+
+        assert result == ['img:a', None, 'img:c']
+
+    def test_empty_list(self):
+        """Test no downloads for empty input"""
+        assert library_export.download_posters([]) == []
+
+
+class TestSectionFlowables:
+    """Tests for per-section flowable building"""
+
+    def test_show_label(self):
+        """Test show lines include season count"""
+        assert library_export._show_label({'title': 'Show A', 'year': 2020, 'seasonCount': 1}) == "Show A (2020) - 1 season"
+        assert library_export._show_label({'title': 'Show B', 'seasonCount': 3}) == "Show B - 3 seasons"
+
+    @patch('app.library_export.download_posters')
+    def test_poster_tables_are_chunked(self, mock_posters):
+        """Test large sections are split into fixed-size tables"""
+        movies = [{'title': f'Movie {i}', 'year': 2000} for i in range(120)]
+        mock_posters.return_value = [None] * len(movies)
+
+        flowables = library_export._section_flowables(movies, library_export._movie_label, True, None)
+
+        assert [len(t._cellvalues) for t in flowables] == [50, 50, 20]
+        assert flowables[2]._cellvalues[-1] == ['', 'Movie 119 (2000)']
+
+    @patch('app.library_export.download_posters')
+    @patch('app.library_export.fetch_shows_from_sonarr')
+    @patch('app.library_export.fetch_movies_from_radarr')
+    def test_generates_pdf_with_images(self, mock_movies, mock_shows, mock_posters, tmp_path):
+        """Test image exports spanning several tables build successfully"""
+        mock_movies.return_value = [{'title': f'Movie {i}', 'year': 2000} for i in range(120)]
+        mock_shows.return_value = []
+        mock_posters.side_effect = lambda urls: [None] * len(urls)
+
+        with patch.object(library_export, 'EXPORT_DIR', tmp_path):
+            result = library_export.generate_library_pdf(include_images=True, filename='images')
+
+        assert Path(result).stat().st_size > 0
+
+
 class TestGenerateLibraryPdf:
     """Tests for generate_library_pdf function"""
 
@@ -294,6 +492,39 @@ class TestGenerateLibraryPdf:
             assert Path(result).exists()
             mock_shows.assert_called_once()
 
+    @patch('app.library_export.fetch_shows_from_sonarr')
+    @patch('app.library_export.fetch_movies_from_radarr')
+    def test_fetches_run_concurrently(self, mock_movies, mock_shows, tmp_path):
+        """Test the Radarr and Sonarr pulls overlap instead of running back to back"""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(items):
+            barrier.wait()  # Raises BrokenBarrierError if the other fetch never starts
+            return items
+        mock_movies.side_effect = lambda cfg: fetch([{'title': 'Movie A', 'year': 2024}])
+        mock_shows.side_effect = lambda cfg: fetch([{'title': 'Show A', 'year': 2020}])
+
+        with patch.object(library_export, 'EXPORT_DIR', tmp_path):
+            result = library_export.generate_library_pdf()
+
+        assert Path(result).exists()
+
+    @patch('app.library_export.config.load_config')
+    @patch('app.library_export.fetch_shows_from_sonarr')
+    @patch('app.library_export.fetch_movies_from_radarr')
+    def test_loads_config_once(self, mock_movies, mock_shows, mock_config, tmp_path):
+        """Test both fetches reuse a single config load"""
+        mock_config.return_value = {'integrations': {}}
+        mock_movies.return_value = []
+        mock_shows.return_value = []
+
+        with patch.object(library_export, 'EXPORT_DIR', tmp_path):
+            library_export.generate_library_pdf()
+
+        mock_config.assert_called_once()
+        mock_movies.assert_called_once_with(mock_config.return_value)
+        mock_shows.assert_called_once_with(mock_config.return_value)
+
     @patch('app.library_export.fetch_shows_from_sonarr')
     @patch('app.library_export.fetch_movies_from_radarr')
     def test_skips_movies_when_disabled(self, mock_movies, mock_shows, tmp_path):
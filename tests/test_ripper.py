@@ -2,6 +2,7 @@
 Tests for RipForge ripper module
 """
 
+import os
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -18,6 +19,14 @@ from app.ripper import (
 )
 
 
+def _pipe_output(lines):
+    """A real binary pipe holding makemkvcon output, as _run_cmd(binary=True) returns"""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b''.join(lines))
+    os.close(write_fd)
+    return os.fdopen(read_fd, 'rb')
+
+
 class TestSanitizeFolderName:
     """Tests for the sanitize_folder_name function"""
 
@@ -70,6 +79,12 @@ class TestSanitizeFolderName:
         result = sanitize_folder_name("  Movie Title  ")
         assert result == "Movie Title"
 
+    def test_other_whitespace_normalized(self):
+        """Test tabs/newlines/non-breaking spaces still collapse to one space"""
+        assert sanitize_folder_name("Movie\tTitle") == "Movie Title"
+        assert sanitize_folder_name("Movie\xa0Title") == "Movie Title"
+        assert sanitize_folder_name("Movie Title\n") == "Movie Title"
+
 
 class TestRipStatus:
     """Tests for RipStatus enum"""
@@ -85,6 +100,14 @@ class TestRipStatus:
         assert RipStatus.COMPLETE.value == "complete"
         assert RipStatus.ERROR.value == "error"
 
+    def test_members_are_strings(self):
+        """Test statuses compare, print and serialize as their plain values"""
+        import json
+        assert RipStatus.RIPPING == "ripping"
+        assert str(RipStatus.RIPPING) == "ripping"
+        assert f"{RipStatus.RIPPING}" == "ripping"
+        assert json.dumps({"status": RipStatus.RIPPING}) == '{"status": "ripping"}'
+
 
 class TestStepStatus:
     """Tests for StepStatus enum"""
@@ -127,6 +150,41 @@ class TestRipJob:
         assert job.rip_method == "direct"
         assert job.rip_mode == "smart"
 
+    def test_steps_fresh_per_job(self):
+        """Test each job gets its own step objects, in pipeline order"""
+        from app.ripper import RIP_STEP_NAMES
+        first, second = RipJob(), RipJob()
+        assert tuple(first.steps) == RIP_STEP_NAMES
+        first.steps["rip"].status = "active"
+        assert second.steps["rip"].status == "pending"
+
+    def test_slotted(self):
+        """Test jobs are slotted, so typo'd attributes fail loudly"""
+        job = RipJob()
+        assert not hasattr(job, '__dict__')
+        with pytest.raises(AttributeError):
+            job.total_tracks = 3
+
+    def test_folder_label_follows_disc_label(self):
+        """Test the sanitized folder label is memoized and refreshed when the label changes"""
+        job = RipJob(disc_label='STAR_WARS: EP IV')
+        with patch('app.ripper.sanitize_folder_name', wraps=sanitize_folder_name) as mock_sanitize:
+            assert job.folder_label == 'STAR_WARS - EP IV'
+            assert job.folder_label == 'STAR_WARS - EP IV'
+            assert mock_sanitize.call_count == 1
+
+            job.disc_label = 'ALIEN'
+            assert job.folder_label == 'ALIEN'
+
+    def test_fallback_title_follows_disc_label(self):
+        """Test the disc label fallback title is memoized and refreshed when the label changes"""
+        job = RipJob(disc_label='THE_DARK_KNIGHT')
+        assert job.fallback_title == 'The Dark Knight'
+        assert job._fallback_title == ('THE_DARK_KNIGHT', 'The Dark Knight')
+
+        job.disc_label = 'ALIEN'
+        assert job.fallback_title == 'Alien'
+
     def test_steps_initialized(self):
         """Test steps are properly initialized"""
         job = RipJob()
@@ -290,6 +348,17 @@ class TestMakeMKVInit:
         assert mkv.use_docker is True
         assert mkv.container_name == "makemkv"
 
+    @patch('app.ripper.subprocess.Popen')
+    def test_run_cmd_buffered_utf8_text(self, mock_popen):
+        """Test rip output is read as fully buffered, error-tolerant UTF-8"""
+        from app.ripper import MakeMKV
+        MakeMKV()._run_cmd(["-r", "info", "disc:0"])
+
+        kwargs = mock_popen.call_args.kwargs
+        assert kwargs['bufsize'] == -1
+        assert kwargs['encoding'] == 'utf-8'
+        assert kwargs['errors'] == 'replace'
+
 
 class TestDebugLoggingConfig:
     """Tests for debug_logging config setting"""
@@ -365,6 +434,21 @@ class TestSelectBestTrack:
 
         assert result == 1  # Closest match
 
+    @patch('app.ripper.activity')
+    def test_select_best_track_tie_keeps_first(self, mock_activity):
+        """Test equally close tracks resolve to the earliest one"""
+        from app.ripper import MakeMKV
+        mkv = MakeMKV()
+
+        tracks = [
+            {'index': 4, 'duration': 7100},
+            {'index': 2, 'duration': 7200},
+            {'index': 7, 'duration': 7100},
+        ]
+        result, fake_detected = mkv.select_best_track(tracks, 7150)
+
+        assert result == 4
+
     @patch('app.ripper.activity')
     def test_select_best_track_fake_playlist_detection(self, mock_activity):
         """Test fake playlist detection with Disney-style protection"""
@@ -386,6 +470,20 @@ class TestSelectBestTrack:
         assert result == 1  # Should select exact match
         assert fake_detected is True  # Should detect fake playlists
 
+    @patch('app.ripper.activity')
+    def test_select_best_track_fake_window_boundary(self, mock_activity):
+        """Test a 3-track window of exactly 120s anywhere in the list counts as fake"""
+        from app.ripper import MakeMKV
+        mkv = MakeMKV()
+
+        tracks = [{'index': i, 'duration': d} for i, d in enumerate([3000, 5000, 7000, 7060, 7120])]
+        _, fake_detected = mkv.select_best_track(tracks, 7060)
+        assert fake_detected is True
+
+        tracks = [{'index': i, 'duration': d} for i, d in enumerate([3000, 5000, 7000, 7060, 7121])]
+        _, fake_detected = mkv.select_best_track(tracks, 7060)
+        assert fake_detected is False
+
     @patch('app.ripper.activity')
     def test_select_best_track_no_fake_with_varied_durations(self, mock_activity):
         """Test no fake detection when tracks have varied durations"""
@@ -641,6 +739,1067 @@ class TestGetMakeMKVInfo:
         assert info['license_type'] == 'expired'
 
 
+class TestGetDiscInfo:
+    """Tests for MakeMKV.get_disc_info() info parsing"""
+
+    @patch('app.ripper.MakeMKV._run_cmd')
+    def test_parses_disc_tracks_and_streams(self, mock_run):
+        """Test CINFO/TINFO/SINFO lines populate the disc info"""
+        from app.ripper import MakeMKV
+
+        mock_process = MagicMock()
+        mock_process.stdout.read.return_value = b''.join([
+            b'DRV:0,2,999,1,"DVD-RW drive","SERENITY","/dev/sr0"\n',
+            b'CINFO:1,6209,"Blu-ray disc"\n',
+            b'CINFO:2,0,"SERENITY"\n',
+            b'TINFO:0,9,0,"1:59:00"\n',
+            b'TINFO:0,11,0,"30000000000"\n',
+            b'TINFO:0,16,0,"00800.mpls"\n',
+            b'TINFO:1,9,0,"2:30"\n',
+            b'TINFO:1,11,0,"unknown"\n',
+            b'SINFO:0,1,1,6202,"Audio"\n',
+            b'SINFO:0,1,3,0,"eng"\n',
+            b'SINFO:0,1,4,0,"English"\n',
+            b'SINFO:0,1,5,0,"DTS-HD MA"\n',
+            b'SINFO:0,1,39,0,"Default"\n',
+            b'SINFO:0,2,3,0,"spa"\n',
+        ])
+        mock_run.return_value = mock_process
+
+        info = MakeMKV().get_disc_info()
+
+        assert info['disc_label'] == 'SERENITY'
+        assert info['disc_type'] == 'bluray'
+        assert info['cinfo_raw'] == {'CINFO:1': 'Blu-ray disc', 'CINFO:2': 'SERENITY'}
+        assert info['track_sizes'] == {0: 30000000000}
+        assert [(t['index'], t['duration']) for t in info['tracks']] == [(0, 7140), (1, 150)]
+        assert info['tracks'][0]['playlist'] == '00800.mpls'
+        assert info['tracks'][0]['audio_tracks'] == [{
+            'stream_idx': 1, 'lang_code': 'eng', 'lang_name': 'English',
+            'codec': 'DTS-HD MA', 'is_default': True
+        }]
+        assert info['main_feature'] == 0
+
+    @patch('app.ripper.MakeMKV._run_cmd')
+    def test_decodes_utf8_values(self, mock_run):
+        """Test non-ASCII disc and language names decode as UTF-8"""
+        from app.ripper import MakeMKV
+
+        mock_process = MagicMock()
+        mock_process.stdout.read.return_value = b''.join([
+            'CINFO:2,0,"AMÉLIE"\n'.encode(),
+            b'TINFO:0,9,0,"2:02:00"\n',
+            b'SINFO:0,1,1,6202,"Audio"\n',
+            'SINFO:0,1,4,0,"Français"\n'.encode(),
+        ])
+        mock_run.return_value = mock_process
+
+        info = MakeMKV().get_disc_info()
+
+        assert info['disc_label'] == 'AMÉLIE'
+        assert info['tracks'][0]['audio_tracks'][0]['lang_name'] == 'Français'
+
+    @patch('app.ripper.MakeMKV._run_cmd')
+    def test_cinfo_fingerprint(self, mock_run):
+        """Test the fingerprint is a SHA-1 over the CINFO lines only"""
+        import hashlib
+        from app.ripper import MakeMKV
+
+        cinfo = [b'CINFO:1,6209,"Blu-ray disc"', b'CINFO:2,0,"SERENITY"']
+        mock_process = MagicMock()
+        mock_process.stdout.read.return_value = b''.join([cinfo[0] + b'\n', b'TINFO:0,9,0,"1:59:00"\n', cinfo[1] + b'\n'])
+        mock_run.return_value = mock_process
+
+        info = MakeMKV().get_disc_info()
+
+        assert info['cinfo_fingerprint'] == hashlib.sha1(b''.join(cinfo)).hexdigest()
+
+    @patch('app.ripper.MakeMKV._run_cmd')
+    def test_no_fingerprint_without_cinfo(self, mock_run):
+        """Test an empty scan doesn't get the empty-input digest"""
+        from app.ripper import MakeMKV
+
+        mock_process = MagicMock()
+        mock_process.stdout.read.return_value = b''.join([])
+        mock_run.return_value = mock_process
+
+        assert MakeMKV().get_disc_info()['cinfo_fingerprint'] == ''
+
+    @patch('app.ripper.MakeMKV._run_cmd')
+    def test_reads_output_once_and_anchors_records(self, mock_run):
+        """Test one bounded read, and record prefixes only count at line start"""
+        from app.ripper import MakeMKV, INFO_OUTPUT_MAX_BYTES
+
+        mock_process = MagicMock()
+        mock_process.stdout.read.return_value = (
+            b'MSG:3307,0,2,"dump" TINFO:5,9,0,"9:99:99"\n'
+            b'TINFO:0,9,0,"1:59:00"\n'
+        )
+        mock_run.return_value = mock_process
+
+        info = MakeMKV().get_disc_info()
+
+        assert [t['index'] for t in info['tracks']] == [0]
+        mock_process.stdout.read.assert_called_once_with(INFO_OUTPUT_MAX_BYTES)
+        mock_process.stdout.close.assert_called_once()
+        mock_process.wait.assert_called_once()
+
+    @patch('app.ripper.MakeMKV._run_cmd')
+    def test_skips_malformed_duration(self, mock_run):
+        """Test unparseable durations don't produce tracks"""
+        from app.ripper import MakeMKV
+
+        mock_process = MagicMock()
+        mock_process.stdout.read.return_value = b''.join([b'TINFO:0,9,0,"1:xx:00"\n', b'TINFO:1,9,0,"0:22:10"\n'])
+        mock_run.return_value = mock_process
+
+        info = MakeMKV().get_disc_info()
+
+        assert [t['index'] for t in info['tracks']] == [1]
+
+
+class TestDiscInfoCache:
+    """Tests for get_disc_info scan caching"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from app.ripper import clear_disc_info_cache
+        clear_disc_info_cache()
+        yield
+        clear_disc_info_cache()
+
+    def test_same_disc_scanned_once(self):
+        """Test repeat calls for the same disc reuse the first scan"""
+        from app.ripper import MakeMKV
+        mkv = MakeMKV()
+        scanned = {'disc_label': 'SERENITY', 'tracks': [{'index': 0, 'duration': 7140}]}
+
+        with patch('app.ripper._disc_identity', return_value='abc'), \
+             patch.object(mkv, '_scan_disc_info', return_value=scanned) as mock_scan:
+            first = mkv.get_disc_info('/dev/sr0')
+            first['tracks'].clear()
+            second = mkv.get_disc_info('/dev/sr0')
+
+        assert mock_scan.call_count == 1
+        assert second['tracks'] == [{'index': 0, 'duration': 7140}]
+
+    def test_different_disc_rescanned(self):
+        """Test a new volume descriptor misses the cache"""
+        from app.ripper import MakeMKV
+        mkv = MakeMKV()
+        scanned = {'disc_label': 'SERENITY', 'tracks': [{'index': 0}]}
+
+        with patch('app.ripper._disc_identity', side_effect=['abc', 'def']), \
+             patch.object(mkv, '_scan_disc_info', return_value=scanned) as mock_scan:
+            mkv.get_disc_info('/dev/sr0')
+            mkv.get_disc_info('/dev/sr0')
+
+        assert mock_scan.call_count == 2
+
+    def test_empty_scan_not_cached(self):
+        """Test a not-ready drive result is retried rather than cached"""
+        from app.ripper import MakeMKV
+        mkv = MakeMKV()
+
+        with patch('app.ripper._disc_identity', return_value='abc'), \
+             patch.object(mkv, '_scan_disc_info', return_value={'disc_label': '', 'tracks': []}) as mock_scan:
+            mkv.get_disc_info('/dev/sr0')
+            mkv.get_disc_info('/dev/sr0')
+
+        assert mock_scan.call_count == 2
+
+    def test_unreadable_device_not_cached(self):
+        """Test scans aren't cached when the disc can't be identified"""
+        from app.ripper import MakeMKV
+        mkv = MakeMKV()
+        scanned = {'disc_label': 'SERENITY', 'tracks': [{'index': 0}]}
+
+        with patch.object(mkv, '_scan_disc_info', return_value=scanned) as mock_scan:
+            mkv.get_disc_info('/nonexistent/sr9')
+            mkv.get_disc_info('/nonexistent/sr9')
+
+        assert mock_scan.call_count == 2
+
+    def test_disc_identity_hashes_volume_descriptor(self, tmp_path):
+        """Test the identity covers the sector at 32 KiB"""
+        from app.ripper import _disc_identity
+        image = tmp_path / 'disc.iso'
+        image.write_bytes(b'\0' * 0x8000 + b'\x01CD001' + b'\0' * 2041)
+        other = tmp_path / 'other.iso'
+        other.write_bytes(b'\0' * 0x8000 + b'\x01CD001' + b'\1' * 2041)
+
+        assert _disc_identity(str(image)) is not None
+        assert _disc_identity(str(image)) != _disc_identity(str(other))
+
+    @staticmethod
+    def _udf_image(path, volume_id, recorded):
+        """Write a minimal UDF-only image: BEA01 at 32 KiB, anchor at 256, PVD at 32"""
+        import struct
+        image = bytearray(257 * 2048)
+        image[0x8000:0x8007] = b'\0BEA01\x01'
+        struct.pack_into('<HxxxxxxxxxxxxxxII', image, 256 * 2048, 2, 2 * 2048, 32)
+        struct.pack_into('<H', image, 32 * 2048, 1)
+        image[32 * 2048 + 24:32 * 2048 + 24 + len(volume_id)] = volume_id
+        image[32 * 2048 + 376:32 * 2048 + 388] = recorded
+        struct.pack_into('<H', image, 33 * 2048, 8)
+        path.write_bytes(bytes(image))
+        return str(path)
+
+    def test_udf_only_discs_sharing_sector_16_differ(self, tmp_path):
+        """Test Blu-rays with the same BEA01 sector get keys from their UDF volume ids"""
+        from app.ripper import _disc_identity
+        first = self._udf_image(tmp_path / 'a.iso', b'SERENITY', b'\x01' * 12)
+        second = self._udf_image(tmp_path / 'b.iso', b'ALIEN', b'\x01' * 12)
+        rerecorded = self._udf_image(tmp_path / 'c.iso', b'SERENITY', b'\x02' * 12)
+
+        keys = {_disc_identity(first), _disc_identity(second), _disc_identity(rerecorded)}
+        assert None not in keys
+        assert len(keys) == 3
+        assert _disc_identity(first) == _disc_identity(self._udf_image(tmp_path / 'd.iso', b'SERENITY', b'\x01' * 12))
+
+    def test_empty_drive_clears_cache(self):
+        """Test a drive reporting no media drops earlier scans"""
+        from app.ripper import MakeMKV, RipEngine, _disc_info_cache
+        _disc_info_cache[('/dev/sr0', 'abc', None, None, None)] = (0.0, {'disc_label': 'SERENITY'})
+
+        with patch('app.ripper.subprocess.run', return_value=MagicMock(returncode=2, stdout='')):
+            assert RipEngine.__new__(RipEngine).check_disc('/dev/sr0')['present'] is False
+        assert not _disc_info_cache
+
+        _disc_info_cache[('/dev/sr0', 'abc', None, None, None)] = (0.0, {'disc_label': 'SERENITY'})
+        mkv = MakeMKV()
+        with patch('app.ripper._disc_identity', return_value=None), \
+             patch.object(mkv, '_scan_disc_info', return_value={'disc_label': '', 'tracks': []}):
+            mkv.get_disc_info('/dev/sr0')
+        assert not _disc_info_cache
+
+
+class TestRipTrackProgress:
+    """Tests for rip_track PRGV progress reporting"""
+
+    @patch('app.ripper.MakeMKV._run_cmd')
+    def test_progress_throttled(self, mock_run, tmp_path):
+        """Test a burst of PRGV lines reports the first change and completion only"""
+        from app.ripper import MakeMKV
+
+        mock_process = MagicMock()
+        mock_process.stdout = _pipe_output([f'PRGV:{n},{n},100\n'.encode() for n in range(0, 101, 10)])
+        mock_process.wait.return_value = 0
+        mock_run.return_value = mock_process
+        progress = MagicMock()
+
+        success, _, _ = MakeMKV().rip_track('/dev/sr0', 0, str(tmp_path), progress_callback=progress)
+
+        assert success is True
+        assert [c.args[0] for c in progress.call_args_list] == [0, 100]
+
+    @patch('app.ripper.MakeMKV._run_cmd')
+    def test_msg_output_path_and_error(self, mock_run, tmp_path):
+        """Test MSG lines supply the output path and the last error, in any case"""
+        from app.ripper import MakeMKV
+
+        mock_process = MagicMock()
+        mock_process.stdout = _pipe_output([
+            b'MSG:5014,0,2,"Saving 1 titles into directory file:///rips/MOVIE","x"\n',
+            b'MSG:5003,0,0,"Using direct disc access mode","x"\n',
+            b'MSG:2003,0,3,"Error \'Scsi error - MEDIUM ERROR\' occurred","x"\n',
+        ])
+        mock_process.wait.return_value = 12
+        mock_run.return_value = mock_process
+
+        success, error, path = MakeMKV().rip_track('/dev/sr0', 0, str(tmp_path))
+
+        assert success is False
+        assert path == '/rips/MOVIE'
+        assert error.startswith('Disc read error')
+        assert 'MEDIUM ERROR' in error
+
+
+class TestFollowOutput:
+    """Tests for the shared makemkvcon output loop"""
+
+    def _process(self, lines, return_code=0):
+        process = MagicMock()
+        process.stdout = _pipe_output(lines)
+        process.wait.return_value = return_code
+        return process
+
+    def test_backup_ignores_segment_prgv(self, tmp_path):
+        """Test backup progress comes from folder size, not per-segment PRGV"""
+        from app.ripper import MakeMKV
+        progress = MagicMock()
+        process = self._process([b'PRGV:50,50,100\n', b'PRGV:100,100,100\n'])
+
+        out = MakeMKV()._follow_output(process, "BACKUP", str(tmp_path), progress,
+                                       expected_size=1000, backup=True)
+
+        assert out.prgv_count == 2
+        progress.assert_not_called()
+
+    def test_corruption_sample_bounded(self, tmp_path):
+        """Test a flood of corruption MSGs is counted but only sampled"""
+        from app.ripper import MakeMKV, CORRUPTION_SAMPLE_SIZE
+        lines = [f'MSG:5074,0,0,"File {n} is corrupt","x"\n'.encode() for n in range(500)]
+
+        out = MakeMKV()._follow_output(self._process(lines), "BACKUP", str(tmp_path), backup=True)
+
+        assert out.corruption_count == 500
+        assert out.corruption_warnings == [f'File {n} is corrupt' for n in range(CORRUPTION_SAMPLE_SIZE)]
+
+    def test_repeated_percent_reported_once(self, tmp_path):
+        """Test identical PRGV percentages reach the callback once, without float rounding"""
+        from app.ripper import MakeMKV
+        progress = MagicMock()
+        process = self._process([b'PRGV:29,29,100\n', b'PRGV:29,29,100\n', b'PRGV:58,58,200\n'])
+
+        MakeMKV()._follow_output(process, "RIP", str(tmp_path), progress)
+
+        assert [c.args[0] for c in progress.call_args_list] == [29]
+
+    def test_collects_errors_and_corruption(self, tmp_path):
+        """Test the summary carries the last error and corruption warnings"""
+        from app.ripper import MakeMKV
+        messages = MagicMock()
+        process = self._process([
+            b'MSG:2003,0,0,"Failed to read sector","x"\n',
+            b'MSG:5074,0,0,"Hash check failed, file is corrupt","x"\n',
+            b'PRGV:10,10,100\n',
+        ], return_code=12)
+
+        out = MakeMKV()._follow_output(process, "RIP FROM BACKUP", str(tmp_path),
+                                       message_callback=messages)
+
+        assert out.return_code == 12
+        assert out.line_count == 3 and out.msg_count == 2 and out.prgv_count == 1
+        assert out.last_error == 'Hash check failed, file is corrupt'
+        assert out.corruption_warnings == ['Hash check failed, file is corrupt']
+        assert out.corruption_count == 1
+        assert messages.call_count == 2
+
+
+class TestReadLines:
+    """Tests for the poll-based MakeMKV output reader"""
+
+    def test_splits_lines_and_keeps_unterminated_tail(self):
+        """Test lines come back without newlines, including a final partial one"""
+        from app.ripper import _read_lines
+        stream = _pipe_output([b'PRGV:1,1,10\nMSG:1,0,0,"a"\nPRGV:2', b',2,10'])
+        assert list(_read_lines(stream, 1)) == [b'PRGV:1,1,10', b'MSG:1,0,0,"a"', b'PRGV:2,2,10']
+
+    def test_idle_tick_while_silent(self):
+        """Test a silent pipe yields None so the caller can run periodic checks"""
+        from app.ripper import _read_lines
+        read_fd, write_fd = os.pipe()
+        try:
+            lines = _read_lines(os.fdopen(read_fd, 'rb'), 0.01)
+            assert next(lines) is None
+            os.write(write_fd, b'MSG:1,0,0,"x"\n')
+            assert next(lines) == b'MSG:1,0,0,"x"'
+        finally:
+            os.close(write_fd)
+
+
+class TestRipStepDetail:
+    """Tests for the size-based rip step detail"""
+
+    def test_direct(self):
+        """Test direct rips show the raw percent"""
+        from app.ripper import _rip_step_detail
+        assert _rip_step_detail(False, False, 42) == "Direct (42%)"
+
+    def test_backup_phases_rescaled(self):
+        """Test backup copy and extract phases each show their own 0-100"""
+        from app.ripper import _rip_step_detail
+        assert _rip_step_detail(True, False, 30) == "Copying (60%) → Extracting (--)"
+        assert _rip_step_detail(True, False, 70) == "Copying (100%) → Extracting (--)"
+        assert _rip_step_detail(True, True, 75) == "Copying (✓) → Extracting (50%)"
+        assert _rip_step_detail(True, True, 20) == "Copying (✓) → Extracting (0%)"
+
+
+class TestPartFilenames:
+    """Tests for naming moved MKVs"""
+
+    def test_single_file(self):
+        """Test a lone MKV takes the folder name"""
+        from app.ripper import _part_filenames
+        assert _part_filenames(['/raw/title_t00.mkv'], 'Heat (1995)') == [('/raw/title_t00.mkv', 'Heat (1995).mkv')]
+
+    def test_parts_numbered_in_order(self):
+        """Test multi-file rips are numbered Part 1..N in list order"""
+        from app.ripper import _part_filenames
+        files = ['/raw/title_t01.mkv', '/raw/title_t00.mkv', '/raw/title_t02.mkv']
+        assert [name for _, name in _part_filenames(files, 'Heat')] == \
+            ['Heat - Part 1.mkv', 'Heat - Part 2.mkv', 'Heat - Part 3.mkv']
+
+
+class TestDirSize:
+    """Tests for scandir-based output size helpers"""
+
+    @pytest.fixture
+    def rip_dir(self, tmp_path):
+        (tmp_path / 'title_t00.mkv').write_bytes(b'x' * 300)
+        (tmp_path / 'title_t01.mkv').write_bytes(b'x' * 500)
+        (tmp_path / 'notes.txt').write_bytes(b'x' * 7)
+        stream = tmp_path / 'BDMV' / 'STREAM'
+        stream.mkdir(parents=True)
+        (stream / '00800.m2ts').write_bytes(b'x' * 1000)
+        return tmp_path
+
+    def test_suffix_filter(self, rip_dir):
+        """Test only matching files in the top directory are counted"""
+        from app.ripper import _dir_size
+        assert _dir_size(str(rip_dir), '.mkv') == 800
+
+    def test_recursive(self, rip_dir):
+        """Test recursive totals include nested backup files"""
+        from app.ripper import _dir_size
+        assert _dir_size(str(rip_dir)) == 807
+        assert _dir_size(str(rip_dir), recursive=True) == 1807
+
+    def test_largest_file(self, rip_dir, tmp_path_factory):
+        """Test the largest MKV is found, 0 when there are none"""
+        from app.ripper import _MkvGrowthWatcher
+        assert _MkvGrowthWatcher(str(rip_dir)).largest_size() == 500
+        assert _MkvGrowthWatcher(str(tmp_path_factory.mktemp('empty'))).largest_size() == 0
+
+    def test_growth_tracked_without_relisting(self, tmp_path):
+        """Test a growing MKV is re-stat'ed once the folder listing is settled"""
+        from app.ripper import _MkvGrowthWatcher
+        mkv = tmp_path / 'title_t00.mkv'
+        mkv.write_bytes(b'x' * 100)
+        old = tmp_path.stat().st_mtime_ns - 5_000_000_000
+        os.utime(tmp_path, ns=(old, old))
+        watcher = _MkvGrowthWatcher(str(tmp_path))
+        assert watcher.largest_size() == 100
+
+        with open(mkv, 'ab') as f:
+            f.write(b'x' * 50)
+        with patch('app.ripper._file_sizes') as mock_list:
+            assert watcher.largest_size() == 150
+        mock_list.assert_not_called()
+
+    def test_missing_dir_counts_as_empty(self, tmp_path):
+        """Test a folder that's gone (or vanishes mid-walk) adds nothing"""
+        from app.ripper import _dir_size
+        assert _dir_size(str(tmp_path / 'missing'), recursive=True) == 0
+
+    def test_file_sizes(self, rip_dir):
+        """Test per-file sizes come back keyed by full path"""
+        from app.ripper import _file_sizes
+        assert _file_sizes(str(rip_dir), '.mkv') == {
+            str(rip_dir / 'title_t00.mkv'): 300,
+            str(rip_dir / 'title_t01.mkv'): 500,
+        }
+
+    def test_has_files(self, rip_dir, tmp_path_factory):
+        """Test MKV presence checks, including a missing folder"""
+        from app.ripper import _has_files
+        assert _has_files(str(rip_dir), '.mkv') is True
+        assert _has_files(str(rip_dir), '.m2ts') is False
+        assert _has_files(str(tmp_path_factory.mktemp('empty') / 'missing'), '.mkv') is False
+
+    def test_newest_file(self, tmp_path):
+        """Test the most recently written MKV is picked, ignoring other files"""
+        from app.ripper import _newest_file
+        for name, mtime in [('title_t00.mkv', 100), ('title_t01.mkv', 300), ('notes.txt', 500)]:
+            (tmp_path / name).write_bytes(b'x')
+            os.utime(tmp_path / name, (mtime, mtime))
+
+        assert _newest_file(str(tmp_path), '.mkv') == str(tmp_path / 'title_t01.mkv')
+        assert _newest_file(str(tmp_path), '.m2ts') is None
+        assert _newest_file(str(tmp_path / 'missing'), '.mkv') is None
+
+    def test_output_size_falls_back_to_backup_files(self, tmp_path):
+        """Test _get_output_size counts the whole tree when there are no MKVs"""
+        from types import SimpleNamespace
+        from app.ripper import RipEngine
+        engine = SimpleNamespace(_size_trackers={})
+        (tmp_path / 'BDMV').mkdir()
+        (tmp_path / 'BDMV' / 'index.bdmv').write_bytes(b'x' * 42)
+
+        assert RipEngine._get_output_size(engine, str(tmp_path)) == 42
+        assert RipEngine._get_output_size(engine, str(tmp_path / 'missing')) == 0
+
+    def test_output_size_reuses_backup_tracker(self, tmp_path):
+        """Test repeated polls of a backup folder share one tracker that sees growth"""
+        from types import SimpleNamespace
+        from app.ripper import RipEngine
+        engine = SimpleNamespace(_size_trackers={})
+        stream = tmp_path / 'BDMV' / 'STREAM'
+        stream.mkdir(parents=True)
+        (stream / '00000.m2ts').write_bytes(b'x' * 100)
+
+        assert RipEngine._get_output_size(engine, str(tmp_path)) == 100
+        tracker = engine._size_trackers[str(tmp_path)]
+        (stream / '00000.m2ts').write_bytes(b'x' * 250)
+        assert RipEngine._get_output_size(engine, str(tmp_path)) == 250
+        assert engine._size_trackers[str(tmp_path)] is tracker
+
+
+class TestCheckExistingRawFiles:
+    """Tests for flagging orphaned MKVs in the raw folder"""
+
+    def test_flags_leftover_mkvs(self, tmp_path):
+        """Test leftover MKVs mark the job for review with their names and size"""
+        from app.ripper import RipEngine, RipJob
+        (tmp_path / 'title_t00.mkv').write_bytes(b'x' * 2048)
+        (tmp_path / 'notes.txt').write_bytes(b'x')
+        job = RipJob(device='/dev/sr0', disc_label='MOVIE')
+
+        RipEngine._check_existing_raw_files(None, job, str(tmp_path))
+
+        assert job.has_existing_raw_files is True
+        assert job.needs_review is True
+        assert job.existing_raw_info['files'] == ['title_t00.mkv']
+        assert job.existing_raw_info['path'] == str(tmp_path)
+
+    def test_missing_or_empty_folder_ignored(self, tmp_path):
+        """Test a fresh raw folder leaves the job untouched"""
+        from app.ripper import RipEngine, RipJob
+        job = RipJob(device='/dev/sr0', disc_label='MOVIE')
+
+        RipEngine._check_existing_raw_files(None, job, str(tmp_path))
+        RipEngine._check_existing_raw_files(None, job, str(tmp_path / 'missing'))
+
+        assert job.has_existing_raw_files is False
+        assert job.needs_review is False
+
+
+class TestFindRipOutput:
+    """Tests for locating rip output MakeMKV wrote somewhere unexpected"""
+
+    def _engine(self, tmp_path):
+        from types import SimpleNamespace
+        from app.ripper import RipEngine
+        bases = [tmp_path / name for name in ('raw', 'movies', 'tv')]
+        for base in bases:
+            base.mkdir()
+        engine = SimpleNamespace(raw_path=str(bases[0]), movies_path=str(bases[1]), tv_path=str(bases[2]))
+        return engine, bases, RipEngine._find_rip_output
+
+    def test_label_variant_match(self, tmp_path):
+        """Test a folder named after a label variant is found"""
+        engine, bases, find = self._engine(tmp_path)
+        (bases[1] / 'THE MATRIX').mkdir()
+        (bases[1] / 'THE MATRIX' / 'title_t00.mkv').write_bytes(b'x')
+        (bases[0] / 'THE_MATRIX').mkdir()  # No MKVs - skipped
+
+        assert find(engine, 'THE_MATRIX') == str(bases[1] / 'THE MATRIX')
+
+    def test_duplicate_variants_and_bases_probed_once(self, tmp_path):
+        """Test identical label variants and shared base folders aren't re-checked"""
+        engine, bases, find = self._engine(tmp_path)
+        engine.tv_path = engine.movies_path
+        with patch('app.ripper._has_files', return_value=False) as mock_has:
+            find(engine, 'MATRIX')
+
+        # MATRIX and Matrix under raw and movies
+        assert mock_has.call_count == 4
+
+    def test_missing_bases_skipped(self, tmp_path):
+        """Test nothing is probed when no search base exists"""
+        engine, bases, find = self._engine(tmp_path)
+        engine.raw_path = engine.movies_path = engine.tv_path = str(tmp_path / 'missing')
+        with patch('app.ripper._has_files') as mock_has:
+            assert find(engine, 'MATRIX') is None
+        mock_has.assert_not_called()
+
+    def test_recent_folder_fallback(self, tmp_path):
+        """Test only folders with a recently written MKV are used as a last resort"""
+        engine, bases, find = self._engine(tmp_path)
+        old = bases[0] / 'OLD'
+        old.mkdir()
+        (old / 'title_t00.mkv').write_bytes(b'x')
+        os.utime(old / 'title_t00.mkv', (0, 0))
+        assert find(engine, 'UNKNOWN') is None
+
+        new = bases[2] / 'NEW'
+        new.mkdir()
+        (new / 'title_t00.mkv').write_bytes(b'x')
+        assert find(engine, 'UNKNOWN') == str(new)
+
+
+class TestStatusSampler:
+    """Tests for the background size/progress sampler behind get_status"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        import threading
+        from app.ripper import RipEngine
+        raw = tmp_path / 'raw' / 'MOVIE'
+        raw.mkdir(parents=True)
+        (raw / 'title_t00.mkv').write_bytes(b'x' * 400)
+        engine = RipEngine.__new__(RipEngine)
+        engine._lock = threading.Lock()
+        engine._size_trackers = {}
+        engine._sampler_thread = None
+        engine._makemkv_gone_at = None
+        engine.backup_path = str(tmp_path / 'backup')
+        engine.current_job = RipJob(device='/dev/sr0', disc_label='MOVIE', status=RipStatus.RIPPING,
+                                    rip_output_dir=str(raw), expected_size_bytes=1000)
+        return engine
+
+    def test_sample_updates_size_and_progress(self, engine):
+        """Test a sample fills in size, progress and the rip step detail"""
+        with patch.object(engine, '_is_makemkv_running', return_value={'pid': '1'}):
+            engine._sample_status(engine.current_job)
+
+        assert engine.current_job.current_size_bytes == 400
+        assert engine.current_job.progress == 40
+        assert engine.current_job.steps['rip'].detail == 'Direct (40%)'
+
+    def test_sampling_never_persists(self, engine):
+        """Test per-second samples only touch the in-memory job, never current_job.json"""
+        with patch.object(engine, '_is_makemkv_running', return_value={'pid': '1'}), \
+             patch.object(engine, '_save_job_state') as mock_save:
+            for _ in range(3):
+                engine._sample_status(engine.current_job)
+
+        mock_save.assert_not_called()
+
+    def test_post_processing_waits_for_grace_period(self, engine):
+        """Test MakeMKV must stay gone MAKEMKV_EXIT_GRACE seconds before post-processing"""
+        from app import ripper
+        job = engine.current_job
+        with patch.object(engine, '_is_makemkv_running', return_value=None), \
+             patch.object(engine, '_run_post_processing') as mock_post, \
+             patch('app.ripper.time.monotonic', side_effect=[100.0, 100.0 + ripper.MAKEMKV_EXIT_GRACE]):
+            engine._sample_status(job)
+            assert job.status == RipStatus.RIPPING
+            engine._sample_status(job)
+
+        assert job.status == RipStatus.IDENTIFYING
+        assert job.progress == 100
+
+    def test_makemkv_restart_resets_grace_period(self, engine):
+        """Test MakeMKV coming back (next TV episode) keeps the job ripping"""
+        job = engine.current_job
+        with patch.object(engine, '_is_makemkv_running', side_effect=[None, {'pid': '2'}]):
+            engine._sample_status(job)
+            assert engine._makemkv_gone_at is not None
+            engine._sample_status(job)
+
+        assert engine._makemkv_gone_at is None
+        assert job.status == RipStatus.RIPPING
+
+    def test_disk_and_process_checks_run_unlocked(self, engine):
+        """Test the directory walks and MakeMKV check don't hold _lock"""
+        def unlocked(*args):
+            assert not engine._lock.locked()
+            return 400
+
+        with patch.object(engine, '_get_output_size', side_effect=unlocked), \
+             patch.object(engine, '_is_makemkv_running', side_effect=lambda: unlocked() and {'pid': '1'}):
+            engine._sample_status(engine.current_job)
+
+        assert engine.current_job.current_size_bytes == 400
+
+    def test_job_stopped_mid_sample_left_alone(self, engine):
+        """Test a sample isn't published onto a job that stopped ripping while it was taken"""
+        job = engine.current_job
+
+        def cancel():
+            job.status = RipStatus.ERROR
+            return {'pid': '1'}
+
+        with patch.object(engine, '_is_makemkv_running', side_effect=cancel):
+            engine._sample_status(job)
+
+        assert job.current_size_bytes == 0
+        assert job.progress == 0
+
+    def test_get_status_starts_sampler_without_io(self, engine):
+        """Test get_status returns the job without sampling it inline"""
+        with patch.object(engine, '_ensure_status_sampler') as mock_start, \
+             patch.object(engine, '_get_output_size') as mock_size:
+            status = engine.get_status()
+
+        assert status['disc_label'] == 'MOVIE'
+        mock_start.assert_called_once()
+        mock_size.assert_not_called()
+
+
+class TestRecoveredPostProcessing:
+    """Tests for finishing a rip recovered after a restart"""
+
+    def test_history_size_from_pre_move_scan(self, tmp_path):
+        """Test the MKVs are moved and their sizes recorded without rescanning the library"""
+        from app.ripper import RipEngine
+        raw = tmp_path / 'raw' / 'HEAT'
+        raw.mkdir(parents=True)
+        (raw / 'title_t00.mkv').write_bytes(b'x' * 1024)
+        (raw / 'title_t01.mkv').write_bytes(b'x' * 2048)
+        engine = RipEngine.__new__(RipEngine)
+        engine.movies_path = str(tmp_path / 'movies')
+        engine.job_history = []
+        engine.current_job = RipJob(disc_label='HEAT', identified_title='Heat', year=1995,
+                                    output_path=str(raw), status=RipStatus.IDENTIFYING)
+
+        with patch('app.config.load_config', return_value={'ripping': {'verify_integrity': False}}), \
+             patch('app.ripper.activity') as mock_activity, \
+             patch('app.ripper._dir_size') as mock_dir_size, \
+             patch.object(engine, '_clear_job_state'), \
+             patch.object(engine, 'eject_disc'):
+            engine._run_post_processing()
+
+        assert engine.current_job.status == RipStatus.COMPLETE
+        assert sorted(os.listdir(tmp_path / 'movies' / 'Heat (1995)')) == \
+            ['Heat (1995) - Part 1.mkv', 'Heat (1995) - Part 2.mkv']
+        size_gb = mock_activity.enrich_and_save_rip.call_args.kwargs['size_gb']
+        assert size_gb == pytest.approx(3072 / (1024**3))
+        mock_dir_size.assert_not_called()
+
+
+class TestGenerateTrackThumbnails:
+    """Tests for review-folder thumbnail extraction"""
+
+    def test_one_ffmpeg_per_file(self, tmp_path):
+        """Test all five frames come from a single ffmpeg run, keeping the frames it wrote"""
+        from app.ripper import RipEngine
+        mkv = tmp_path / 'title_t00.mkv'
+        mkv.write_bytes(b'x')
+
+        def fake_ffmpeg(cmd, **kwargs):
+            # Frame 5 seeks past the last keyframe and comes out empty
+            for out in [arg for arg in cmd if arg.endswith('.jpg')][:4]:
+                Path(out).write_bytes(b'jpg')
+            return MagicMock(returncode=1)
+
+        with patch('app.ripper._video_duration', return_value=1000.0), \
+             patch('app.ripper.subprocess.run', side_effect=fake_ffmpeg) as mock_run:
+            thumbs = RipEngine._generate_track_thumbnails(None, str(tmp_path), [str(mkv)])
+
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args.args[0]
+        assert [cmd[i + 1] for i, arg in enumerate(cmd) if arg == '-ss'] == ['100', '250', '500', '750', '900']
+        assert thumbs == {'title_t00.mkv': [f'title_t00_{n}.jpg' for n in range(1, 5)]}
+
+
+class TestJobStatePersistence:
+    """Tests for writing current_job.json"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        from app.ripper import RipEngine
+        engine = RipEngine.__new__(RipEngine)
+        engine.current_job = RipJob(device='/dev/sr0', disc_label='MOVIE', status=RipStatus.RIPPING)
+        engine._saved_job_state = None
+        with patch.object(RipEngine, 'JOB_STATE_FILE', tmp_path / 'current_job.json'):
+            yield engine
+
+    def test_state_written_atomically(self, engine):
+        """Test the state lands in place with no temp file left behind"""
+        import json
+        engine._save_job_state()
+
+        state = json.loads(engine.JOB_STATE_FILE.read_text())
+        assert state['disc_label'] == 'MOVIE'
+        assert state['status'] == 'ripping'
+        assert not engine.JOB_STATE_FILE.with_suffix('.json.tmp').exists()
+
+    def test_unchanged_state_not_rewritten(self, engine):
+        """Test saving the same state twice writes once, and changes still land"""
+        with patch('app.ripper.os.replace', wraps=os.replace) as mock_replace:
+            engine._save_job_state()
+            engine._save_job_state()
+            assert mock_replace.call_count == 1
+
+            engine.current_job.identified_title = 'The Movie'
+            engine._save_job_state()
+            assert mock_replace.call_count == 2
+
+    def test_rewritten_after_clear(self, engine):
+        """Test clearing the state file forgets the last write"""
+        engine._save_job_state()
+        engine._clear_job_state()
+        assert not engine.JOB_STATE_FILE.exists()
+
+        engine._save_job_state()
+        assert engine.JOB_STATE_FILE.exists()
+
+
+class TestMakeMKVRunning:
+    """Tests for detecting a running makemkvcon"""
+
+    def test_finds_process_in_proc(self, tmp_path):
+        """Test a live makemkvcon is found with its full argv"""
+        import shutil
+        import subprocess
+        import time
+        from app.ripper import _makemkvcon_argv
+        fake = tmp_path / 'makemkvcon'
+        shutil.copy(shutil.which('sleep'), fake)
+        proc = subprocess.Popen([str(fake), '30'])
+        try:
+            # Popen can return before the child has exec'd and renamed itself
+            for _ in range(100):
+                found = _makemkvcon_argv()
+                if found:
+                    break
+                time.sleep(0.02)
+        finally:
+            proc.kill()
+            proc.wait()
+
+        assert found == (proc.pid, [str(fake), '30'])
+
+    @patch('app.ripper.os.kill')
+    @patch('app.ripper._makemkvcon_pids', return_value=[101, 202])
+    def test_kill_signals_every_instance(self, mock_pids, mock_kill):
+        """Test _kill_makemkv SIGTERMs each makemkvcon without spawning pkill"""
+        import signal
+        from app.ripper import RipEngine
+        engine = RipEngine.__new__(RipEngine)
+        engine._mkv_running_cache = (1e12, {'pid': '101'})
+        mock_kill.side_effect = [None, ProcessLookupError()]
+
+        with patch('app.ripper.subprocess.run') as mock_run:
+            assert engine._kill_makemkv() is True
+            mock_run.assert_not_called()
+
+        assert [c.args for c in mock_kill.call_args_list] == [(101, signal.SIGTERM), (202, signal.SIGTERM)]
+        assert engine._mkv_running_cache == (0.0, None)
+
+    @patch('app.ripper._makemkvcon_pids', return_value=[])
+    def test_kill_nothing_running(self, mock_pids):
+        """Test _kill_makemkv reports False when no makemkvcon is found"""
+        from app.ripper import RipEngine
+        assert RipEngine._kill_makemkv(RipEngine.__new__(RipEngine)) is False
+
+    def test_result_reused_within_ttl(self):
+        """Test repeated status polls share one process lookup"""
+        from app.ripper import RipEngine
+        from types import SimpleNamespace
+        engine = RipEngine.__new__(RipEngine)
+        engine.makemkv = SimpleNamespace(rip_process=None)
+        engine._mkv_running_cache = (0.0, None)
+        argv = (4242, ['makemkvcon', '-r', 'mkv', 'disc:0', '0', '/rips/raw/MOVIE'])
+
+        with patch('app.ripper._makemkvcon_argv', return_value=argv) as mock_scan:
+            first = engine._is_makemkv_running()
+            second = engine._is_makemkv_running()
+
+        assert first == second == {"pid": "4242", "output_dir": "/rips/raw/MOVIE"}
+        assert mock_scan.call_count == 1
+
+
+class TestEjectIoctl:
+    """Tests for ejecting via CDROMEJECT"""
+
+    @patch('app.ripper.fcntl.ioctl')
+    def test_ioctl_on_device(self, mock_ioctl, tmp_path):
+        """Test the eject ioctl is issued on the opened device"""
+        from app.ripper import _eject_ioctl, CDROMEJECT
+        device = tmp_path / 'sr0'
+        device.write_bytes(b'')
+        assert _eject_ioctl(str(device)) is True
+        assert mock_ioctl.call_args.args[1] == CDROMEJECT
+
+    def test_failure_returns_false(self, tmp_path):
+        """Test missing devices and non-CD-ROM files report False for the eject fallback"""
+        from app.ripper import _eject_ioctl
+        device = tmp_path / 'sr0'
+        assert _eject_ioctl(str(device)) is False
+        device.write_bytes(b'')
+        assert _eject_ioctl(str(device)) is False
+
+
+    def test_own_rip_process_checked_without_scan(self):
+        """Test a rip this engine started is checked with poll(), not a /proc scan"""
+        from types import SimpleNamespace
+        from app.ripper import RipEngine
+        engine = RipEngine.__new__(RipEngine)
+        process = MagicMock(pid=4242, args=['makemkvcon', '-r', 'mkv', 'disc:0', '0', '/rips/raw/MOVIE'])
+        process.poll.return_value = None
+        engine.makemkv = SimpleNamespace(rip_process=process)
+
+        with patch('app.ripper._makemkvcon_argv') as mock_scan:
+            assert engine._is_makemkv_running() == {"pid": "4242", "output_dir": "/rips/raw/MOVIE"}
+            process.poll.return_value = 0
+            assert engine._is_makemkv_running() is None
+        mock_scan.assert_not_called()
+
+
+class TestBackupSizeTracker:
+    """Tests for incremental backup folder size accounting"""
+
+    def test_matches_full_scan_while_writing(self, tmp_path):
+        """Test the running total follows files as they are created and grow"""
+        from app.ripper import _BackupSizeTracker, _dir_size
+        stream = tmp_path / 'BDMV' / 'STREAM'
+        stream.mkdir(parents=True)
+        tracker = _BackupSizeTracker(str(tmp_path))
+
+        for i in range(3):
+            with open(stream / f'0000{i}.m2ts', 'wb') as f:
+                for chunk in (100, 250):
+                    f.write(b'x' * chunk)
+                    f.flush()
+                    assert tracker.total() == _dir_size(str(tmp_path), recursive=True)
+
+    def test_finished_files_not_restatted(self, tmp_path):
+        """Test only the file being written is stat'ed once a newer one appears"""
+        from app.ripper import _BackupSizeTracker
+        for i in range(5):
+            (tmp_path / f'0000{i}.m2ts').write_bytes(b'x' * 10)
+        tracker = _BackupSizeTracker(str(tmp_path))
+        tracker.total()
+        (tmp_path / '00005.m2ts').write_bytes(b'x' * 10)
+        tracker.total()
+
+        with patch('app.ripper.os.stat', wraps=os.stat) as mock_stat:
+            assert tracker.total() == 60
+
+        stat_paths = [c.args[0] for c in mock_stat.call_args_list]
+        assert str(tmp_path / '00000.m2ts') not in stat_paths
+        assert str(tmp_path / '00005.m2ts') in stat_paths
+
+
+class TestGetBackupMainFeature:
+    """Tests for MakeMKV.get_backup_main_feature()"""
+
+    @patch('app.ripper.MakeMKV._run_cmd')
+    def test_returns_longest_track(self, mock_run):
+        """Test the longest track over 45 minutes is the main feature"""
+        from app.ripper import MakeMKV
+
+        mock_process = MagicMock()
+        mock_process.stdout.read.return_value = b''.join([
+            b'TINFO:0,9,0,"0:05:00"\n',
+            b'TINFO:0,16,0,"00001.mpls"\n',
+            b'TINFO:3,9,0,"1:59:00"\n',
+            b'TINFO:3,16,0,"00800.mpls"\n',
+        ])
+        mock_run.return_value = mock_process
+
+        assert MakeMKV().get_backup_main_feature('/rips/SERENITY') == 3
+
+    @patch('app.ripper.MakeMKV._run_cmd')
+    def test_angles_pick_lowest_numeric_playlist(self, mock_run):
+        """Test angle ties compare playlist ids numerically, not as strings"""
+        from app.ripper import MakeMKV
+
+        mock_process = MagicMock()
+        mock_process.stdout.read.return_value = b''.join([
+            b'TINFO:0,9,0,"2:01:00"\n',
+            b'TINFO:0,16,0,"1000.mpls"\n',
+            b'TINFO:1,9,0,"2:01:02"\n',
+            b'TINFO:1,16,0,"800.mpls"\n',
+            b'TINFO:2,9,0,"2:01:01"\n',
+        ])
+        mock_run.return_value = mock_process
+
+        assert MakeMKV().get_backup_main_feature('/rips/STAR_WARS') == 1
+
+
+class TestParseMakeMKVLines:
+    """Tests for the PRGV/MSG line parsers"""
+
+    def test_prgv(self):
+        """Test progress lines parse to three ints"""
+        from app.ripper import _parse_prgv
+        assert _parse_prgv(b'PRGV:12,34,65536') == (12, 34, 65536)
+        assert _parse_prgv(b'PRGV:12,34') is None
+        assert _parse_prgv(b'PRGV:a,b,c') is None
+
+    def test_msg(self):
+        """Test the quoted message text is extracted"""
+        from app.ripper import _parse_msg
+        line = b'MSG:5014,0,2,"Saving 1 titles into directory file:///rips/x","Saving %1 titles into directory %2","1","file:///rips/x"'
+        assert _parse_msg(line) == 'Saving 1 titles into directory file:///rips/x'
+        assert _parse_msg(b'MSG:1005,0,1,""') == ''
+        assert _parse_msg(b'MSG:1005,0,1') is None
+        assert _parse_msg(b'MSG:1005,0,1,"unterminated') is None
+        assert _parse_msg(b'MSG:3025,0,1,"Title \xe9t\xe9"') == 'Title \ufffdt\ufffd'
+
+
+class TestPlaylistNumber:
+    """Tests for _playlist_number angle ordering key"""
+
+    def test_parses_leading_digits(self):
+        """Test zero-padded playlist names parse to their number"""
+        from app.ripper import _playlist_number
+        assert _playlist_number('00800.mpls') == 800
+
+    def test_missing_playlist_sorts_last(self):
+        """Test tracks without a playlist sort after numbered ones"""
+        from app.ripper import _playlist_number
+        assert _playlist_number('') > _playlist_number('99999.mpls')
+        assert _playlist_number(None) > _playlist_number('99999.mpls')
+
+
+class TestSetDefaultAudioTrack:
+    """Tests for default audio track selection"""
+
+    @patch('app.ripper.subprocess.run')
+    def test_sets_preferred_language_default(self, mock_run):
+        """Test the first matching audio track is flagged default"""
+        from app.ripper import set_default_audio_track
+
+        probe = MagicMock()
+        probe.returncode = 0
+        probe.stdout = '1,1,spa\n2,0,eng\n3,0\n'
+        propedit = MagicMock()
+        propedit.returncode = 0
+        mock_run.side_effect = [probe, propedit]
+
+        assert set_default_audio_track('/path/to/movie.mkv', 'eng') is True
+
+        cmd = mock_run.call_args_list[1].args[0]
+        assert cmd == ['mkvpropedit', '/path/to/movie.mkv',
+                       '--edit', 'track:a1', '--set', 'flag-default=0',
+                       '--edit', 'track:a2', '--set', 'flag-default=1']
+
+    @patch('app.ripper.subprocess.run')
+    def test_already_default_skips_mkvpropedit(self, mock_run):
+        """Test no rewrite when the preferred track is already the only default"""
+        from app.ripper import set_default_audio_track
+
+        probe = MagicMock()
+        probe.returncode = 0
+        probe.stdout = '1,1,eng\n2,0,spa\n'
+        mock_run.return_value = probe
+
+        assert set_default_audio_track('/path/to/movie.mkv', 'eng') is True
+        assert mock_run.call_count == 1
+
+    @patch('app.ripper.subprocess.run')
+    def test_no_matching_language(self, mock_run):
+        """Test untagged/other-language tracks are left alone"""
+        from app.ripper import set_default_audio_track
+
+        probe = MagicMock()
+        probe.returncode = 0
+        probe.stdout = '1,1,spa\n2,0\n'
+        mock_run.return_value = probe
+
+        assert set_default_audio_track('/path/to/movie.mkv', 'eng') is True
+        assert mock_run.call_count == 1
+
+
+class TestVideoDuration:
+    """Tests for _video_duration"""
+
+    @patch('app.ripper.subprocess.run')
+    @patch('app.ripper.read_mkv_duration', return_value=7200.5)
+    def test_mkv_header_skips_ffprobe(self, mock_header, mock_run):
+        """Test MKV durations come from the header without spawning ffprobe"""
+        from app.ripper import _video_duration
+        assert _video_duration('/rips/movie.mkv') == 7200.5
+        mock_run.assert_not_called()
+
+    @patch('app.ripper.subprocess.run')
+    @patch('app.ripper.read_mkv_duration', return_value=None)
+    def test_falls_back_to_ffprobe(self, mock_header, mock_run):
+        """Test headers without a Duration fall back to ffprobe"""
+        from app.ripper import _video_duration
+        mock_run.return_value = MagicMock(returncode=0, stdout='5400.0\n')
+        assert _video_duration('/rips/movie.mkv') == 5400.0
+
+        mock_run.return_value = MagicMock(returncode=0, stdout='N/A\n')
+        assert _video_duration('/rips/movie.mkv') == 0.0
+
+
 class TestCheckFileIntegrity:
     """Tests for spot-check file verification"""
 
@@ -654,7 +1813,7 @@ class TestCheckFileIntegrity:
 
         # Mock ffprobe for duration (first call)
         duration_result = MagicMock()
-        duration_result.stdout = '{"format": {"duration": "7200.0"}}'
+        duration_result.stdout = '7200.000000\n'
         duration_result.returncode = 0
 
         # Mock ffmpeg decode (subsequent calls)
@@ -670,6 +1829,24 @@ class TestCheckFileIntegrity:
         assert result['error_count'] == 0
         assert len(result['errors']) == 0
 
+    @patch('app.ripper.subprocess.run')
+    @patch('os.path.exists')
+    def test_unknown_duration_skips_spot_check(self, mock_exists, mock_run):
+        """Test an N/A duration is treated as too short to spot-check"""
+        from app.ripper import check_file_integrity
+
+        mock_exists.return_value = True
+
+        duration_result = MagicMock()
+        duration_result.stdout = 'N/A\n'
+        duration_result.returncode = 0
+        mock_run.return_value = duration_result
+
+        result = check_file_integrity('/path/to/movie.mkv')
+
+        assert result['valid'] is True
+        assert mock_run.call_count == 1
+
     @patch('os.path.exists')
     def test_returns_invalid_for_missing_file(self, mock_exists):
         """Test returns valid=False when file doesn't exist"""
@@ -692,7 +1869,7 @@ class TestCheckFileIntegrity:
 
         # Mock ffprobe
         duration_result = MagicMock()
-        duration_result.stdout = '{"format": {"duration": "7200.0"}}'
+        duration_result.stdout = '7200.000000\n'
         duration_result.returncode = 0
 
         # Mock ffmpeg with error
@@ -716,7 +1893,7 @@ class TestCheckFileIntegrity:
         mock_exists.return_value = True
 
         duration_result = MagicMock()
-        duration_result.stdout = '{"format": {"duration": "7200.0"}}'
+        duration_result.stdout = '7200.000000\n'
         duration_result.returncode = 0
 
         # Mock ffmpeg with only DTS timestamp warning (cosmetic)
@@ -741,7 +1918,7 @@ class TestCheckFileIntegrity:
         mock_exists.return_value = True
 
         duration_result = MagicMock()
-        duration_result.stdout = '{"format": {"duration": "7200.0"}}'
+        duration_result.stdout = '7200.000000\n'
         duration_result.returncode = 0
 
         # Timeout on second call
@@ -753,6 +1930,161 @@ class TestCheckFileIntegrity:
         assert 'timeout' in str(result).lower() or result['error_count'] > 0
 
 
+    @patch('app.ripper.subprocess.run')
+    @patch('os.path.exists')
+    def test_default_check_demuxes_only(self, mock_exists, mock_run):
+        """Test default spot-check copies packets instead of decoding"""
+        from app.ripper import check_file_integrity
+
+        mock_exists.return_value = True
+
+        duration_result = MagicMock()
+        duration_result.stdout = '7200.000000\n'
+        duration_result.returncode = 0
+
+        segment_result = MagicMock()
+        segment_result.stderr = ''
+        segment_result.returncode = 0
+
+        mock_run.side_effect = [duration_result] + [segment_result] * 10
+
+        check_file_integrity('/path/to/movie.mkv')
+
+        ffmpeg_cmd = mock_run.call_args_list[1].args[0]
+        assert ffmpeg_cmd[ffmpeg_cmd.index('-c') + 1] == 'copy'
+
+    @patch('app.ripper.subprocess.run')
+    @patch('os.path.exists')
+    def test_only_stderr_is_piped(self, mock_exists, mock_run):
+        """Test ffmpeg runs without stdin and with stdout discarded"""
+        import subprocess
+        from app.ripper import check_file_integrity
+
+        mock_exists.return_value = True
+
+        duration_result = MagicMock()
+        duration_result.stdout = '7200.000000\n'
+        duration_result.returncode = 0
+
+        segment_result = MagicMock()
+        segment_result.stderr = ''
+        segment_result.returncode = 0
+
+        mock_run.side_effect = [duration_result] + [segment_result] * 10
+
+        check_file_integrity('/path/to/movie.mkv')
+
+        ffmpeg_call = mock_run.call_args_list[1]
+        assert '-nostdin' in ffmpeg_call.args[0]
+        assert ffmpeg_call.kwargs['stdout'] == subprocess.DEVNULL
+        assert ffmpeg_call.kwargs['stderr'] == subprocess.PIPE
+
+    @patch('app.ripper.subprocess.run')
+    @patch('os.path.exists')
+    def test_deep_check_decodes(self, mock_exists, mock_run):
+        """Test deep=True decodes the segments"""
+        from app.ripper import check_file_integrity
+
+        mock_exists.return_value = True
+
+        duration_result = MagicMock()
+        duration_result.stdout = '7200.000000\n'
+        duration_result.returncode = 0
+
+        segment_result = MagicMock()
+        segment_result.stderr = ''
+        segment_result.returncode = 0
+
+        mock_run.side_effect = [duration_result] + [segment_result] * 10
+
+        check_file_integrity('/path/to/movie.mkv', deep=True)
+
+        ffmpeg_cmd = mock_run.call_args_list[1].args[0]
+        assert '-c' not in ffmpeg_cmd
+        # Auto decoder threads, as an input option
+        assert ffmpeg_cmd.index('-threads') < ffmpeg_cmd.index('-i')
+        assert ffmpeg_cmd[ffmpeg_cmd.index('-threads') + 1] == '0'
+
+    def test_integrity_options_from_config(self):
+        """Test deep check and thread count come from the ripping config"""
+        from app.ripper import integrity_options
+
+        assert integrity_options({}) == {'deep': False, 'threads': 0}
+        cfg = {'ripping': {'integrity_deep_check': True, 'integrity_threads': 1}}
+        assert integrity_options(cfg) == {'deep': True, 'threads': 1}
+
+
+class TestIntegrityMarker:
+    """Tests for the xattr-cached integrity result"""
+
+    @pytest.fixture
+    def xattrs(self):
+        """In-memory xattr store (tmpfs may not support user xattrs)"""
+        store = {}
+
+        def getxattr(path, name):
+            if (path, name) not in store:
+                raise OSError(61, 'No data available')
+            return store[(path, name)]
+
+        def setxattr(path, name, value):
+            store[(path, name)] = value
+
+        with patch('os.getxattr', side_effect=getxattr), patch('os.setxattr', side_effect=setxattr):
+            yield store
+
+    @pytest.fixture
+    def mkv(self, tmp_path):
+        path = tmp_path / 'movie.mkv'
+        path.write_bytes(b'x' * 1024)
+        return str(path)
+
+    @staticmethod
+    def _ffmpeg_ok(mock_run):
+        duration = MagicMock(stdout='7200.000000\n', returncode=0)
+        segment = MagicMock(stderr='', returncode=0)
+        mock_run.side_effect = [duration] + [segment] * 10
+
+    @patch('app.ripper.subprocess.run')
+    def test_unchanged_file_skips_ffmpeg(self, mock_run, xattrs, mkv):
+        """Test a second check of the same file reuses the stored result"""
+        from app.ripper import check_file_integrity
+        self._ffmpeg_ok(mock_run)
+
+        first = check_file_integrity(mkv)
+        second = check_file_integrity(mkv)
+
+        assert mock_run.call_count == 11
+        assert second == first == {'valid': True, 'errors': [], 'error_count': 0}
+
+    @patch('app.ripper.subprocess.run')
+    def test_modified_file_rechecked(self, mock_run, xattrs, mkv):
+        """Test a size change invalidates the stored result"""
+        from app.ripper import check_file_integrity
+        self._ffmpeg_ok(mock_run)
+        check_file_integrity(mkv)
+
+        with open(mkv, 'ab') as f:
+            f.write(b'more')
+        self._ffmpeg_ok(mock_run)
+        check_file_integrity(mkv)
+
+        assert mock_run.call_count == 22
+
+    @patch('app.ripper.subprocess.run')
+    def test_demux_result_does_not_satisfy_deep(self, mock_run, xattrs, mkv):
+        """Test a deep check isn't answered by a cached demux-only check"""
+        from app.ripper import check_file_integrity
+        self._ffmpeg_ok(mock_run)
+        check_file_integrity(mkv)
+
+        self._ffmpeg_ok(mock_run)
+        check_file_integrity(mkv, deep=True)
+        check_file_integrity(mkv)
+
+        assert mock_run.call_count == 22
+
+
 class TestBackupPhaseTracking:
     """Tests for backup mode phase tracking in RipJob"""
 
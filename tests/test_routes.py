@@ -158,6 +158,30 @@ class TestAPISettings:
         data = json.loads(response.data)
         assert data['success'] is True
 
+    @patch('app.routes.config.save_config')
+    @patch('app.routes.config.load_config')
+    def test_post_settings_clears_identify_cache(self, mock_load, mock_save, client):
+        """Test saving settings drops cached identify() results"""
+        from app import identify_cache
+        mock_load.return_value = {'test': 'config'}
+        identify_cache.put('THE_MATRIX', 8160, {'title': 'The Matrix'})
+
+        client.post('/api/settings', data=json.dumps({'test': 'updated'}), content_type='application/json')
+
+        assert identify_cache.get('THE_MATRIX', 8160) is None
+
+    @patch('app.routes.config.save_config')
+    @patch('app.routes.config.load_config')
+    def test_post_settings_clears_library_fetch_cache(self, mock_load, mock_save, client):
+        """Test saving settings drops the cached Radarr/Sonarr library lists used by exports"""
+        from app import library_export
+        mock_load.return_value = {'test': 'config'}
+        library_export._fetch_cache[('radarr', 'http://old:7878')] = (0.0, [{'title': 'Old'}])
+
+        client.post('/api/settings', data=json.dumps({'test': 'updated'}), content_type='application/json')
+
+        assert not library_export._fetch_cache
+
 
 class TestAPIVersion:
     """Tests for the /api/version endpoint"""
@@ -190,6 +214,23 @@ class TestAPIRipStatus:
         # Should return status (either idle or current job status)
         assert 'status' in data or 'id' in data
 
+    @patch('app.routes.ripper.get_engine')
+    def test_rip_status_active_job(self, mock_engine, client):
+        """Test an active job's status serializes, int-keyed episode maps included"""
+        from app.ripper import RipJob, RipStatus
+        job = RipJob(id='job-1', status=RipStatus.RIPPING, tracks_to_rip=[2, 3],
+                     episode_mapping={2: {'episode_number': 1}})
+        mock_engine.return_value.get_status.return_value = job.to_dict()
+
+        response = client.get('/api/rip/status')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        data = json.loads(response.data)
+        assert data['status'] == 'ripping'
+        assert data['total_tracks'] == 2
+        assert data['episode_mapping'] == {'2': {'episode_number': 1}}
+
 
 class TestAPIRipReset:
     """Tests for the /api/rip/reset endpoint"""